@@ -0,0 +1,121 @@
+"""Benchmark of decoding the optimized Forge mod data (the ``d`` field of ``forgeData``).
+
+Run with ``python benchmarks/forge_data.py``. It encodes mod lists of growing size the
+same way Forge does, and then decodes them with :meth:`mcstatus.forge_data.ForgeData._decode_optimized`
+and with the previous decoder (kept below for reference), checking that both give the same output.
+"""
+
+from __future__ import annotations
+
+import argparse
+from io import StringIO
+from time import perf_counter
+
+from mcstatus.forge_data import ForgeData
+from mcstatus.protocol.connection import BaseConnection, BaseReadSync, Connection
+
+
+class ReferenceStringBuffer(BaseReadSync, BaseConnection):
+    """The previous decoder, reading the string one character (and one byte) at a time."""
+
+    __slots__ = ("received", "stringio")
+
+    def __init__(self, stringio: StringIO) -> None:
+        self.stringio = stringio
+        self.received = bytearray()
+
+    def read(self, length: int) -> bytearray:
+        data = bytearray()
+        while self.received and len(data) < length:
+            data.append(self.received.pop(0))
+        while len(data) < length:
+            result = self.stringio.read(1)
+            if not result:
+                raise IOError(f"Not enough data to read! {len(data)} < {length}")
+            data.extend(result.encode("utf-16be"))
+        while len(data) > length:
+            self.received.append(data.pop())
+        return data
+
+    def remaining(self) -> int:
+        return len(self.stringio.getvalue()) - self.stringio.tell() + len(self.received)
+
+    def read_optimized_buffer(self) -> Connection:
+        size = self.read_short() | (self.read_short() << 15)
+
+        buffer = Connection()
+        value, bits = 0, 0
+        while buffer.remaining() < size:
+            if bits < 8 and self.remaining():
+                value |= (self.read_short() & 0x7FFF) << bits
+                bits += 15
+            buffer.receive((value & 0xFF).to_bytes(1, "big"))
+            value >>= 8
+            bits -= 8
+
+        return buffer
+
+
+def reference_decode(string: str) -> Connection:
+    with StringIO(string) as text:
+        return ReferenceStringBuffer(text).read_optimized_buffer()
+
+
+def encode_optimized(data: bytes) -> str:
+    """Encode ``data`` into a string, like ``ServerStatusPing.encodeOptimized`` of Forge."""
+    chars = [chr(len(data) & 0x7FFF), chr(len(data) >> 15)]
+    value, bits = 0, 0
+    for byte in data:
+        value |= byte << bits
+        bits += 8
+        while bits >= 15:
+            chars.append(chr(value & 0x7FFF))
+            value >>= 15
+            bits -= 15
+    if bits > 0:
+        chars.append(chr(value & 0x7FFF))
+    return "".join(chars)
+
+
+def mod_data(mods: int) -> str:
+    """The ``d`` field of a server with ``mods`` mods, each with two channels."""
+    buffer = Connection()
+    buffer.write_bool(False)  # truncated
+    buffer.write_ushort(mods)
+    for i in range(mods):
+        buffer.write_varint(2 << 1)  # 2 channels, not server only
+        buffer.write_utf(f"modpack_mod_{i}")
+        buffer.write_utf(f"1.20.1-{i}.2.3")
+        for channel in ("main", "sync"):
+            buffer.write_utf(channel)
+            buffer.write_utf("1.0.0")
+            buffer.write_bool(True)
+    buffer.write_varint(0)  # non-mod channels
+    return encode_optimized(bytes(buffer.flush()))
+
+
+def bench(decode, string: str, repeat: int) -> float:  # noqa: ANN001
+    """Return the average time in milliseconds of decoding ``string``."""
+    start = perf_counter()
+    for _ in range(repeat):
+        decode(string)
+    return (perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="How many times to decode each mod list")
+    args = parser.parse_args()
+
+    print(f"{'mods':>6} {'size':>8} {'previous':>12} {'current':>12} {'speedup':>8}")
+    for mods in (10, 100, 500, 2000):
+        string = mod_data(mods)
+        assert reference_decode(string).received == ForgeData._decode_optimized(string).received
+
+        previous = bench(reference_decode, string, args.repeat)
+        current = bench(ForgeData._decode_optimized, string, args.repeat)
+        print(f"{mods:>6} {len(string) * 2 / 1024:>6.0f}KB {previous:>10.2f}ms {current:>10.2f}ms {previous / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
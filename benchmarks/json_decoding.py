@@ -0,0 +1,114 @@
+"""Benchmark of the JSON decoders for status responses (see :data:`mcstatus.pinger.json_decoder`).
+
+Run with ``python benchmarks/json_decoding.py``. It decodes status payloads of a vanilla
+server and of modpacks of growing size, straight from a received frame, with the standard
+library (the old ``read_utf()`` + ``json.loads()`` path, and the new one) and with ``orjson``
+and ``msgspec`` if they're installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any
+
+from mcstatus.pinger import _stdlib_json_decoder
+from mcstatus.protocol.connection import Connection
+
+FAVICON = "data:image/png;base64," + "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAAAXNSR0IArs4c6QAA" * 80
+
+
+def status_payload(mods: int) -> dict[str, Any]:
+    """A status payload like the ones of real servers, with ``mods`` mods (and as many channels)."""
+    payload: dict[str, Any] = {
+        "description": {
+            "text": "",
+            "extra": [
+                {"text": "Some ", "color": "gold", "bold": True},
+                {"text": "Minecraft ", "color": "aqua"},
+                {"text": "Server\n", "color": "white", "italic": True},
+                {"text": "Welcome, have fun!", "color": "gray"},
+            ],
+        },
+        "players": {
+            "max": 200,
+            "online": 64,
+            "sample": [{"name": f"player{i}", "id": f"{i:08x}-0000-4000-8000-000000000000"} for i in range(12)],
+        },
+        "version": {"name": "1.20.1", "protocol": 763},
+        "favicon": FAVICON,
+        "enforcesSecureChat": True,
+    }
+    if mods:
+        payload["forgeData"] = {
+            "fmlNetworkVersion": 2,
+            "channels": [{"res": f"modpack_mod_{i}:network", "version": "1.0.0", "required": True} for i in range(mods)],
+            "mods": [{"modId": f"modpack_mod_{i}", "modmarker": f"1.20.1-{i}.2.3"} for i in range(mods)],
+        }
+    return payload
+
+
+def frame(payload: dict[str, Any]) -> bytes:
+    """Encode the payload the same way as a server sends it (without the outer length prefix)."""
+    packet = Connection()
+    packet.write_varint(0)
+    packet.write_utf(json.dumps(payload, ensure_ascii=False))
+    return bytes(packet.flush())
+
+
+def decoders() -> dict[str, Callable[[Connection], Any]]:
+    def old_stdlib(response: Connection) -> Any:  # noqa: ANN401
+        return json.loads(response.read_utf())
+
+    def view_decoder(decoder: Callable[[memoryview], Any]) -> Callable[[Connection], Any]:
+        def decode(response: Connection) -> Any:  # noqa: ANN401
+            with response.read_utf_view() as data:
+                return decoder(data)
+
+        return decode
+
+    result = {"read_utf + json.loads": old_stdlib, "stdlib": view_decoder(_stdlib_json_decoder)}
+    try:
+        import orjson  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        print("orjson isn't installed, skipping it")
+    else:
+        result["orjson"] = view_decoder(orjson.loads)
+    try:
+        import msgspec  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        print("msgspec isn't installed, skipping it")
+    else:
+        result["msgspec"] = view_decoder(msgspec.json.decode)
+    return result
+
+
+def bench(decode: Callable[[Connection], Any], data: bytes, repeat: int) -> float:
+    """Return the average time in microseconds of decoding ``data``."""
+    start = perf_counter()
+    for _ in range(repeat):
+        response = Connection()
+        response.receive(data)
+        response.read_varint()
+        decode(response)
+    return (perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200, help="How many times to decode each payload")
+    args = parser.parse_args()
+
+    available = decoders()
+    print(f"{'payload':>18} {'size':>10} " + " ".join(f"{name:>22}" for name in available))
+    for mods in (0, 100, 500, 2000):
+        data = frame(status_payload(mods))
+        times = [bench(decode, data, args.repeat) for decode in available.values()]
+        name = f"{mods} mods" if mods else "vanilla"
+        print(f"{name:>18} {len(data) / 1024:>8.0f}KB " + " ".join(f"{time:>20.0f}us" for time in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark of simplifying MOTDs (see :meth:`mcstatus.motd.Motd.simplify`).
+
+Run with ``python benchmarks/motd_simplify.py``. It simplifies gradient MOTDs (with one
+color per character, like the ones made by MOTD generators) of growing length, with
+:func:`mcstatus.motd.simplifies.simplify` and with the previous implementation (kept below
+for reference), checking that both give the same output.
+"""
+
+from __future__ import annotations
+
+import argparse
+import colorsys
+from collections.abc import Callable, Sequence
+from time import perf_counter
+from typing import Any, TYPE_CHECKING
+
+from mcstatus.motd import Motd
+from mcstatus.motd.components import ParsedMotdComponent
+from mcstatus.motd.simplifies import get_unused_elements, simplify
+
+if TYPE_CHECKING:
+    from mcstatus.responses import RawJavaResponseMotdWhenDict
+
+
+def reference_simplify(parsed: Sequence[ParsedMotdComponent]) -> list[ParsedMotdComponent]:
+    """The previous implementation, running the simplifiers one by one until nothing changes."""
+    parsed = list(parsed)
+    old_parsed: list[ParsedMotdComponent] | None = None
+
+    while parsed != old_parsed:
+        old_parsed = parsed.copy()
+        unused_elements = get_unused_elements(parsed)
+        parsed = [el for index, el in enumerate(parsed) if index not in unused_elements]
+
+    # the previous squash_nearby_strings, popping the squashed strings one by one (in the order of a set, which
+    # could remove wrong items, but not in these MOTDs, where every string is followed by a color)
+    fillers: set[int] = set()
+    for index, item in enumerate(parsed):
+        if not isinstance(item, str):
+            continue
+        try:
+            next_item = parsed[index + 1]
+        except IndexError:
+            break
+        if isinstance(next_item, str):
+            parsed[index + 1] = item + next_item
+            fillers.add(index)
+    for already_removed, index_to_remove in enumerate(fillers):
+        parsed.pop(index_to_remove - already_removed)
+
+    return parsed
+
+
+def gradient_motd(length: int) -> RawJavaResponseMotdWhenDict:
+    """A MOTD with a rainbow gradient over ``length`` characters, bold in the middle."""
+    extra: list[RawJavaResponseMotdWhenDict | str] = []
+    for i in range(length):
+        red, green, blue = colorsys.hsv_to_rgb(i / length, 1, 1)
+        component: RawJavaResponseMotdWhenDict = {
+            "text": "MCSTATUS"[i % 8],
+            "color": f"#{int(red * 255):02x}{int(green * 255):02x}{int(blue * 255):02x}",
+        }
+        if length // 3 <= i < length * 2 // 3:
+            component["bold"] = True
+        extra.append(component)
+    return {"text": "", "extra": extra}
+
+
+def bench(simplify: Callable[[Sequence[ParsedMotdComponent]], Any], parsed: list[ParsedMotdComponent], repeat: int) -> float:
+    """Return the average time in microseconds of simplifying ``parsed``."""
+    start = perf_counter()
+    for _ in range(repeat):
+        simplify(parsed)
+    return (perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50, help="How many times to simplify each MOTD")
+    args = parser.parse_args()
+
+    print(f"{'characters':>10} {'components':>10} {'previous':>12} {'current':>12} {'speedup':>8}")
+    for length in (16, 64, 256, 1024, 4096):
+        parsed = Motd.parse(gradient_motd(length)).parsed
+        assert reference_simplify(parsed) == simplify(parsed)
+
+        previous = bench(reference_simplify, parsed, args.repeat)
+        current = bench(simplify, parsed, args.repeat)
+        print(f"{length:>10} {len(parsed):>10} {previous:>10.0f}us {current:>10.0f}us {previous / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark of :class:`mcstatus.bulk.ShardedScanner` throughput against local fake servers.
+
+Run with ``python benchmarks/sharded_scanner.py``. It starts a few fake Java servers
+(each in its own process, so they don't become the bottleneck), and then scans them
+with an increasing amount of worker processes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+from time import perf_counter, sleep
+
+from mcstatus.bulk import ShardedScanner
+from mcstatus.protocol.connection import Connection
+
+# A modded-like status, so parsing has a realistic cost
+STATUS = {
+    "description": {"text": "", "extra": [{"text": "A Minecraft Server ", "color": "gold", "bold": True}] * 10},
+    "players": {
+        "max": 100,
+        "online": 12,
+        "sample": [{"name": f"player{i}", "id": "00000000-0000-0000-0000-000000000000"} for i in range(12)],
+    },
+    "version": {"name": "1.20.1", "protocol": 763},
+    "forgeData": {
+        "fmlNetworkVersion": 3,
+        "channels": [{"res": f"mod{i}:main", "version": "1", "required": True} for i in range(100)],
+        "mods": [{"modId": f"mod{i}", "modmarker": "1.0.0"} for i in range(100)],
+    },
+}
+
+
+def _status_frame() -> bytes:
+    packet = Connection()
+    packet.write_varint(0)
+    packet.write_utf(json.dumps(STATUS))
+    frame = Connection()
+    frame.write_buffer(packet)
+    return bytes(frame.flush())
+
+
+def _serve(port: int) -> None:
+    response = _status_frame()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        received = b""
+        while not received.endswith(b"\x01\x00"):  # status request
+            data = await reader.read(1024)
+            if not data:
+                break
+            received += data
+        writer.write(response)
+        await writer.drain()
+        writer.close()
+
+    async def main() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", port, backlog=4096)
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def _wait_until_listening(port: int) -> None:
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+        except OSError:
+            sleep(0.05)
+        else:
+            return
+    raise RuntimeError(f"Fake server on port {port} didn't start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--targets", type=int, default=5000, help="how many servers to scan in each run")
+    parser.add_argument("--servers", type=int, default=os.cpu_count() or 1, help="how many fake servers to start")
+    parser.add_argument("--base-port", type=int, default=35565, help="port of the first fake server")
+    args = parser.parse_args()
+
+    servers = [multiprocessing.Process(target=_serve, args=(args.base_port + i,), daemon=True) for i in range(args.servers)]
+    for server in servers:
+        server.start()
+    for i in range(args.servers):
+        _wait_until_listening(args.base_port + i)
+
+    addresses = [f"127.0.0.1:{args.base_port + i % args.servers}" for i in range(args.targets)]
+    processes = 1
+    try:
+        while processes <= (os.cpu_count() or 1):
+            start = perf_counter()
+            with ShardedScanner(addresses, processes=processes, concurrency=64) as scanner:
+                failed = sum(isinstance(result, Exception) for _, result in scanner)
+            elapsed = perf_counter() - start
+            print(f"{processes:>3} processes: {args.targets / elapsed:10.0f} servers/s ({failed} failed)")
+            processes *= 2
+    finally:
+        for server in servers:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
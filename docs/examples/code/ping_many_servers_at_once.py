@@ -1,27 +1,15 @@
 import asyncio
 
-from mcstatus import JavaServer
-
-
-async def ping_server(ip: str) -> None:
-    try:
-        status = await (await JavaServer.async_lookup(ip)).async_status()
-    except Exception:
-        return
-
-    print(f"{ip} - {status.latency}ms")  # handle somehow responses here
+from mcstatus.bulk import status_many
 
 
 async def ping_ips(ips: list[str]) -> None:
-    to_process: list[str] = []
-
-    for ip in ips:
-        if len(to_process) <= 10:  # 10 means here how many servers will be pinged at once
-            to_process.append(ip)
+    # 10 means here how many servers will be pinged at once
+    async for ip, status in status_many(ips, concurrency=10):
+        if isinstance(status, Exception):
             continue
 
-        await asyncio.wait({asyncio.create_task(ping_server(ip_to_ping)) for ip_to_ping in to_process})
-        to_process = []
+        print(f"{ip} - {status.latency}ms")  # handle somehow responses here
 
 
 def main() -> None:
@@ -52,14 +52,13 @@ def _ping_with_fallback(server: SupportedServers) -> float:
     if isinstance(server, BedrockServer):
         return server.status().latency
 
-    # try faster ping packet first, falling back to status with a warning.
-    ping_exc = None
-    try:
-        return server.ping(tries=1)
-    except Exception as e:
-        ping_exc = e
+    # status and ping over a single connection, falling back to the status latency with a warning.
+    status, ping = server._status_and_try_ping()
+    if not isinstance(ping, Exception):
+        return ping
+    ping_exc = ping
 
-    latency = server.status().latency
+    latency = status.latency
 
     address = f"{server.address.host}:{server.address.port}"
     print(
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+import errno
 import ipaddress
+import selectors
+import socket
 import sys
+import threading
+import time
 import warnings
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from pathlib import Path
-from typing import NamedTuple, TYPE_CHECKING
+from typing import Final, NamedTuple, TYPE_CHECKING
 from urllib.parse import urlparse
 
+import dns.exception
 import dns.resolver
+from dns.rdatatype import RdataType
 
 import mcstatus.dns
 
@@ -15,7 +27,13 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
 
-__all__ = ("Address", "async_minecraft_srv_address_lookup", "minecraft_srv_address_lookup")
+__all__ = (
+    "Address",
+    "async_fastest_address_lookup",
+    "async_minecraft_srv_address_lookup",
+    "fastest_address_lookup",
+    "minecraft_srv_address_lookup",
+)
 
 
 def _valid_urlparse(address: str) -> tuple[str, int | None]:
@@ -33,6 +51,13 @@ def _valid_urlparse(address: str) -> tuple[str, int | None]:
     return tmp.hostname, tmp.port
 
 
+def _missing_port_error(address: str) -> ValueError:
+    return ValueError(
+        f"Given address '{address}' doesn't contain port, doesn't have an SRV record pointing to a port,"
+        " and default_port wasn't specified, can't parse."
+    )
+
+
 class _AddressBase(NamedTuple):
     """Intermediate NamedTuple class representing an address.
 
@@ -63,6 +88,8 @@ class Address(_AddressBase):
         super().__init__()
 
         self._cached_ip: ipaddress.IPv4Address | ipaddress.IPv6Address | None = None
+        # All of the IPs of the host, in the order to connect to them, if they were resolved along with the address
+        self._cached_ips: list[ipaddress.IPv4Address | ipaddress.IPv6Address] = []
 
         # Make sure the address is valid
         self._ensure_validity(self.host, self.port)
@@ -112,7 +139,7 @@ class Address(_AddressBase):
         return cls(host=hostname, port=port)
 
     def resolve_ip(self, lifetime: float | None = None) -> ipaddress.IPv4Address | ipaddress.IPv6Address:
-        """Resolves a hostname's A record into an IP address.
+        """Resolves a hostname's A record (or AAAA record, if it has no A record) into an IP address.
 
         If the host is already an IP, this resolving is skipped
         and host is returned directly.
@@ -142,8 +169,11 @@ class Address(_AddressBase):
         except ValueError:
             # ValueError is raised if the given address wasn't valid
             # this means it's a hostname and we should try to resolve
-            # the A record
-            ip_addr = mcstatus.dns.resolve_a_record(self.host, lifetime=lifetime)
+            # the A record (or the AAAA record, for IPv6 only hosts)
+            try:
+                ip_addr = mcstatus.dns.resolve_a_record(self.host, lifetime=lifetime)
+            except dns.resolver.NoAnswer:
+                ip_addr = mcstatus.dns.resolve_aaaa_records(self.host, lifetime=lifetime)[0]
             ip = ipaddress.ip_address(ip_addr)
 
         self._cached_ip = ip
@@ -173,8 +203,11 @@ class Address(_AddressBase):
         except ValueError:
             # ValueError is raised if the given address wasn't valid
             # this means it's a hostname and we should try to resolve
-            # the A record
-            ip_addr = await mcstatus.dns.async_resolve_a_record(self.host, lifetime=lifetime)
+            # the A record (or the AAAA record, for IPv6 only hosts)
+            try:
+                ip_addr = await mcstatus.dns.async_resolve_a_record(self.host, lifetime=lifetime)
+            except dns.resolver.NoAnswer:
+                ip_addr = (await mcstatus.dns.async_resolve_aaaa_records(self.host, lifetime=lifetime))[0]
             ip = ipaddress.ip_address(ip_addr)
 
         self._cached_ip = ip
@@ -220,22 +253,35 @@ def minecraft_srv_address_lookup(
         host, port = mcstatus.dns.resolve_mc_srv(host, lifetime=lifetime)
     except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
         if default_port is None:
-            raise ValueError(
-                f"Given address '{address}' doesn't contain port, doesn't have an SRV record pointing to a port,"
-                " and default_port wasn't specified, can't parse."
-            )
+            raise _missing_port_error(address)
         port = default_port
 
     return Address(host, port)
 
 
+async def _async_try_resolve_ips(host: str, lifetime: float | None) -> list[ipaddress.IPv4Address | ipaddress.IPv6Address]:
+    """Resolve the IPv6 and IPv4 addresses of the host (see :func:`._async_resolve_ips`), or return none if that fails."""
+    try:
+        ips, _ = await _async_resolve_ips(host, lifetime)
+        return [ipaddress.ip_address(ip) for ip in ips]
+    except (dns.exception.DNSException, ValueError):
+        return []
+
+
 async def async_minecraft_srv_address_lookup(
     address: str,
     *,
     default_port: int | None = None,
     lifetime: float | None = None,
 ) -> Address:
-    """Just an async alternative to :func:`.minecraft_srv_address_lookup`, check it for more details."""
+    """Just an async alternative to :func:`.minecraft_srv_address_lookup`, check it for more details.
+
+    Unlike the synchronous version, this also resolves the IP addresses of the returned
+    :class:`Address` (if possible), so neither :meth:`Address.async_resolve_ip`, nor the
+    connections to the address need to query the DNS anymore. The AAAA and A records of the
+    host itself are resolved at the same time as the SRV record, so if there's no SRV record,
+    it costs no additional round trip.
+    """
     host, port = _valid_urlparse(address)
 
     # If we found a port in the address, there's nothing more we need
@@ -244,15 +290,494 @@ async def async_minecraft_srv_address_lookup(
 
     # Otherwise, try to check for an SRV record, pointing us to the
     # port which we should use. If there's no such record, fall back
-    # to the default_port (if it's defined).
+    # to the default_port (if it's defined). Meanwhile, speculatively resolve
+    # the host itself, since that's what we connect to without an SRV record.
+    speculative_ips = asyncio.ensure_future(_async_try_resolve_ips(host, lifetime))
     try:
-        host, port = await mcstatus.dns.async_resolve_mc_srv(host, lifetime=lifetime)
-    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
-        if default_port is None:
-            raise ValueError(
-                f"Given address '{address}' doesn't contain port, doesn't have an SRV record pointing to a port,"
-                " and default_port wasn't specified, can't parse."
+        try:
+            srv_host, port = await mcstatus.dns.async_resolve_mc_srv(host, lifetime=lifetime)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            if default_port is None:
+                raise _missing_port_error(address)
+            port = default_port
+            ips = await speculative_ips
+        else:
+            if srv_host == host:
+                ips = await speculative_ips
+            else:
+                speculative_ips.cancel()
+                host = srv_host
+                ips = await _async_try_resolve_ips(host, lifetime)
+    finally:
+        speculative_ips.cancel()
+
+    result = Address(host, port)
+    result._cached_ips = ips
+    # Same as with resolve_ip, the IPv4 address is preferred
+    result._cached_ip = next((ip for ip in ips if ip.version == 4), ips[0] if ips else None)
+    return result
+
+
+class EndpointCache:
+    """Cache of the endpoints picked by :func:`fastest_address_lookup`, for the addresses they were picked for.
+
+    Once an endpoint wins the race, it's used for the same address until the DNS records it was
+    picked from expire (but for ``ttl`` seconds at most), so the servers polled over and over again
+    don't get a burst of connections every time. The least recently used endpoints are evicted
+    when the cache is full.
+
+    The shared instance is available as :data:`mcstatus.address.cache`. Setting its
+    ``max_size`` to ``0`` disables the caching.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300) -> None:
+        """
+        :param max_size: How many endpoints to keep at most.
+        :param ttl: The longest time in seconds to keep using an endpoint for.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        """How many lookups were answered from the cache."""
+        self.misses = 0
+        """How many lookups had to race the endpoints."""
+
+        self._entries: OrderedDict[tuple[str, int | None], tuple[float, Address]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, address: str, default_port: int | None) -> Address | None:
+        """Get the endpoint picked for the address, or :obj:`None` if there is no (unexpired) one."""
+        key = (address, default_port)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, address: str, default_port: int | None, endpoint: Address, ttl: float | None = None) -> None:
+        """Remember the endpoint picked for the address.
+
+        :param ttl: How long in seconds the endpoint is valid for (the TTL of its DNS records), capped by :attr:`.ttl`.
+        """
+        key = (address, default_port)
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            if self.max_size <= 0:
+                return
+            self._entries[key] = (time.monotonic() + ttl, endpoint)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all of the cached endpoints and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+cache: Final = EndpointCache()
+"""The :class:`EndpointCache` instance used by :func:`fastest_address_lookup`."""
+
+
+def _endpoints(host: str, port: int, ips: list[str]) -> list[Address]:
+    """Make the endpoints of the host, one for each of its IPs."""
+    endpoints = []
+    for ip in ips:
+        endpoint = Address(host, port)
+        endpoint._cached_ip = ipaddress.ip_address(ip)
+        endpoints.append(endpoint)
+    return endpoints
+
+
+def _race(endpoint_groups: list[list[Address]], timeout: float) -> Address:
+    """Pick the endpoint which connects the fastest, trying the groups one by one until any of them connects.
+
+    The winning connection is closed too, the requests open their own connections to the endpoint.
+    """
+    error: OSError | None = None
+    for group in endpoint_groups:
+        if not group:
+            continue
+        try:
+            sock, index = _connect_fastest([(str(endpoint._cached_ip), endpoint.port) for endpoint in group], timeout)
+        except OSError as exc:
+            error = exc
+            continue
+        sock.close()
+        return group[index]
+    raise error if error is not None else OSError("None of the endpoints could be resolved")
+
+
+async def _async_race(endpoint_groups: list[list[Address]], timeout: float) -> Address:
+    """Asynchronous alternative to :func:`._race`."""
+    error: OSError | None = None
+    for group in endpoint_groups:
+        if not group:
+            continue
+        try:
+            _, writer, index = await _async_connect_fastest(
+                [(str(endpoint._cached_ip), endpoint.port) for endpoint in group], timeout
             )
-        port = default_port
+        except OSError as exc:
+            error = exc
+            continue
+        writer.close()
+        return group[index]
+    raise error if error is not None else OSError("None of the endpoints could be resolved")
 
-    return Address(host, port)
+
+def fastest_address_lookup(
+    address: str,
+    *,
+    default_port: int | None = None,
+    lifetime: float | None = None,
+    timeout: float = 3,
+) -> Address:
+    """Lookup the address like :func:`.minecraft_srv_address_lookup`, picking the fastest of all of its endpoints.
+
+    Big networks publish many targets in their SRV record, and many A records for each of them.
+    Instead of using just the first one, this connects to all of them at once, and picks the one
+    which connected first. The targets with the lowest SRV priority are tried first (in the order
+    of :func:`mcstatus.dns.order_srv_targets`), the others only if none of those connects.
+
+    All of the raced connections are closed, including the winning one, so the first request to the
+    picked endpoint still has to connect again. The race pays off for the later requests, as the picked
+    endpoint is remembered in :data:`cache`, until the DNS records it was picked from expire.
+
+    :param address: The same address which would be used in minecraft's server address field.
+    :param default_port: The port to use, if the address has no port and no SRV record.
+    :param lifetime: How many seconds a DNS query should run before timing out.
+    :param timeout: How many seconds to wait for the connections.
+    :return: The picked endpoint, with its IP address resolved.
+    :raises ValueError: Same as :func:`.minecraft_srv_address_lookup`.
+    :raises dns.exception.DNSException: If the SRV query fails for other reasons than the record not existing.
+    :raises OSError: If none of the endpoints could be resolved or connected to.
+    """
+    if (endpoint := cache.get(address, default_port)) is not None:
+        return endpoint
+
+    host, port = _valid_urlparse(address)
+    targets: list[list[tuple[str, int]]]
+    # When each of the DNS answers used expires, if known
+    expirations: list[float | None] = []
+    if port is not None:
+        targets = [[(host, port)]]
+    else:
+        try:
+            srv_targets, srv_expiration = mcstatus.dns._resolve_srv_targets("_minecraft._tcp." + host, lifetime)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            if default_port is None:
+                raise _missing_port_error(address)
+            targets = [[(host, default_port)]]
+        else:
+            targets = [[(target.host, target.port) for target in group] for _, group in groupby(srv_targets, _priority)]
+            expirations.append(srv_expiration)
+
+    endpoint_groups: list[list[Address]] = []
+    for group in targets:
+        endpoint_groups.append([])
+        for target_host, target_port in group:
+            endpoints, expiration = _resolve_endpoints(target_host, target_port, lifetime)
+            endpoint_groups[-1].extend(endpoints)
+            expirations.append(expiration)
+    endpoint = _race(endpoint_groups, timeout)
+    cache.put(address, default_port, endpoint, _ttl(expirations))
+    return endpoint
+
+
+async def async_fastest_address_lookup(
+    address: str,
+    *,
+    default_port: int | None = None,
+    lifetime: float | None = None,
+    timeout: float = 3,
+) -> Address:
+    """Asynchronous alternative to :func:`.fastest_address_lookup`, check it for more details.
+
+    All of the targets are resolved at once.
+    """
+    if (endpoint := cache.get(address, default_port)) is not None:
+        return endpoint
+
+    host, port = _valid_urlparse(address)
+    targets: list[list[tuple[str, int]]]
+    # When each of the DNS answers used expires, if known
+    expirations: list[float | None] = []
+    if port is not None:
+        targets = [[(host, port)]]
+    else:
+        try:
+            srv_targets, srv_expiration = await mcstatus.dns._async_resolve_srv_targets("_minecraft._tcp." + host, lifetime)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            if default_port is None:
+                raise _missing_port_error(address)
+            targets = [[(host, default_port)]]
+        else:
+            targets = [[(target.host, target.port) for target in group] for _, group in groupby(srv_targets, _priority)]
+            expirations.append(srv_expiration)
+
+    resolved = await asyncio.gather(
+        *(
+            _async_resolve_endpoints(target_host, target_port, lifetime)
+            for group in targets
+            for target_host, target_port in group
+        )
+    )
+    expirations.extend(expiration for _, expiration in resolved)
+    endpoint_groups: list[list[Address]] = []
+    for group in targets:
+        endpoint_groups.append([endpoint for endpoints, _ in resolved[: len(group)] for endpoint in endpoints])
+        resolved = resolved[len(group) :]
+    endpoint = await _async_race(endpoint_groups, timeout)
+    cache.put(address, default_port, endpoint, _ttl(expirations))
+    return endpoint
+
+
+def _priority(target: mcstatus.dns.SRVTarget) -> int:
+    return target.priority
+
+
+def _ttl(expirations: list[float | None]) -> float | None:
+    """Get the time in seconds until the first of the DNS answers expires, :obj:`None` if none of them is known."""
+    expiration = _first_expiration(*expirations)
+    return None if expiration is None else expiration - time.time()
+
+
+def _resolve_endpoints(host: str, port: int, lifetime: float | None) -> tuple[list[Address], float | None]:
+    """Resolve all of the endpoints of the host (none if it can't be resolved), and when they expire (if known)."""
+    try:
+        ips, expiration = _resolve_ips(host, lifetime)
+        return _endpoints(host, port, ips), expiration
+    except (dns.exception.DNSException, ValueError):
+        return [], None
+
+
+async def _async_resolve_endpoints(host: str, port: int, lifetime: float | None) -> tuple[list[Address], float | None]:
+    """Asynchronous alternative to :func:`._resolve_endpoints`."""
+    try:
+        ips, expiration = await _async_resolve_ips(host, lifetime)
+        return _endpoints(host, port, ips), expiration
+    except (dns.exception.DNSException, ValueError):
+        return [], None
+
+
+def _interleave_families(ipv6: list[str], ipv4: list[str]) -> list[str]:
+    """Order the IPs of a host to connect to, alternating between IPv6 and IPv4 (starting with IPv6), like :rfc:`8305`."""
+    ordered = [ip for pair in zip(ipv6, ipv4) for ip in pair]
+    shorter = min(len(ipv6), len(ipv4))
+    return ordered + ipv6[shorter:] + ipv4[shorter:]
+
+
+# Threads running the blocking DNS queries, which have to run at the same time as others.
+# They are only started once needed, and joined when the interpreter exits, like any other executor.
+_resolver_threads: ThreadPoolExecutor | None = None
+_resolver_threads_lock: Final = threading.Lock()
+
+
+def _get_resolver_threads() -> ThreadPoolExecutor:
+    """Get the :data:`_resolver_threads`, creating them on the first use."""
+    global _resolver_threads
+    with _resolver_threads_lock:
+        if _resolver_threads is None:
+            _resolver_threads = ThreadPoolExecutor(thread_name_prefix="mcstatus-resolver")
+        return _resolver_threads
+
+
+def _resolve_ips(host: str, lifetime: float | None = None) -> tuple[list[str], float | None]:
+    """Resolve all of the IPv6 and IPv4 addresses of the host, in the order to connect to them.
+
+    If the host is already an IP, it's returned directly.
+
+    The AAAA records are queried in another thread, at the same time as the A records,
+    so this takes as long as the slower of the two queries, not both of them.
+
+    :return: The IPs, and when (in :func:`time.time`) the first of their DNS answers expires, if known.
+    :raises dns.exception.DNSException: If neither the AAAA, nor the A records could be resolved (the error of the A query).
+    """
+    try:
+        return [str(ipaddress.ip_address(host))], None
+    except ValueError:
+        pass
+
+    ipv6_answer = _get_resolver_threads().submit(mcstatus.dns._resolve_addresses, host, RdataType.AAAA, lifetime)
+    try:
+        ipv4, ipv4_expiration = mcstatus.dns._resolve_addresses(host, RdataType.A, lifetime)
+    except dns.exception.DNSException as exc:
+        ipv4_error: dns.exception.DNSException | None = exc
+        ipv4, ipv4_expiration = [], None
+    else:
+        ipv4_error = None
+    try:
+        ipv6, ipv6_expiration = ipv6_answer.result()
+    except dns.exception.DNSException:
+        if ipv4_error is not None:
+            raise ipv4_error from None
+        ipv6, ipv6_expiration = [], None
+    return _interleave_families(ipv6, ipv4), _first_expiration(ipv6_expiration, ipv4_expiration)
+
+
+async def _async_resolve_ips(host: str, lifetime: float | None = None) -> tuple[list[str], float | None]:
+    """Asynchronous alternative to :func:`._resolve_ips`, querying the AAAA and A records at once."""
+    try:
+        return [str(ipaddress.ip_address(host))], None
+    except ValueError:
+        pass
+
+    ipv6_answer, ipv4_answer = await asyncio.gather(
+        mcstatus.dns._async_resolve_addresses(host, RdataType.AAAA, lifetime),
+        mcstatus.dns._async_resolve_addresses(host, RdataType.A, lifetime),
+        return_exceptions=True,
+    )
+    if isinstance(ipv4_answer, BaseException):
+        if isinstance(ipv6_answer, BaseException) or not isinstance(ipv4_answer, dns.exception.DNSException):
+            raise ipv4_answer
+        ipv4_answer = ([], None)
+    if isinstance(ipv6_answer, BaseException):
+        if not isinstance(ipv6_answer, dns.exception.DNSException):
+            raise ipv6_answer
+        ipv6_answer = ([], None)
+    return _interleave_families(ipv6_answer[0], ipv4_answer[0]), _first_expiration(ipv6_answer[1], ipv4_answer[1])
+
+
+def _first_expiration(*expirations: float | None) -> float | None:
+    """Get the earliest of the expirations, skipping the unknown ones."""
+    known = [expiration for expiration in expirations if expiration is not None]
+    return min(known) if known else None
+
+
+# Results of a non-blocking connect, meaning the connection is still being established
+_CONNECT_IN_PROGRESS: Final = frozenset({0, errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, "WSAEWOULDBLOCK", -1)})
+
+
+def _connect_fastest(
+    endpoints: Sequence[tuple[str, int]],
+    timeout: float,
+    stagger: float = 0,
+) -> tuple[socket.socket, int]:
+    """Connect to the endpoints, and keep the connection which was established first.
+
+    The connections are started in the order of the endpoints, ``stagger`` seconds apart,
+    or right away once a connection fails (the "Happy Eyeballs" of :rfc:`8305`). Without
+    any stagger, all of them are started at once.
+
+    :param endpoints: The IP addresses and ports to connect to.
+    :param timeout: The longest time in seconds to wait for any of the connections.
+    :param stagger: How many seconds to give a connection, before also starting the next one.
+    :return: The connected socket (the others are closed), and the index of its endpoint.
+    :raises OSError: If all of the connections failed, this is the error of the first one.
+    :raises TimeoutError: If none of the connections succeeded in time.
+    """
+    deadline = time.monotonic() + timeout
+    errors: list[OSError] = []
+    connecting: dict[int, socket.socket] = {}
+    started = 0
+    next_start = time.monotonic()
+    with selectors.DefaultSelector() as selector:
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                if started < len(endpoints) and (not connecting or time.monotonic() >= next_start):
+                    ip, port = endpoints[started]
+                    family = socket.AF_INET6 if ipaddress.ip_address(ip).version == 6 else socket.AF_INET
+                    try:
+                        # Creating the socket fails if the system doesn't support its address family at all
+                        sock = socket.socket(family, socket.SOCK_STREAM)
+                    except OSError as exc:
+                        errors.append(exc)
+                    else:
+                        sock.setblocking(False)
+                        if (error := sock.connect_ex((ip, port))) in _CONNECT_IN_PROGRESS:
+                            connecting[started] = sock
+                            selector.register(sock, selectors.EVENT_WRITE, started)
+                        else:
+                            sock.close()
+                            errors.append(OSError(error, f"Connecting to {ip}:{port} failed"))
+                    started += 1
+                    next_start = time.monotonic() + stagger
+                    continue
+                if not connecting:
+                    break
+
+                if started < len(endpoints):
+                    remaining = min(remaining, next_start - time.monotonic())
+                # Several connections could be ready at once, prefer the endpoint which comes first
+                for index in sorted(key.data for key, _ in selector.select(max(remaining, 0))):
+                    sock = connecting.pop(index)
+                    selector.unregister(sock)
+                    if (error := sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)) == 0:
+                        sock.settimeout(timeout)
+                        return sock, index
+                    sock.close()
+                    errors.append(OSError(error, f"Connecting to {endpoints[index][0]}:{endpoints[index][1]} failed"))
+                    next_start = time.monotonic()
+        finally:
+            for sock in connecting.values():
+                sock.close()
+
+    if errors and len(errors) == len(endpoints):
+        raise errors[0]
+    raise TimeoutError(f"None of the {len(endpoints)} endpoints could be connected to in {timeout} seconds")
+
+
+async def _async_connect_fastest(
+    endpoints: Sequence[tuple[str, int]],
+    timeout: float,
+    stagger: float = 0,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, int]:
+    """Asynchronous alternative to :func:`._connect_fastest`.
+
+    :return: The streams of the connection (the others are closed), and the index of its endpoint.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    tasks: list[asyncio.Future[tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = []
+    pending: set[asyncio.Future[tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = set()
+    next_start = loop.time()
+    winner: int | None = None
+    try:
+        while winner is None and (remaining := deadline - loop.time()) > 0:
+            if len(tasks) < len(endpoints) and (not pending or loop.time() >= next_start):
+                task = asyncio.ensure_future(asyncio.open_connection(*endpoints[len(tasks)]))
+                tasks.append(task)
+                pending.add(task)
+                next_start = loop.time() + stagger
+                continue
+            if not pending:
+                break
+
+            if len(tasks) < len(endpoints):
+                remaining = min(remaining, next_start - loop.time())
+            done, pending = await asyncio.wait(pending, timeout=max(remaining, 0), return_when=asyncio.FIRST_COMPLETED)
+            if not all(_connected(task) for task in done):
+                next_start = loop.time()
+            # Several connections could be ready at once, prefer the endpoint which comes first
+            winner = next((index for index, task in enumerate(tasks) if _connected(task)), None)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for index, task in enumerate(tasks):
+            if index != winner and _connected(task):
+                task.result()[1].close()
+
+    if winner is not None:
+        reader, writer = tasks[winner].result()
+        return reader, writer, winner
+    errors = [exception for task in tasks if not task.cancelled() and (exception := task.exception()) is not None]
+    if errors and len(errors) == len(endpoints):
+        raise errors[0]
+    raise TimeoutError(f"None of the {len(endpoints)} endpoints could be connected to in {timeout} seconds")
+
+
+def _connected(task: asyncio.Future[tuple[asyncio.StreamReader, asyncio.StreamWriter]]) -> bool:
+    return task.done() and not task.cancelled() and task.exception() is None
@@ -0,0 +1,396 @@
+"""Requesting the status of many servers at once."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+import queue
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from time import monotonic
+from typing import Final, Literal, TYPE_CHECKING, Tuple, TypeVar, Union, cast, overload
+
+from mcstatus.responses import BedrockStatusResponse, JavaStatusResponse
+from mcstatus.server import BedrockServer, JavaServer
+from mcstatus.utils import RetryBudget, _RetryContext, _retry_context, within_budget
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from multiprocessing.process import BaseProcess
+
+    from typing_extensions import Self, TypeAlias
+
+    _Result: TypeAlias = "StatusResult[JavaStatusResponse | BedrockStatusResponse]"
+
+__all__ = ["RetryBudget", "ShardProgress", "ShardedScanner", "StatusResult", "status_many"]
+
+T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+
+# Marks the end of the stream in the queues below
+_DONE: Final = object()
+
+
+# Tuple and Union are needed here, since the base class is evaluated at runtime (and has to work on Python 3.9)
+class StatusResult(Tuple[str, Union[T_co, Exception]]):
+    """The result of a single server, a tuple of its address and either its status or the exception which prevented getting it.
+
+    On top of that, it carries the amount of :attr:`.attempts` the request took.
+    """
+
+    attempts: int
+    """How many times the server was requested, including the retries."""
+
+    def __new__(cls, address: str, result: T_co | Exception, attempts: int = 1) -> Self:
+        self = super().__new__(cls, (address, result))
+        self.attempts = attempts
+        return self
+
+    def __reduce__(self) -> tuple[type[Self], tuple[str, T_co | Exception, int]]:
+        return self.__class__, (self[0], self[1], self.attempts)
+
+
+async def _java_status(address: str, timeout: float) -> JavaStatusResponse:
+    server = await JavaServer.async_lookup(address, timeout=timeout)
+    return await server.async_status()
+
+
+async def _bedrock_status(address: str, timeout: float) -> BedrockStatusResponse:
+    return await BedrockServer.lookup(address, timeout=timeout).async_status()
+
+
+async def _iterate(addresses: Iterable[str] | AsyncIterable[str]) -> AsyncIterator[str]:
+    if isinstance(addresses, AsyncIterable):
+        async for address in addresses:
+            yield address
+    else:
+        for address in addresses:
+            yield address
+
+
+@overload
+def status_many(
+    addresses: Iterable[str] | AsyncIterable[str],
+    *,
+    concurrency: int = ...,
+    bedrock: Literal[False] = ...,
+    timeout: float = ...,
+    budget: float | None = ...,
+    retry_budget: RetryBudget | None = ...,
+) -> AsyncIterator[StatusResult[JavaStatusResponse]]: ...
+
+
+@overload
+def status_many(
+    addresses: Iterable[str] | AsyncIterable[str],
+    *,
+    concurrency: int = ...,
+    bedrock: Literal[True],
+    timeout: float = ...,
+    budget: float | None = ...,
+    retry_budget: RetryBudget | None = ...,
+) -> AsyncIterator[StatusResult[BedrockStatusResponse]]: ...
+
+
+def status_many(
+    addresses: Iterable[str] | AsyncIterable[str],
+    *,
+    concurrency: int = 64,
+    bedrock: bool = False,
+    timeout: float = 3,
+    budget: float | None = None,
+    retry_budget: RetryBudget | None = None,
+) -> AsyncIterator[StatusResult[JavaStatusResponse | BedrockStatusResponse]]:
+    """Get the status of many servers, yielding the results as they complete.
+
+    Java servers are looked up with :meth:`JavaServer.async_lookup() <mcstatus.server.JavaServer.async_lookup>`
+    (so SRV records are respected) and then requested with
+    :meth:`JavaServer.async_status() <mcstatus.server.JavaServer.async_status>`. Bedrock servers
+    are requested with :meth:`BedrockServer.async_status() <mcstatus.server.BedrockServer.async_status>`.
+
+    At most ``concurrency`` servers are requested at the same time. Addresses are taken from
+    ``addresses`` only as fast as the results are consumed, so it can be a (lazy) iterable of any
+    size. If the iteration is stopped early, all of the requests in progress are cancelled.
+
+    .. code-block:: python
+
+        async for address, result in status_many(addresses, concurrency=100):
+            if isinstance(result, Exception):
+                print(f"{address} is offline: {result!r}")
+            else:
+                print(f"{address} has {result.players.online} players online")
+
+    :param addresses: The addresses of the servers, like ``example.com:25565``.
+    :param concurrency: How many servers to request at the same time.
+    :param bedrock: Whether the servers are Bedrock servers, instead of Java servers.
+    :param timeout: The timeout in seconds before failing to connect, for each server.
+    :param budget:
+        The longest time in seconds a single server may take, including the DNS lookup,
+        connecting and all of the retries. Servers which run out of it get an
+        :exc:`asyncio.TimeoutError` as the result. By default, only the individual
+        steps are limited by ``timeout``.
+    :param retry_budget:
+        Retries shared by all of the servers, so a lot of failing servers can't multiply
+        the time of the whole job.
+    :return:
+        An async iterator of :class:`StatusResult` tuples with the address and either the status
+        response, or the exception which prevented getting it, along with the amount of attempts
+        it took. The results come in the order they complete, not in the order of ``addresses``.
+    """
+    if concurrency < 1:
+        raise ValueError(f"Concurrency must be at least 1, got {concurrency!r}")
+
+    request = _bedrock_status if bedrock else _java_status
+    return _run_bounded(request, addresses, concurrency=concurrency, timeout=timeout, budget=budget, retry_budget=retry_budget)
+
+
+async def _run_bounded(
+    request: Callable[[str, float], Awaitable[T]],
+    addresses: Iterable[str] | AsyncIterable[str],
+    *,
+    concurrency: int,
+    timeout: float,
+    budget: float | None,
+    retry_budget: RetryBudget | None,
+) -> AsyncIterator[StatusResult[T]]:
+    """Run ``request`` on every address with a pool of ``concurrency`` workers, yielding the results.
+
+    Both the queue of addresses and the queue of results are bounded, which makes
+    the workers (and the reading of ``addresses``) wait for a slow consumer.
+    """
+    todo: asyncio.Queue[object] = asyncio.Queue(maxsize=concurrency)
+    results: asyncio.Queue[object] = asyncio.Queue(maxsize=concurrency)
+
+    async def feed() -> None:
+        try:
+            async for address in _iterate(addresses):
+                await todo.put(address)
+        except Exception as exc:
+            await results.put(exc)
+        for _ in range(concurrency):
+            await todo.put(_DONE)
+
+    async def work() -> None:
+        # Every worker runs in its own task, with its own copy of the context
+        retry_context = _RetryContext(retry_budget)
+        _retry_context.set(retry_context)
+
+        while (address := await todo.get()) is not _DONE:
+            assert isinstance(address, str)
+            retry_context.retries = 0
+            try:
+                result: T | Exception = await within_budget(request(address, timeout), budget)
+            except Exception as exc:
+                result = exc
+            await results.put(StatusResult(address, result, retry_context.retries + 1))
+        await results.put(_DONE)
+
+    tasks = [asyncio.ensure_future(feed())]
+    tasks.extend(asyncio.ensure_future(work()) for _ in range(concurrency))
+    try:
+        running = concurrency
+        while running:
+            item = await results.get()
+            if item is _DONE:
+                running -= 1
+            elif isinstance(item, Exception):  # Failed to iterate the addresses
+                raise item
+            else:
+                yield cast("StatusResult[T]", item)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@dataclass
+class ShardProgress:
+    """Progress of a single shard of :class:`ShardedScanner`."""
+
+    total: int
+    """How many servers are in this shard."""
+    done: int = 0
+    """How many servers from this shard have their result yielded already."""
+    finished: bool = False
+    """Whether the worker process of this shard has finished."""
+
+
+def _picklable(exc: Exception) -> Exception:
+    """Return ``exc`` if it survives pickling, or an :exc:`IOError` describing it if it doesn't."""
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        return IOError(f"{type(exc).__name__}: {exc}")
+    return exc
+
+
+def _scan_shard(
+    shard: int,
+    addresses: list[str],
+    results: multiprocessing.Queue[tuple[int, list[_Result] | None]],
+    concurrency: int,
+    bedrock: bool,
+    timeout: float,
+    budget: float | None,
+    batch_size: int,
+    batch_interval: float,
+) -> None:
+    """Entry point of the :class:`ShardedScanner` worker processes.
+
+    Results are sent to the parent process in batches, to keep the IPC overhead
+    per result low. A batch is sent once it's full, or once ``batch_interval``
+    seconds passed since the previous one, whatever comes first.
+    """
+
+    async def scan() -> None:
+        batch: list[_Result] = []
+        last_sent = monotonic()
+        async for item in status_many(addresses, concurrency=concurrency, bedrock=bedrock, timeout=timeout, budget=budget):
+            address, result = item
+            if isinstance(result, Exception):
+                result = _picklable(result)
+            batch.append(StatusResult(address, result, item.attempts))
+            if len(batch) >= batch_size or monotonic() - last_sent >= batch_interval:
+                results.put((shard, batch))
+                batch = []
+                last_sent = monotonic()
+        if batch:
+            results.put((shard, batch))
+
+    asyncio.run(scan())
+    results.put((shard, None))
+
+
+class ShardedScanner:
+    """Scanner for the status of many servers, sharded across multiple worker processes.
+
+    A single event loop can only use a single CPU core, most of which goes to parsing
+    the responses. This scanner splits the servers into one shard per worker process,
+    each of which runs :func:`status_many` on its own event loop, and merges the results
+    back together as they come.
+
+    .. code-block:: python
+
+        if __name__ == "__main__":
+            with ShardedScanner(addresses, processes=4) as scanner:
+                for address, result in scanner:
+                    ...
+                    print(f"{sum(shard.done for shard in scanner.progress)}/{len(addresses)}")
+
+    .. note::
+        Depending on the platform, worker processes may be started by spawning
+        a fresh interpreter, which imports your main module again. Guard your
+        code with ``if __name__ == "__main__":`` there.
+    """
+
+    def __init__(
+        self,
+        addresses: Sequence[str],
+        *,
+        processes: int | None = None,
+        concurrency: int = 64,
+        bedrock: bool = False,
+        timeout: float = 3,
+        budget: float | None = None,
+        batch_size: int = 64,
+        batch_interval: float = 0.1,
+        context: BaseContext | None = None,
+    ) -> None:
+        """
+        :param addresses: The addresses of the servers, like ``example.com:25565``.
+        :param processes: How many worker processes to use. Defaults to the number of CPU cores.
+        :param concurrency: How many servers to request at the same time, in each worker process.
+        :param bedrock: Whether the servers are Bedrock servers, instead of Java servers.
+        :param timeout: The timeout in seconds before failing to connect, for each server.
+        :param budget: The longest time in seconds a single server may take, see :func:`status_many`.
+        :param batch_size: How many results a worker process sends to this process at once.
+        :param batch_interval: The longest time in seconds a worker process waits to fill a batch.
+        :param context: The :mod:`multiprocessing` context to start the worker processes with.
+        """
+        if processes is None:
+            processes = os.cpu_count() or 1
+        processes = max(1, min(processes, len(addresses)))
+
+        self.concurrency = concurrency
+        self.bedrock = bedrock
+        self.timeout = timeout
+        self.budget = budget
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+
+        self._shards = [list(addresses[shard::processes]) for shard in range(processes)]
+        self.progress = [ShardProgress(total=len(shard)) for shard in self._shards]
+        """Progress of each of the shards."""
+
+        self._context = context if context is not None else multiprocessing.get_context()
+        self._results: multiprocessing.Queue[tuple[int, list[_Result] | None]] = self._context.Queue()
+        self._processes: list[BaseProcess] = []
+
+    def start(self) -> None:
+        """Start the worker processes. Iterating the scanner starts them automatically."""
+        if self._processes:
+            return
+
+        for shard, addresses in enumerate(self._shards):
+            process = self._context.Process(  # pyright: ignore[reportAttributeAccessIssue]
+                target=_scan_shard,
+                args=(
+                    shard,
+                    addresses,
+                    self._results,
+                    self.concurrency,
+                    self.bedrock,
+                    self.timeout,
+                    self.budget,
+                    self.batch_size,
+                    self.batch_interval,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+    def __iter__(self) -> Iterator[_Result]:
+        """Yield the results of all shards as they come, see :func:`status_many` for their format.
+
+        :raises RuntimeError: If a worker process died before finishing its shard.
+        """
+        self.start()
+        while not all(shard.finished for shard in self.progress):
+            try:
+                shard, batch = self._results.get(timeout=0.5)
+            except queue.Empty:
+                self._check_processes()
+                continue
+
+            if batch is None:
+                self.progress[shard].finished = True
+                continue
+
+            for result in batch:
+                self.progress[shard].done += 1
+                yield result
+
+        for process in self._processes:
+            process.join()
+
+    def _check_processes(self) -> None:
+        for shard, process in enumerate(self._processes):
+            if not process.is_alive() and process.exitcode != 0 and not self.progress[shard].finished:
+                raise RuntimeError(f"Worker process of shard {shard} died with exit code {process.exitcode}")
+
+    def close(self) -> None:
+        """Terminate the worker processes, which are still running."""
+        for process in self._processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        self._results.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -1,13 +1,215 @@
 from __future__ import annotations
 
-from typing import cast
+import copy
+import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Final, NamedTuple, TYPE_CHECKING, cast
 
 import dns.asyncresolver
+import dns.exception
+import dns.message
 import dns.resolver
 from dns.rdatatype import RdataType
+from dns.rdtypes.ANY.SOA import SOA as SOARecordAnswer  # noqa: N811 # constant imported as non constant (it's class)
 from dns.rdtypes.IN.A import A as ARecordAnswer
 from dns.rdtypes.IN.SRV import SRV as SRVRecordAnswer  # noqa: N811 # constant imported as non constant (it's class)
 
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+    _CachedAnswer: TypeAlias = "dns.resolver.Answer | dns.resolver.NXDOMAIN | dns.resolver.NoAnswer"
+
+# Negative answers (NXDOMAIN and NoAnswer), which are remembered in the cache
+_NEGATIVE_ANSWERS: Final = (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer)
+
+
+class DNSCache:
+    """Process-wide cache of the DNS answers, shared by the synchronous and asynchronous lookups.
+
+    Answers are kept until their TTL expires, and the least recently used answers are
+    evicted when the cache is full. Negative answers (:exc:`dns.resolver.NXDOMAIN` and
+    :exc:`dns.resolver.NoAnswer`) are cached too, for the negative TTL from the SOA record
+    of the response (see :rfc:`2308`), but no longer than ``max_negative_ttl``.
+
+    The shared instance is available as :data:`mcstatus.dns.cache`. Setting its
+    ``max_size`` to ``0`` disables the caching.
+    """
+
+    def __init__(self, max_size: int = 1024, max_negative_ttl: float = 300) -> None:
+        """
+        :param max_size: How many answers to keep at most.
+        :param max_negative_ttl: The longest time in seconds to keep a negative answer for.
+        """
+        self.max_size = max_size
+        self.max_negative_ttl = max_negative_ttl
+        self.hits = 0
+        """How many lookups were answered from the cache."""
+        self.misses = 0
+        """How many lookups had to query the DNS."""
+
+        self._entries: OrderedDict[tuple[str, RdataType], tuple[float, _CachedAnswer]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, name: str, rdtype: RdataType) -> dns.resolver.Answer | None:
+        """Get the cached answer, or :obj:`None` if there is no (unexpired) answer cached.
+
+        :raises dns.resolver.NXDOMAIN: If the negative answer is cached.
+        :raises dns.resolver.NoAnswer: If the negative answer is cached.
+        """
+        key = (name, rdtype)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        answer = entry[1]
+        if isinstance(answer, dns.exception.DNSException):
+            # Raise a copy, so the same instance doesn't collect tracebacks from different callers
+            raise copy.copy(answer)
+        return answer
+
+    def put(self, name: str, rdtype: RdataType, answer: dns.resolver.Answer) -> None:
+        """Cache the answer, until it expires."""
+        # Only the answers coming from a resolver carry their expiration time
+        expiration = getattr(answer, "expiration", None)
+        if expiration is not None:
+            self._store((name, rdtype), expiration, answer)
+
+    def put_negative(self, name: str, rdtype: RdataType, exc: dns.resolver.NXDOMAIN | dns.resolver.NoAnswer) -> None:
+        """Cache the negative answer, if its response specifies the negative TTL."""
+        ttl = _negative_ttl(exc)
+        if ttl is not None:
+            self._store((name, rdtype), time.time() + min(ttl, self.max_negative_ttl), copy.copy(exc))
+
+    def _store(self, key: tuple[str, RdataType], expiration: float, answer: _CachedAnswer) -> None:
+        with self._lock:
+            if self.max_size <= 0:
+                return
+            self._entries[key] = (expiration, answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all of the cached answers and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+cache: Final = DNSCache()
+"""The :class:`DNSCache` instance shared by all of the lookups."""
+
+
+def _negative_ttl(exc: dns.resolver.NXDOMAIN | dns.resolver.NoAnswer) -> float | None:
+    """Get the negative TTL from the SOA record of the responses, or :obj:`None` if there is none."""
+    responses: list[dns.message.Message]
+    if isinstance(exc, dns.resolver.NXDOMAIN):
+        responses = list(exc.kwargs.get("responses", {}).values())
+    else:
+        response = exc.kwargs.get("response")
+        responses = [response] if response is not None else []
+
+    ttls = [
+        min(rrset.ttl, cast(SOARecordAnswer, rrset[0]).minimum)
+        for response in responses
+        for rrset in response.authority
+        if rrset.rdtype == RdataType.SOA and rrset
+    ]
+    return min(ttls, default=None)
+
+
+def _resolve(name: str, rdtype: RdataType, lifetime: float | None) -> dns.resolver.Answer:
+    """Resolve the record through the :data:`cache`."""
+    answers = cache.get(name, rdtype)
+    if answers is not None:
+        return answers
+
+    try:
+        answers = dns.resolver.resolve(name, rdtype, lifetime=lifetime, search=True)
+    except _NEGATIVE_ANSWERS as exc:
+        cache.put_negative(name, rdtype, exc)
+        raise
+    cache.put(name, rdtype, answers)
+    return answers
+
+
+async def _async_resolve(name: str, rdtype: RdataType, lifetime: float | None) -> dns.resolver.Answer:
+    """Asynchronous alternative to :func:`._resolve`."""
+    answers = cache.get(name, rdtype)
+    if answers is not None:
+        return answers
+
+    try:
+        answers = await dns.asyncresolver.resolve(name, rdtype, lifetime=lifetime, search=True)
+    except _NEGATIVE_ANSWERS as exc:
+        cache.put_negative(name, rdtype, exc)
+        raise
+    cache.put(name, rdtype, answers)
+    return answers
+
+
+class SRVTarget(NamedTuple):
+    """A target of an SRV record."""
+
+    host: str
+    port: int
+    priority: int
+    """Targets with lower priority are to be used first."""
+    weight: int
+    """Targets with the same priority are picked randomly, in proportion to their weights."""
+
+
+def order_srv_targets(targets: Iterable[SRVTarget]) -> list[SRVTarget]:
+    """Order the targets of an SRV record the way clients should try them, as described in :rfc:`2782`.
+
+    The targets are sorted by their priority, and the targets with the same priority are
+    shuffled, so each of them comes first with a chance proportional to its weight.
+    """
+    remaining = sorted(targets, key=lambda target: (target.priority, target.weight))
+    ordered: list[SRVTarget] = []
+    while remaining:
+        same_priority = [target for target in remaining if target.priority == remaining[0].priority]
+        del remaining[: len(same_priority)]
+        while same_priority:
+            # Zero weight targets are sorted first, so they have a (tiny) chance to be picked too
+            pick = random.uniform(0, sum(target.weight for target in same_priority))
+            running_sum = 0
+            for index, target in enumerate(same_priority):
+                running_sum += target.weight
+                if running_sum >= pick:
+                    ordered.append(same_priority.pop(index))
+                    break
+            else:
+                ordered.append(same_priority.pop())
+    return ordered
+
+
+def _srv_targets(answers: dns.resolver.Answer) -> list[SRVTarget]:
+    """Get the targets of an SRV answer, in the order to try them."""
+    records = [cast(SRVRecordAnswer, answer) for answer in answers]
+    if len(records) == 1:
+        # Nothing to order, which also keeps the priority and weight of a single record optional
+        record = records[0]
+        return [SRVTarget(str(record.target).rstrip("."), int(record.port), 0, 0)]
+    return order_srv_targets(
+        SRVTarget(str(record.target).rstrip("."), int(record.port), int(record.priority), int(record.weight))
+        for record in records
+    )
+
 
 def resolve_a_record(hostname: str, lifetime: float | None = None) -> str:
     """Perform a DNS resolution for an A record to given hostname
@@ -19,7 +221,7 @@ def resolve_a_record(hostname: str, lifetime: float | None = None) -> str:
         Most notably this will be :exc:`dns.exception.Timeout`, :exc:`dns.resolver.NXDOMAIN`
         and :exc:`dns.resolver.NoAnswer`
     """
-    answers = dns.resolver.resolve(hostname, RdataType.A, lifetime=lifetime, search=True)
+    answers = _resolve(hostname, RdataType.A, lifetime)
     # There should only be one answer here, though in case the server
     # does actually point to multiple IPs, we just pick the first one
     answer = cast(ARecordAnswer, answers[0])
@@ -32,7 +234,7 @@ async def async_resolve_a_record(hostname: str, lifetime: float | None = None) -
 
     For more details, check it.
     """
-    answers = await dns.asyncresolver.resolve(hostname, RdataType.A, lifetime=lifetime, search=True)
+    answers = await _async_resolve(hostname, RdataType.A, lifetime)
     # There should only be one answer here, though in case the server
     # does actually point to multiple IPs, we just pick the first one
     answer = cast(ARecordAnswer, answers[0])
@@ -40,6 +242,54 @@ async def async_resolve_a_record(hostname: str, lifetime: float | None = None) -
     return ip
 
 
+def resolve_a_records(hostname: str, lifetime: float | None = None) -> list[str]:
+    """Perform a DNS resolution for all of the A records of given hostname.
+
+    :param hostname: The address to resolve for.
+    :return: All of the IP addresses from the A records, in the order the DNS server gave them.
+    :raises dns.exception.DNSException: Same as :func:`.resolve_a_record`.
+    """
+    return _resolve_addresses(hostname, RdataType.A, lifetime)[0]
+
+
+async def async_resolve_a_records(hostname: str, lifetime: float | None = None) -> list[str]:
+    """Asynchronous alternative to :func:`.resolve_a_records`.
+
+    For more details, check it.
+    """
+    return (await _async_resolve_addresses(hostname, RdataType.A, lifetime))[0]
+
+
+def resolve_aaaa_records(hostname: str, lifetime: float | None = None) -> list[str]:
+    """Perform a DNS resolution for all of the AAAA (IPv6) records of given hostname.
+
+    :param hostname: The address to resolve for.
+    :return: All of the IPv6 addresses from the AAAA records, in the order the DNS server gave them.
+    :raises dns.exception.DNSException: Same as :func:`.resolve_a_record`.
+    """
+    return _resolve_addresses(hostname, RdataType.AAAA, lifetime)[0]
+
+
+async def async_resolve_aaaa_records(hostname: str, lifetime: float | None = None) -> list[str]:
+    """Asynchronous alternative to :func:`.resolve_aaaa_records`.
+
+    For more details, check it.
+    """
+    return (await _async_resolve_addresses(hostname, RdataType.AAAA, lifetime))[0]
+
+
+def _resolve_addresses(hostname: str, rdtype: RdataType, lifetime: float | None) -> tuple[list[str], float | None]:
+    """Resolve the A or AAAA records, returning their IPs and when (in :func:`time.time`) they expire, if known."""
+    answers = _resolve(hostname, rdtype, lifetime)
+    return [str(answer).rstrip(".") for answer in answers], getattr(answers, "expiration", None)
+
+
+async def _async_resolve_addresses(hostname: str, rdtype: RdataType, lifetime: float | None) -> tuple[list[str], float | None]:
+    """Asynchronous alternative to :func:`._resolve_addresses`."""
+    answers = await _async_resolve(hostname, rdtype, lifetime)
+    return [str(answer).rstrip(".") for answer in answers], getattr(answers, "expiration", None)
+
+
 def resolve_srv_record(query_name: str, lifetime: float | None = None) -> tuple[str, int]:
     """Perform a DNS resolution for SRV record pointing to the Java Server.
 
@@ -50,7 +300,7 @@ def resolve_srv_record(query_name: str, lifetime: float | None = None) -> tuple[
         Most notably this will be :exc:`dns.exception.Timeout`, :exc:`dns.resolver.NXDOMAIN`
         and :exc:`dns.resolver.NoAnswer`
     """
-    answers = dns.resolver.resolve(query_name, RdataType.SRV, lifetime=lifetime, search=True)
+    answers = _resolve(query_name, RdataType.SRV, lifetime)
     # There should only be one answer here, though in case the server
     # does actually point to multiple IPs, we just pick the first one
     answer = cast(SRVRecordAnswer, answers[0])
@@ -64,7 +314,7 @@ async def async_resolve_srv_record(query_name: str, lifetime: float | None = Non
 
     For more details, check it.
     """
-    answers = await dns.asyncresolver.resolve(query_name, RdataType.SRV, lifetime=lifetime, search=True)
+    answers = await _async_resolve(query_name, RdataType.SRV, lifetime)
     # There should only be one answer here, though in case the server
     # does actually point to multiple IPs, we just pick the first one
     answer = cast(SRVRecordAnswer, answers[0])
@@ -73,6 +323,39 @@ async def async_resolve_srv_record(query_name: str, lifetime: float | None = Non
     return host, port
 
 
+def resolve_srv_records(query_name: str, lifetime: float | None = None) -> list[SRVTarget]:
+    """Perform a DNS resolution for all of the targets of an SRV record.
+
+    Unlike :func:`.resolve_srv_record`, which always takes the first record, the targets are
+    ordered by their priority and weight (see :func:`.order_srv_targets`).
+
+    :param query_name: The address to resolve for.
+    :return: The targets, in the order to try them.
+    :raises dns.exception.DNSException: Same as :func:`.resolve_srv_record`.
+    """
+    return _resolve_srv_targets(query_name, lifetime)[0]
+
+
+async def async_resolve_srv_records(query_name: str, lifetime: float | None = None) -> list[SRVTarget]:
+    """Asynchronous alternative to :func:`.resolve_srv_records`.
+
+    For more details, check it.
+    """
+    return (await _async_resolve_srv_targets(query_name, lifetime))[0]
+
+
+def _resolve_srv_targets(query_name: str, lifetime: float | None) -> tuple[list[SRVTarget], float | None]:
+    """Resolve the ordered SRV targets, along with when (in :func:`time.time`) they expire, if known."""
+    answers = _resolve(query_name, RdataType.SRV, lifetime)
+    return _srv_targets(answers), getattr(answers, "expiration", None)
+
+
+async def _async_resolve_srv_targets(query_name: str, lifetime: float | None) -> tuple[list[SRVTarget], float | None]:
+    """Asynchronous alternative to :func:`._resolve_srv_targets`."""
+    answers = await _async_resolve(query_name, RdataType.SRV, lifetime)
+    return _srv_targets(answers), getattr(answers, "expiration", None)
+
+
 def resolve_mc_srv(hostname: str, lifetime: float | None = None) -> tuple[str, int]:
     """Resolve SRV record for a minecraft server on given hostname.
 
@@ -92,3 +375,21 @@ async def async_resolve_mc_srv(hostname: str, lifetime: float | None = None) ->
     For more details, check it.
     """
     return await async_resolve_srv_record("_minecraft._tcp." + hostname, lifetime=lifetime)
+
+
+def resolve_mc_srv_targets(hostname: str, lifetime: float | None = None) -> list[SRVTarget]:
+    """Resolve all of the targets of the SRV record for a minecraft server on given hostname.
+
+    :param str hostname: The address, without port, on which an SRV record is present.
+    :return: The targets, in the order to try them (see :func:`.order_srv_targets`).
+    :raises dns.exception.DNSException: Same as :func:`.resolve_mc_srv`.
+    """
+    return resolve_srv_records("_minecraft._tcp." + hostname, lifetime=lifetime)
+
+
+async def async_resolve_mc_srv_targets(hostname: str, lifetime: float | None = None) -> list[SRVTarget]:
+    """Asynchronous alternative to :func:`.resolve_mc_srv_targets`.
+
+    For more details, check it.
+    """
+    return await async_resolve_srv_records("_minecraft._tcp." + hostname, lifetime=lifetime)
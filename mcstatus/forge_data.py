@@ -14,11 +14,17 @@ https://github.com/MinecraftForge/MinecraftForge/blob/54b08d2711a15418130694342a
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from io import StringIO
-from typing import Final, TYPE_CHECKING
+from typing import Final, TYPE_CHECKING, cast
 
 from mcstatus.protocol.connection import BaseConnection, BaseReadSync, Connection
+from mcstatus.utils import deprecated
 
 VERSION_FLAG_IGNORE_SERVER_ONLY: Final = 0b1
 IGNORE_SERVER_ONLY: Final = "<not required for client>"
@@ -143,8 +149,13 @@ class ForgeDataMod:
         return cls(name=mod_id, marker=mod_version), channels
 
 
+@deprecated(replacement="ForgeData.build", date="2027-04", methods=("__init__",))
 class StringBuffer(BaseReadSync, BaseConnection):
-    """String Buffer for reading utf-16 encoded binary data."""
+    """String Buffer for reading utf-16 encoded binary data.
+
+    .. deprecated:: 12.1.0
+        Will be removed 2027-04, :meth:`ForgeData.build` decodes the data without it now.
+    """
 
     __slots__ = ("received", "stringio")
 
@@ -205,18 +216,57 @@ class ForgeData:
 
     @staticmethod
     def _decode_optimized(string: str) -> Connection:
-        """Decode buffer from UTF-16 optimized binary data ``string``."""
-        with StringIO(string) as text:
-            str_buffer = StringBuffer(text)
-            return str_buffer.read_optimized_buffer()
+        """Decode buffer from UTF-16 optimized binary data ``string``.
+
+        The first two UTF-16 code units hold the size of the data (15 bits each), and every
+        following code unit holds the next 15 bits of it (little-endian, the sign bit is ignored).
+        Eight code units make exactly 15 bytes, so they are unpacked 8 at a time.
+        """
+        encoded = string.encode("utf-16-le")
+        units = len(encoded) // 2
+        if units < 2:
+            raise IOError(f"Not enough data to read! {len(encoded)} < 4")
+
+        size_low, size_high = struct.unpack_from("<2h", encoded)
+        size = max(size_low | (size_high << 15), 0)
+
+        groups = [unit & 0x7FFF for unit in struct.unpack_from(f"<{units - 2}H", encoded, 4)]
+        groups.extend([0] * (-len(groups) % 8))
+        # Any data missing at the end is zeroes
+        data = bytearray(max(size, len(groups) * 15 // 8))
+        for chunk in range(len(groups) // 8):
+            g0, g1, g2, g3, g4, g5, g6, g7 = groups[chunk * 8 : chunk * 8 + 8]
+            value = g0 | g1 << 15 | g2 << 30 | g3 << 45 | g4 << 60 | g5 << 75 | g6 << 90 | g7 << 105
+            data[chunk * 15 : chunk * 15 + 15] = value.to_bytes(15, "little")
+        del data[size:]
+
+        buffer = Connection()
+        buffer.receive(data)
+        return buffer
 
     @classmethod
     def build(cls, raw: RawForgeData) -> Self | None:
         """Build an object about Forge mods from raw response.
 
+        If the :data:`cache` is enabled, the object is copied from it, when the same payload
+        was built before. Only the (immutable) channels and mods are shared, every call still
+        gets its own lists of them.
+
         :param raw: ``forgeData`` attribute in raw response :class:`dict`.
         :return: :class:`ForgeData` object.
         """
+        if cache.max_size <= 0:
+            return cls._build(raw)
+
+        key = (cls, _payload_digest(raw))
+        forge_data = cache.get(key)
+        if forge_data is None:
+            forge_data = cls._build(raw)
+            cache.put(key, forge_data)
+        return cast("Self", forge_data)
+
+    @classmethod
+    def _build(cls, raw: RawForgeData) -> Self:
         fml_network_version = raw.get("fmlNetworkVersion", 1)
 
         # see https://github.com/MinecraftForge/MinecraftForge/blob/7d0330eb08299935714e34ac651a293e2609aa86/src/main/java/net/minecraftforge/network/ServerStatusPing.java#L27-L73  # noqa: E501  # line too long
@@ -259,3 +309,76 @@ class ForgeData:
             mods=mods,
             truncated=truncated,
         )
+
+
+def _payload_digest(raw: RawForgeData) -> bytes:
+    """Hash the raw forge payload, for the key in :data:`cache`."""
+    payload = json.dumps(raw, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _copy_forge_data(forge_data: ForgeData) -> ForgeData:
+    """Copy the object with new lists of its channels and mods, which are immutable themselves, so they're shared."""
+    return replace(forge_data, channels=list(forge_data.channels), mods=list(forge_data.mods))
+
+
+class ForgeDataCache:
+    """Cache of the built :class:`ForgeData` objects, keyed by a hash of their raw payload.
+
+    Lots of servers run the same modpack, and so send the very same forge data. With the
+    cache, it's decoded only once, and all of the responses share the same channels and mods.
+    The objects are copied into and out of the cache (with new lists, but the same immutable
+    items), so modifying one response can't change the others. The least recently used objects
+    are evicted when the cache is full.
+
+    The shared instance is available as :data:`mcstatus.forge_data.cache`. It's disabled
+    by default, set its ``max_size`` to enable it.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        """
+        :param max_size: How many objects to keep at most, ``0`` disables the cache.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        """How many objects were taken from the cache."""
+        self.misses = 0
+        """How many objects had to be built."""
+
+        self._entries: OrderedDict[tuple[type[ForgeData], bytes], ForgeData] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[type[ForgeData], bytes]) -> ForgeData | None:
+        """Get the cached object, or :obj:`None` if there is none."""
+        with self._lock:
+            forge_data = self._entries.get(key)
+            if forge_data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _copy_forge_data(forge_data)
+
+    def put(self, key: tuple[type[ForgeData], bytes], forge_data: ForgeData) -> None:
+        """Cache a copy of the object."""
+        with self._lock:
+            if self.max_size <= 0:
+                return
+            self._entries[key] = _copy_forge_data(forge_data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all of the cached objects and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+cache: Final = ForgeDataCache()
+"""The :class:`ForgeDataCache` instance used by :meth:`ForgeData.build`."""
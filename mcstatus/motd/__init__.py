@@ -1,25 +1,86 @@
 from __future__ import annotations
 
 import re
+import threading
 import typing as t
+from collections import OrderedDict
 from dataclasses import dataclass
 
 from mcstatus.motd.components import Formatting, MinecraftColor, ParsedMotdComponent, TranslationTag, WebColor
-from mcstatus.motd.simplifies import get_unused_elements, squash_nearby_strings
+from mcstatus.motd.simplifies import simplify
 from mcstatus.motd.transformers import AnsiTransformer, HtmlTransformer, MinecraftTransformer, PlainTransformer
 
 if t.TYPE_CHECKING:
-    from typing_extensions import Self
+    from typing_extensions import Self, TypeAlias
 
     from mcstatus.responses import RawJavaResponseMotd, RawJavaResponseMotdWhenDict  # circular import
 else:
     RawJavaResponseMotdWhenDict = dict
 
-__all__ = ["Motd"]
+if t.TYPE_CHECKING:
+    _MotdCacheKey: TypeAlias = "tuple[type[Motd], bool, t.Hashable]"
+
+__all__ = ["Motd", "MotdLimitError"]
 
 MOTD_COLORS_RE = re.compile(r"([\xA7|&][0-9A-FK-OR])", re.IGNORECASE)
 
 
+class MotdLimitError(OSError, ValueError):
+    """The MOTD is nested deeper than :attr:`Motd.MAX_DEPTH`, or has more than :attr:`Motd.MAX_COMPONENTS` components.
+
+    It's an :exc:`OSError`, like the other invalid responses of a server, and a :exc:`ValueError`, as it used to be.
+    Such a MOTD is the same on every request, so requests failing with it aren't retried.
+    """
+
+
+# The keys of the formatting fields in dict components
+_STYLE_KEYS: t.Final = tuple((style_key.lower(), style_val) for style_key, style_val in Formatting.__members__.items())
+
+
+def _legacy_codes() -> dict[str, ParsedMotdComponent]:
+    """Build the table of all section codes matched by :data:`MOTD_COLORS_RE`, to their components."""
+    codes: dict[str, ParsedMotdComponent] = {}
+    for component in (*MinecraftColor, *Formatting):
+        if component is MinecraftColor.MINECOIN_GOLD:
+            continue  # not matched by the pattern
+        # the pattern ignores case, including the Kelvin sign, which is a "k" in lower case
+        chars = {component.value, component.value.upper(), *(("\u212a",) if component.value == "k" else ())}
+        for prefix in ("§", "&"):
+            for char in chars:
+                codes[prefix + char] = component
+    return codes
+
+
+_LEGACY_CODES: t.Final = _legacy_codes()
+
+
+def _parse_minecoin_gold(element: str, *, bedrock: bool) -> ParsedMotdComponent:
+    """Parse a text, which is a minecoin gold color if it's only its code (not matched by :data:`MOTD_COLORS_RE`).
+
+    On Java servers, a single ``§g`` is just a text.
+    """
+    if element[:1] in ("§", "&") and element.lstrip("&§") in ("g", "G") and (bedrock or len(element) > 2):
+        return MinecraftColor.MINECOIN_GOLD
+    return element
+
+
+# The transformers behind the Motd.to_* shortcuts, so they aren't created for every call
+_plain_transformer: t.Final = PlainTransformer()
+_minecraft_transformer: t.Final = MinecraftTransformer()
+_ansi_transformer: t.Final = AnsiTransformer()
+
+
+class _HtmlTransformers(threading.local):
+    """The HTML transformers keep the tags to close on the instance, so each thread has its own ones."""
+
+    def __init__(self) -> None:
+        self.java = HtmlTransformer()
+        self.bedrock = HtmlTransformer(bedrock=True)
+
+
+_html_transformers: t.Final = _HtmlTransformers()
+
+
 @dataclass(frozen=True)
 class Motd:
     """Represents parsed MOTD."""
@@ -34,6 +95,11 @@ class Motd:
     bedrock: bool = False
     """Is server Bedrock Edition? Some details may change in work of this class."""
 
+    MAX_DEPTH: t.ClassVar[int] = 256
+    """How deep can the ``extra`` components of a MOTD be nested, deeper MOTDs fail to parse."""
+    MAX_COMPONENTS: t.ClassVar[int] = 65536
+    """How many components can a parsed MOTD have, larger MOTDs fail to parse."""
+
     @classmethod
     def parse(
         cls,
@@ -43,10 +109,35 @@ class Motd:
     ) -> Self:
         """Parse a raw MOTD to less raw MOTD (:attr:`.parsed` attribute).
 
+        If the :data:`cache` is enabled, the parsed components are taken from it, when the same
+        MOTD was parsed before. Every call still gets its own :class:`.Motd` (with its own lists).
+
         :param raw: Raw MOTD, directly from server.
         :param bedrock: Is server Bedrock Edition? Nothing changes here, just sets attribute.
-        :returns: New :class:`.Motd` instance.
+        :returns: :class:`.Motd` instance.
         """
+        if cache.max_size <= 0:
+            return cls._parse(raw, bedrock=bedrock)
+
+        try:
+            key = (cls, bedrock, _canonical_raw(raw))
+        except RecursionError:  # nested too deep to be worth caching, leave it to the parser and its limits
+            return cls._parse(raw, bedrock=bedrock)
+        parsed = cache.get(key)
+        if parsed is None:
+            motd = cls._parse(raw, bedrock=bedrock)
+            cache.put(key, motd.parsed)
+            return motd
+        original_raw = raw.copy() if hasattr(raw, "copy") else raw  # type: ignore # Cannot access "copy" for type "str"
+        return cls(list(parsed), original_raw, bedrock)
+
+    @classmethod
+    def _parse(
+        cls,
+        raw: RawJavaResponseMotd,  # type: ignore # later, we overwrite the type
+        *,
+        bedrock: bool = False,
+    ) -> Self:
         original_raw = raw.copy() if hasattr(raw, "copy") else raw  # type: ignore # Cannot access "copy" for type "str"
         if isinstance(raw, list):
             raw: RawJavaResponseMotdWhenDict = {"extra": raw}
@@ -71,28 +162,13 @@ class Motd:
             Ignores :attr:`MinecraftColor.MINECOIN_GOLD` if it's :obj:`False`.
         :returns: :obj:`ParsedMotdComponent` list, which need to be passed to ``__init__``.
         """
-        parsed_motd: list[ParsedMotdComponent] = []
-
         split_raw = MOTD_COLORS_RE.split(raw)
-        for element in split_raw:
-            clean_element = element.lstrip("&§").lower()
-            standardized_element = element.replace("&", "§").lower()
+        parsed_motd: list[ParsedMotdComponent] = list(split_raw)
 
-            if standardized_element == "§g" and not bedrock:
-                parsed_motd.append(element)  # minecoin_gold on java server, treat as string
-                continue
-
-            if standardized_element.startswith("§"):
-                try:
-                    parsed_motd.append(MinecraftColor(clean_element))
-                except ValueError:
-                    try:
-                        parsed_motd.append(Formatting(clean_element))
-                    except ValueError:
-                        # just a text
-                        parsed_motd.append(element)
-            else:
-                parsed_motd.append(element)
+        # As the pattern has a single group, the codes are at the odd indices, and the text between them at the even ones
+        parsed_motd[1::2] = [_LEGACY_CODES.get(code, code) for code in split_raw[1::2]]  # codes with "|" are just text
+        if "g" in raw or "G" in raw:
+            parsed_motd[::2] = [_parse_minecoin_gold(text, bedrock=bedrock) for text in split_raw[::2]]
 
         return parsed_motd
 
@@ -106,27 +182,87 @@ class Motd:
     ) -> list[ParsedMotdComponent]:
         """Parse a MOTD when it's dict.
 
+        The nested ``extra`` components are walked with an explicit stack (not recursively), limited
+        by :attr:`.MAX_DEPTH` and :attr:`.MAX_COMPONENTS`, so hostile MOTDs can't exhaust the recursion
+        limit or the memory.
+
         :param item: :class:`dict` directly from the server.
         :param bedrock: Is the server Bedrock Edition?
             Nothing does here, just going to :meth:`._parse_as_str` while parsing ``text`` field.
         :param auto_add: Values to add on this item.
             Most time, this is :class:`Formatting` from top level.
+        :raises MotdLimitError: If the MOTD is nested too deep, or has too many components.
         :returns: :obj:`ParsedMotdComponent` list, which need to be passed to ``__init__``.
         """
-        parsed_motd: list[ParsedMotdComponent] = auto_add if auto_add is not None else []
+        parsed_motd: list[ParsedMotdComponent] = []
+        # The ``extra`` components being walked, with the formatting they inherit, and whether they're on Bedrock
+        stack: list[tuple[t.Iterator[RawJavaResponseMotdWhenDict | str], tuple[ParsedMotdComponent, ...], bool]] = []
+
+        component: RawJavaResponseMotdWhenDict | None = item
+        inherited: tuple[ParsedMotdComponent, ...] = tuple(auto_add) if auto_add is not None else ()
+        while True:
+            if component is not None:
+                parsed_component = cls._parse_component(component, inherited, bedrock=bedrock)
+                parsed_motd.extend(parsed_component)
+                if "extra" in component:
+                    if len(stack) >= cls.MAX_DEPTH:
+                        raise MotdLimitError(f"MOTD is nested deeper than {cls.MAX_DEPTH} levels")
+                    # Shared by all of the children, which only ever copy it
+                    children_inherited = tuple(
+                        e for e in parsed_component if type(e) is Formatting and e is not Formatting.RESET
+                    )
+                    stack.append((iter(component["extra"]), children_inherited, bedrock))
+                if len(parsed_motd) > cls.MAX_COMPONENTS:
+                    raise MotdLimitError(f"MOTD has more than {cls.MAX_COMPONENTS} components")
+
+            # Find the next dict to parse, parsing the strings on the way
+            component = None
+            while stack:
+                extra, inherited, bedrock = stack[-1]
+                for element in extra:
+                    if isinstance(element, dict):
+                        # The bedrock flag was never passed on to the nested dicts, keep the output the same
+                        component, bedrock = element, False
+                        break
+                    parsed_motd.extend(inherited)
+                    parsed_motd.extend(cls._parse_as_str(element, bedrock=bedrock))
+                    if len(parsed_motd) > cls.MAX_COMPONENTS:
+                        raise MotdLimitError(f"MOTD has more than {cls.MAX_COMPONENTS} components")
+                else:  # all of the extra components were parsed
+                    stack.pop()
+                    continue
+                break
+            else:
+                return parsed_motd
+
+    @classmethod
+    def _parse_component(
+        cls,
+        item: RawJavaResponseMotdWhenDict,
+        inherited: tuple[ParsedMotdComponent, ...],
+        *,
+        bedrock: bool,
+    ) -> list[ParsedMotdComponent]:
+        """Parse a single dict component, without its ``extra`` field.
+
+        :param item: The component.
+        :param inherited: The formatting inherited from the parent components.
+        :param bedrock: Is the server Bedrock Edition?
+        :returns: :obj:`ParsedMotdComponent` list, starting with the inherited formatting.
+        """
+        parsed_motd: list[ParsedMotdComponent] = list(inherited)
 
         if (color := item.get("color")) is not None:
             parsed_motd.append(cls._parse_color(color))
 
-        for style_key, style_val in Formatting.__members__.items():
-            lowered_style_key = style_key.lower()
-            if item.get(lowered_style_key) is False:
+        for style_key, style_val in _STYLE_KEYS:
+            if (style := item.get(style_key)) is False:
                 try:
                     parsed_motd.remove(style_val)
                 except ValueError:
                     # some servers set the formatting keys to false here, even without it ever being set to true before
                     continue
-            elif item.get(lowered_style_key) is not None:
+            elif style is not None:
                 parsed_motd.append(style_val)
 
         if (text := item.get("text")) is not None:
@@ -135,16 +271,6 @@ class Motd:
             parsed_motd.append(TranslationTag(translate))
         parsed_motd.append(Formatting.RESET)
 
-        if "extra" in item:
-            auto_add = list(filter(lambda e: type(e) is Formatting and e != Formatting.RESET, parsed_motd))
-
-            for element in item["extra"]:
-                parsed_motd.extend(
-                    cls._parse_as_dict(element, auto_add=auto_add.copy())
-                    if isinstance(element, dict)
-                    else auto_add + cls._parse_as_str(element, bedrock=bedrock)
-                )
-
         return parsed_motd
 
     @staticmethod
@@ -178,23 +304,14 @@ class Motd:
 
         :returns: New simplified MOTD, with any unused elements removed.
         """
-        parsed = self.parsed.copy()
-        old_parsed: list[ParsedMotdComponent] | None = None
-
-        while parsed != old_parsed:
-            old_parsed = parsed.copy()
-            unused_elements = get_unused_elements(parsed)
-            parsed = [el for index, el in enumerate(parsed) if index not in unused_elements]
-
-        parsed = squash_nearby_strings(parsed)
-        return self.__class__(parsed, self.raw, bedrock=self.bedrock)
+        return self.__class__(simplify(self.parsed), self.raw, bedrock=self.bedrock)
 
     def to_plain(self) -> str:
         """Get plain text from a MOTD, without any colors/formatting.
 
         This is just a shortcut to :class:`~mcstatus.motd.transformers.PlainTransformer`.
         """
-        return PlainTransformer().transform(self.parsed)
+        return _plain_transformer.transform(self.parsed)
 
     def to_minecraft(self) -> str:
         """Get Minecraft variant from a MOTD.
@@ -203,14 +320,15 @@ class Motd:
 
         .. note:: This will always use ``§``, even if in original MOTD used ``&``.
         """
-        return MinecraftTransformer().transform(self.parsed)
+        return _minecraft_transformer.transform(self.parsed)
 
     def to_html(self) -> str:
         """Get HTML from a MOTD.
 
         This is just a shortcut to :class:`~mcstatus.motd.transformers.HtmlTransformer`.
         """
-        return HtmlTransformer(bedrock=self.bedrock).transform(self.parsed)
+        transformer = _html_transformers.bedrock if self.bedrock else _html_transformers.java
+        return transformer.transform(self.parsed)
 
     def to_ansi(self) -> str:
         """Get ANSI variant from a MOTD.
@@ -221,4 +339,88 @@ class Motd:
 
         .. seealso:: https://en.wikipedia.org/wiki/ANSI_escape_code
         """
-        return AnsiTransformer().transform(self.parsed)
+        return _ansi_transformer.transform(self.parsed)
+
+
+def _canonical_raw(raw: object) -> t.Hashable:
+    """Convert the raw MOTD into a hashable form, for the key in :data:`cache`.
+
+    Equal MOTDs give equal keys, no matter the order of the keys in their dicts.
+    The types are kept, so e.g. ``{"bold": 1}`` and ``{"bold": True}`` stay apart.
+    """
+    if isinstance(raw, str):
+        return raw
+    if isinstance(raw, dict):
+        return (dict, tuple(sorted((key, _canonical_raw(value)) for key, value in raw.items())))
+    if isinstance(raw, list):
+        return (list, tuple(_canonical_raw(value) for value in raw))
+    return (type(raw), raw)
+
+
+class MotdCache:
+    """Cache of the parsed MOTD components, keyed by their raw MOTD.
+
+    MOTDs repeat a lot, as many servers keep the default one, networks share a single
+    MOTD between all of their servers, and the same server is usually polled over and
+    over again. With the cache, each of them is parsed only once. The components are
+    kept in tuples, which are immutable just like the components themselves, so modifying
+    a :class:`Motd` built from them can't change what the other responses get. The least
+    recently used entries are evicted when the cache is full.
+
+    The shared instance is available as :data:`mcstatus.motd.cache`. It's disabled
+    by default, set its ``max_size`` to enable it.
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        """
+        :param max_size: How many MOTDs to keep at most, ``0`` disables the cache.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        """How many MOTDs were taken from the cache."""
+        self.misses = 0
+        """How many MOTDs had to be parsed."""
+
+        self._entries: OrderedDict[_MotdCacheKey, tuple[ParsedMotdComponent, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of the lookups answered from the cache, ``0`` if there were none yet."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: _MotdCacheKey) -> tuple[ParsedMotdComponent, ...] | None:
+        """Get the cached components, or :obj:`None` if there are none."""
+        with self._lock:
+            parsed = self._entries.get(key)
+            if parsed is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return parsed
+
+    def put(self, key: _MotdCacheKey, parsed: t.Sequence[ParsedMotdComponent]) -> None:
+        """Cache the components (as a tuple)."""
+        with self._lock:
+            if self.max_size <= 0:
+                return
+            self._entries[key] = tuple(parsed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all of the cached MOTDs and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+cache: t.Final = MotdCache()
+"""The :class:`MotdCache` instance used by :meth:`Motd.parse`."""
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing as t
 from collections.abc import Sequence
+from itertools import compress
 
 from mcstatus.motd.components import Formatting, MinecraftColor, ParsedMotdComponent, WebColor
 
@@ -34,25 +35,96 @@ def squash_nearby_strings(parsed: _PARSED_MOTD_COMPONENTS_TYPEVAR) -> _PARSED_MO
     Note that this function doesn't create a copy of passed array, it modifies it.
     This is what those typevars are for in the function signature.
     """
-    # in order to not break indexes, we need to fill values and then remove them after the loop
-    fillers: set[int] = set()
-    for index, item in enumerate(parsed):
-        if not isinstance(item, str):
+    squashed: list[ParsedMotdComponent] = []
+    strings: list[str] = []  # the strings right before the current item, to be joined together
+    for item in parsed:
+        if isinstance(item, str):
+            strings.append(item)
             continue
+        if strings:
+            squashed.append(strings[0] if len(strings) == 1 else "".join(strings))
+            strings = []
+        squashed.append(item)
+    if strings:
+        squashed.append(strings[0] if len(strings) == 1 else "".join(strings))
+
+    parsed[:] = squashed
+    return parsed
 
-        try:
-            next_item = parsed[index + 1]
-        except IndexError:  # Last item (without any next item)
+
+def simplify(parsed: Sequence[ParsedMotdComponent]) -> list[ParsedMotdComponent]:
+    """Remove all of the unused elements, and squash the nearby strings together.
+
+    The result is the same as removing :func:`get_unused_elements` over and over again, until
+    there is nothing left to remove, and squashing the strings with :func:`squash_nearby_strings`.
+    But here, all of the simplifiers run together, in a single pass over the MOTD. Usually, it
+    takes only two passes, one removing the unused elements and one finding out there are no more.
+
+    :param parsed: The MOTD to simplify, it isn't modified.
+    :returns: New simplified MOTD.
+    """
+    parsed = list(parsed)
+    while (keep := _find_used_elements(parsed)) is not None:
+        parsed = list(compress(parsed, keep))
+    return squash_nearby_strings(parsed)
+
+
+def _find_used_elements(parsed: Sequence[ParsedMotdComponent]) -> bytearray | None:
+    """Run all of the simplifiers from :func:`get_unused_elements` together, in one pass.
+
+    :returns: Whether to keep each of the elements, or :obj:`None` if all of them are used.
+    """
+    length = len(parsed)
+    keep = bytearray(b"\x01") * length
+
+    # get_end_non_text
+    last_text = -1
+    for index in range(length - 1, -1, -1):
+        if isinstance(parsed[index], str):
+            last_text = index
             break
 
-        if isinstance(next_item, str):
-            parsed[index + 1] = item + next_item
-            fillers.add(index)
+    prev_color: int | None = None  # get_double_colors
+    collected_formattings: list[int] = []  # get_formatting_before_color
+    active_color: MinecraftColor | WebColor | None = None  # get_meaningless_resets_and_colors
+    active_formatting: Formatting | None = None  # get_meaningless_resets_and_colors
+
+    for index, item in enumerate(parsed):
+        if isinstance(item, str):
+            if not item:  # get_empty_text
+                keep[index] = 0
+            prev_color = None
+            if collected_formattings and not item.isspace():
+                collected_formattings = []
+            continue
 
-    for already_removed, index_to_remove in enumerate(fillers):
-        parsed.pop(index_to_remove - already_removed)
+        if isinstance(item, (MinecraftColor, WebColor)):
+            if index > last_text or (index + 1 < length and item == parsed[index + 1]):
+                keep[index] = 0
+            if prev_color is not None:
+                keep[prev_color] = 0
+            prev_color = index
+            for formatting_index in collected_formattings:
+                keep[formatting_index] = 0
+            collected_formattings = []
+            if active_color == item:
+                keep[index] = 0
+            active_color = item
 
-    return parsed
+        elif isinstance(item, Formatting):
+            if index > last_text or (index + 1 < length and item == parsed[index + 1]):
+                keep[index] = 0
+            collected_formattings.append(index)
+            if item is Formatting.RESET:
+                if active_color is None and active_formatting is None:
+                    keep[index] = 0
+                active_color, active_formatting = None, None
+            else:
+                if active_formatting == item:
+                    keep[index] = 0
+                active_formatting = item
+
+    return keep if 0 in keep else None
 
 
 def get_double_items(parsed: Sequence[ParsedMotdComponent]) -> set[int]:
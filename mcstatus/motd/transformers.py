@@ -17,28 +17,38 @@ class BaseTransformer(abc.ABC, t.Generic[_HOOK_RETURN_TYPE, _END_RESULT_TYPE]):
     of motd, such as one that is able to be printed in the terminal.
     """
 
-    def transform(self, motd_components: Sequence[ParsedMotdComponent]) -> _END_RESULT_TYPE:
-        return self._format_output([handled for component in motd_components for handled in self._handle_component(component)])
+    _HANDLERS: t.ClassVar[dict[type, Callable[[t.Any, t.Any], t.Any]]]
+    """The handler of each component type, bound once per class in :meth:`__init_subclass__`."""
+    _RESET_BEFORE_MINECRAFT_COLOR: t.ClassVar[bool] = True
+    """Whether to handle a :attr:`Formatting.RESET` before each :class:`MinecraftColor`, as those reset formatting."""
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._HANDLERS = {
+            MinecraftColor: cls._handle_minecraft_color,
+            WebColor: cls._handle_web_color,
+            Formatting: cls._handle_formatting,
+            TranslationTag: cls._handle_translation_tag,
+            str: cls._handle_str,
+        }
 
-    @abc.abstractmethod
-    def _format_output(self, results: list[_HOOK_RETURN_TYPE]) -> _END_RESULT_TYPE: ...
+    def transform(self, motd_components: Sequence[ParsedMotdComponent]) -> _END_RESULT_TYPE:
+        handlers = self._HANDLERS
+        reset_before_minecraft_color = self._RESET_BEFORE_MINECRAFT_COLOR
+        results: list[_HOOK_RETURN_TYPE] = []
 
-    def _handle_component(
-        self, component: ParsedMotdComponent
-    ) -> tuple[_HOOK_RETURN_TYPE, _HOOK_RETURN_TYPE] | tuple[_HOOK_RETURN_TYPE]:
-        handler: Callable[[ParsedMotdComponent], _HOOK_RETURN_TYPE] = {
-            MinecraftColor: self._handle_minecraft_color,
-            WebColor: self._handle_web_color,
-            Formatting: self._handle_formatting,
-            TranslationTag: self._handle_translation_tag,
-            str: self._handle_str,
-        }[type(component)]
+        for component in motd_components:
+            component_type = type(component)
+            if component_type is MinecraftColor and reset_before_minecraft_color:
+                reset = self._handle_formatting(Formatting.RESET)
+                if reset is not None:
+                    results.append(reset)
+            results.append(handlers[component_type](self, component))
 
-        additional = None
-        if isinstance(component, MinecraftColor):
-            additional = self._handle_formatting(Formatting.RESET)
+        return self._format_output(results)
 
-        return (additional, handler(component)) if additional is not None else (handler(component),)
+    @abc.abstractmethod
+    def _format_output(self, results: list[_HOOK_RETURN_TYPE]) -> _END_RESULT_TYPE: ...
 
     @abc.abstractmethod
     def _handle_str(self, element: str, /) -> _HOOK_RETURN_TYPE: ...
@@ -87,11 +97,7 @@ class PlainTransformer(NothingTransformer):
 
 
 class MinecraftTransformer(PlainTransformer):
-    def _handle_component(self, component: ParsedMotdComponent) -> tuple[str, str] | tuple[str]:
-        result = super()._handle_component(component)
-        if len(result) == 2:
-            return (result[1],)
-        return result
+    _RESET_BEFORE_MINECRAFT_COLOR = False
 
     def _handle_minecraft_color(self, element: MinecraftColor, /) -> str:
         return "§" + element.value
@@ -0,0 +1,397 @@
+"""Multiplexing of the UDP based protocols over a single socket.
+
+Querying many servers, each over its own socket, is bounded by the amount of file
+descriptors rather than by bandwidth. The classes here instead share one socket
+(per address family) between all of the targets, and route the replies back to
+the right target by their source address.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import itertools
+import socket
+from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from time import perf_counter
+from typing import Final, TYPE_CHECKING, TypeVar, cast
+
+from mcstatus.address import Address
+from mcstatus.bedrock_status import BedrockServerStatus
+from mcstatus.protocol.connection import Connection, UDPAsyncSocketConnection
+from mcstatus.querier import AsyncServerQuerier
+from mcstatus.responses import BedrockStatusResponse, QueryResponse
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+__all__ = ["BedrockScanner", "QueryEngine"]
+
+T = TypeVar("T")
+
+# The unconnected ping from :class:`~mcstatus.bedrock_status.BedrockServerStatus` is:
+# packet ID (1 byte), timestamp (8 bytes), magic (16 bytes), client GUID (8 bytes).
+_UNCONNECTED_PING_ID: Final = BedrockServerStatus.request_status_data[:1]
+_UNCONNECTED_PING_SUFFIX: Final = BedrockServerStatus.request_status_data[9:]
+_UNCONNECTED_PONG: Final = 0x1C
+
+# How many targets the ``*_many`` methods request at the same time, if ``max_in_flight`` isn't set
+_DEFAULT_WORKERS: Final = 1024
+
+# Marks the end of the stream in the queues of :meth:`_MultiplexedEndpoint._request_many`
+_DONE: Final = object()
+
+
+class _DatagramDispatcher(asyncio.DatagramProtocol):
+    """Datagram protocol, which passes every received datagram to a callback."""
+
+    def __init__(self, callback: Callable[[bytes, tuple[str, int]], None]) -> None:
+        self.callback = callback
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self.callback(data, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP errors (like port unreachable) can't be reliably attributed to a target
+        # on a shared socket, affected targets will just time out instead.
+        pass
+
+
+class _MultiplexedEndpoint(ABC):
+    """Base class for sending datagrams to many targets over shared sockets.
+
+    Sockets are bound lazily, one for each address family, the first time
+    a datagram is sent to an address of that family.
+    """
+
+    def __init__(self, timeout: float = 3, retransmits: int = 2, max_in_flight: int | None = None) -> None:
+        """
+        :param timeout: The timeout in seconds for each reply, per target.
+        :param retransmits: How many times to resend a packet which wasn't replied to in time.
+        :param max_in_flight:
+            How many targets can be requested at the same time. Unlimited if :obj:`None`,
+            except for the ``*_many`` methods, which use 1024 workers then.
+        """
+        self.timeout = timeout
+        self.retransmits = retransmits
+        self.max_in_flight = max_in_flight
+        self._semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight is not None else None
+        self._transports: dict[int, asyncio.DatagramTransport] = {}
+        self._transports_lock = asyncio.Lock()
+
+    @abstractmethod
+    def _datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Route a datagram received on any of the shared sockets."""
+        raise NotImplementedError
+
+    async def _get_transport(self, family: int) -> asyncio.DatagramTransport:
+        """Return the transport for given address family, binding its socket if needed."""
+        transport = self._transports.get(family)
+        if transport is not None:
+            return transport
+
+        async with self._transports_lock:
+            if family not in self._transports:
+                local_addr = ("0.0.0.0", 0) if family == socket.AF_INET else ("::", 0)
+                transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                    lambda: _DatagramDispatcher(self._datagram_received),
+                    local_addr=local_addr,
+                    family=family,
+                )
+                self._transports[family] = transport
+            return self._transports[family]
+
+    async def _send(self, data: bytes, addr: Address) -> None:
+        """Send a datagram to ``addr``, which has to be an IP address (not a hostname)."""
+        family = socket.AF_INET if ipaddress.ip_address(addr.host).version == 4 else socket.AF_INET6
+        transport = await self._get_transport(family)
+        transport.sendto(data, (addr.host, addr.port))
+
+    async def _limited(self, request: Callable[[Address], Awaitable[T]], address: Address) -> T:
+        """Run ``request`` on ``address``, while keeping the amount of targets in flight limited."""
+        if self._semaphore is None:
+            return await request(address)
+        async with self._semaphore:
+            return await request(address)
+
+    async def _request_many(
+        self,
+        request: Callable[[Address], Awaitable[T]],
+        addresses: Iterable[Address],
+    ) -> AsyncGenerator[tuple[Address, T | Exception], None]:
+        """Run ``request`` on all of given addresses concurrently, yielding the results as they complete.
+
+        The addresses are requested by a pool of ``max_in_flight`` workers (1024 if it isn't set),
+        and taken from ``addresses`` only as fast as the results are consumed.
+        """
+        workers = self.max_in_flight or _DEFAULT_WORKERS
+        todo: asyncio.Queue[object] = asyncio.Queue(maxsize=workers)
+        results: asyncio.Queue[object] = asyncio.Queue(maxsize=workers)
+
+        async def feed() -> None:
+            try:
+                for address in addresses:
+                    await todo.put(address)
+            except Exception as exc:
+                await results.put(exc)
+            for _ in range(workers):
+                await todo.put(_DONE)
+
+        async def work() -> None:
+            while (address := await todo.get()) is not _DONE:
+                assert isinstance(address, Address)
+                try:
+                    result: T | Exception = await request(address)
+                except Exception as exc:
+                    result = exc
+                await results.put((address, result))
+            await results.put(_DONE)
+
+        tasks = [asyncio.ensure_future(feed())]
+        tasks.extend(asyncio.ensure_future(work()) for _ in range(workers))
+        try:
+            running = workers
+            while running:
+                item = await results.get()
+                if item is _DONE:
+                    running -= 1
+                elif isinstance(item, Exception):  # Failed to iterate the addresses
+                    raise item
+                else:
+                    yield cast("tuple[Address, T | Exception]", item)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _resolve(address: Address) -> Address:
+        """Return ``address`` with its host resolved into an IP address."""
+        ip = await address.async_resolve_ip()
+        return Address(str(ip), address.port)
+
+    def close(self) -> None:
+        """Close all of the shared sockets."""
+        for transport in self._transports.values():
+            transport.close()
+        self._transports.clear()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        self.close()
+
+
+class _MultiplexedQueryConnection(UDPAsyncSocketConnection):
+    """Connection to a single query target, sending and receiving through a :class:`QueryEngine`.
+
+    Replies are matched by the source address, the session ID and the packet type
+    of the last sent packet. When no reply arrives in time, the last sent packet is
+    retransmitted, up to ``retransmits`` times.
+    """
+
+    __slots__ = ("_engine", "_last_sent", "_queue", "_route", "retransmits")
+
+    def __init__(self, engine: QueryEngine, addr: Address, timeout: float = 3, retransmits: int = 2) -> None:
+        super().__init__(addr, timeout)
+        self.retransmits = retransmits
+        self._engine = engine
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue()
+        self._last_sent = b""
+        self._route: tuple[str, int, bytes] | None = None
+
+    async def connect(self) -> None:
+        """Do nothing, the engine's shared socket is used instead."""
+
+    def _receive_datagram(self, data: bytes) -> None:
+        self._queue.put_nowait(data)
+
+    async def read(self, length: int) -> bytearray:
+        """Read the reply to the last sent packet. Length does nothing here."""
+        for attempt in range(self.retransmits + 1):
+            try:
+                while True:
+                    data = await asyncio.wait_for(self._queue.get(), timeout=self.timeout)
+                    # Late replies to retransmitted packets could still arrive, skip them
+                    if data[0] == self._last_sent[2]:
+                        return bytearray(data)
+            except asyncio.TimeoutError:
+                if attempt == self.retransmits:
+                    raise
+                await self._engine._send(self._last_sent, self._addr)
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def write(self, data: Connection | str | bytes | bytearray) -> None:
+        """Send data to the target through the engine, and route the replies to it back here."""
+        if isinstance(data, Connection):
+            data = data.flush()
+        elif isinstance(data, str):
+            data = bytearray(data, "utf-8")
+        data = bytes(data)
+
+        # Every query packet is: magic prefix (2 bytes), packet type (1 byte), session ID (4 bytes), ...
+        self._unroute()
+        self._route = (self._addr.host, self._addr.port, data[3:7])
+        self._engine._routes[self._route] = self
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+        self._last_sent = data
+        await self._engine._send(data, self._addr)
+
+    def _unroute(self) -> None:
+        if self._route is not None and self._engine._routes.get(self._route) is self:
+            del self._engine._routes[self._route]
+        self._route = None
+
+    def close(self) -> None:
+        """Stop receiving replies, the engine's shared socket stays open."""
+        self._unroute()
+
+
+class QueryEngine(_MultiplexedEndpoint):
+    """Engine for querying many servers via the query protocol, over a single UDP socket.
+
+    Use it as an async context manager, so the socket is closed afterwards.
+
+    .. code-block:: python
+
+        async with QueryEngine(timeout=2) as engine:
+            async for address, result in engine.query_many(addresses):
+                ...
+    """
+
+    def __init__(self, timeout: float = 3, retransmits: int = 2, max_in_flight: int | None = None) -> None:
+        """
+        :param timeout: The timeout in seconds for each reply, per target.
+        :param retransmits: How many times to resend a packet which wasn't replied to in time.
+        :param max_in_flight:
+            How many targets can be queried at the same time. Unlimited if :obj:`None`,
+            except for the ``*_many`` methods, which use 1024 workers then.
+        """
+        super().__init__(timeout, retransmits, max_in_flight)
+        self._routes: dict[tuple[str, int, bytes], _MultiplexedQueryConnection] = {}
+
+    def _datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        if len(data) < 5:
+            return
+        # Every reply is: packet type (1 byte), session ID (4 bytes), ...
+        connection = self._routes.get((addr[0], addr[1], data[1:5]))
+        if connection is not None:
+            connection._receive_datagram(data)
+
+    async def query(self, address: Address) -> QueryResponse:
+        """Query a single server. Its host is resolved first, if it isn't an IP address.
+
+        :param address: Address of the server, with its query port.
+        :return: Query information in a :class:`~mcstatus.responses.QueryResponse` instance.
+        """
+        return await self._limited(self._query, address)
+
+    async def _query(self, address: Address) -> QueryResponse:
+        target = await self._resolve(address)
+        connection = _MultiplexedQueryConnection(self, target, self.timeout, self.retransmits)
+        try:
+            querier = AsyncServerQuerier(connection)
+            await querier.handshake()
+            return await querier.read_query()
+        finally:
+            connection.close()
+
+    async def query_many(
+        self, addresses: Iterable[Address]
+    ) -> AsyncGenerator[tuple[Address, QueryResponse | Exception], None]:
+        """Query all of given servers concurrently, yielding the results as they complete.
+
+        :param addresses: Addresses of the servers, with their query ports.
+        :return:
+            An async iterator of tuples with the address and either the query response,
+            or the exception which prevented getting it.
+        """
+        async for result in self._request_many(self.query, addresses):
+            yield result
+
+
+class BedrockScanner(_MultiplexedEndpoint):
+    """Scanner for the status of many Bedrock servers, over a single UDP socket.
+
+    Every target gets a RakNet unconnected ping with a unique timestamp, and the
+    pongs are matched back by their source address and the echoed timestamp.
+    Use it as an async context manager, so the socket is closed afterwards.
+
+    .. code-block:: python
+
+        async with BedrockScanner(timeout=2) as scanner:
+            async for address, result in scanner.status_many(addresses):
+                ...
+    """
+
+    def __init__(self, timeout: float = 3, retransmits: int = 2, max_in_flight: int | None = None) -> None:
+        """
+        :param timeout: The timeout in seconds for each pong, per target.
+        :param retransmits: How many times to resend a ping which wasn't replied to in time.
+        :param max_in_flight:
+            How many targets can be pinged at the same time. Unlimited if :obj:`None`,
+            except for the ``*_many`` methods, which use 1024 workers then.
+        """
+        super().__init__(timeout, retransmits, max_in_flight)
+        self._pending: dict[tuple[str, int, bytes], asyncio.Future[tuple[bytes, float]]] = {}
+        self._timestamps = itertools.count()
+
+    def _datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        # Every unconnected pong is: packet ID (1 byte), echoed ping timestamp (8 bytes), ...
+        if len(data) < 9 or data[0] != _UNCONNECTED_PONG:
+            return
+        future = self._pending.get((addr[0], addr[1], data[1:9]))
+        if future is not None and not future.done():
+            future.set_result((data, perf_counter()))
+
+    async def status(self, address: Address) -> BedrockStatusResponse:
+        """Get the status of a single server. Its host is resolved first, if it isn't an IP address.
+
+        :param address: Address of the server.
+        :return: Status information in a :class:`~mcstatus.responses.BedrockStatusResponse` instance.
+        """
+        return await self._limited(self._status, address)
+
+    async def _status(self, address: Address) -> BedrockStatusResponse:
+        target = await self._resolve(address)
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(self.retransmits + 1):
+            timestamp = next(self._timestamps).to_bytes(8, "big")
+            key = (target.host, target.port, timestamp)
+            future: asyncio.Future[tuple[bytes, float]] = loop.create_future()
+            self._pending[key] = future
+            try:
+                start = perf_counter()
+                await self._send(_UNCONNECTED_PING_ID + timestamp + _UNCONNECTED_PING_SUFFIX, target)
+                data, end = await asyncio.wait_for(future, timeout=self.timeout)
+            except asyncio.TimeoutError:
+                if attempt == self.retransmits:
+                    raise
+                continue
+            finally:
+                del self._pending[key]
+
+            return BedrockServerStatus.parse_response(data, (end - start) * 1000)
+
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def status_many(
+        self,
+        addresses: Iterable[Address],
+    ) -> AsyncGenerator[tuple[Address, BedrockStatusResponse | Exception], None]:
+        """Get the status of all of given servers concurrently, yielding the results as they complete.
+
+        :param addresses: Addresses of the servers.
+        :return:
+            An async iterator of tuples with the address and either the status response,
+            or the exception which prevented getting it.
+        """
+        async for result in self._request_many(self.status, addresses):
+            yield result
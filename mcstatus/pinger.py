@@ -1,17 +1,92 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 import json
 import random
+import struct
 from time import perf_counter
-from typing import final
+from typing import Any, Final, TYPE_CHECKING, final
 
 from mcstatus.address import Address
 from mcstatus.protocol.connection import Connection, TCPAsyncSocketConnection, TCPSocketConnection
 from mcstatus.responses import JavaStatusResponse, RawJavaResponse
 
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+JSONDecoder: TypeAlias = "Callable[[memoryview], Any]"
+"""Decodes JSON from a view of its ``UTF-8`` bytes, raising :exc:`ValueError` on invalid input."""
+
+
+# Pre-encoded (length prefixed) request frames, the status request never changes,
+# and the ping request only needs its token appended
+_STATUS_REQUEST_FRAME: Final = bytes.fromhex("0100")
+_PING_REQUEST_HEADER: Final = bytes.fromhex("0901")
+
+
+@lru_cache(maxsize=1024)
+def _encode_handshake(host: str, port: int, version: int) -> bytes:
+    """Encode the handshake packet into a length prefixed frame.
+
+    The result is cached, so servers polled repeatedly only have their handshake encoded once.
+    """
+    packet = Connection()
+    packet.write_varint(0)
+    packet.write_varint(version)
+    packet.write_utf(host)
+    packet.write_ushort(port)
+    packet.write_varint(1)  # Intention to query status
+
+    frame = Connection()
+    frame.write_buffer(packet)
+    return bytes(frame.flush())
+
+
+def _stdlib_json_decoder(data: memoryview) -> Any:  # noqa: ANN401
+    return json.loads(str(data, "utf8"))
+
+
+def _default_json_decoder() -> JSONDecoder:
+    """Pick the fastest JSON decoder installed, out of ``orjson``, ``msgspec`` and the standard library."""
+    try:
+        import orjson  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        pass
+    else:
+        return orjson.loads
+
+    try:
+        import msgspec  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        pass
+    else:
+
+        def msgspec_json_decoder(data: memoryview) -> Any:  # noqa: ANN401
+            try:
+                return msgspec.json.decode(data)
+            except msgspec.DecodeError as exc:
+                raise ValueError(str(exc)) from exc
+
+        return msgspec_json_decoder
+
+    return _stdlib_json_decoder
+
+
+json_decoder: JSONDecoder = _default_json_decoder()
+"""The decoder of the JSON status responses.
+
+Defaults to ``orjson`` or ``msgspec`` (if installed), which are a lot faster than the standard library
+on big responses (like modpacks with hundreds of mods). Replace it to plug in a different decoder.
+"""
+
+
+def _encode_ping_request(ping_token: int) -> bytes:
+    """Encode the ping request packet with given token into a length prefixed frame."""
+    return _PING_REQUEST_HEADER + struct.pack(">q", ping_token)
+
 
 @dataclass
 class _BaseServerPinger(ABC):
@@ -19,17 +94,28 @@ class _BaseServerPinger(ABC):
     address: Address
     version: int = 47
     ping_token: int = field(default_factory=lambda: random.randint(0, (1 << 63) - 1))
-
-    def handshake(self) -> None:
-        """Writes the initial handshake packet to the connection."""
-        packet = Connection()
-        packet.write_varint(0)
-        packet.write_varint(self.version)
-        packet.write_utf(self.address.host)
-        packet.write_ushort(self.address.port)
-        packet.write_varint(1)  # Intention to query status
-
-        self.connection.write_buffer(packet)
+    lazy: bool = False
+    _deferred: bytes = field(init=False, repr=False, default=b"")
+
+    def handshake(self, *, defer: bool = False) -> None:
+        """Writes the initial handshake packet to the connection.
+
+        :param defer:
+            Instead of sending the handshake right away, keep it and send it
+            together with the next request, in a single write.
+        """
+        frame = _encode_handshake(self.address.host, self.address.port, self.version)
+        if defer:
+            self._deferred += frame
+        else:
+            self.connection.write(frame)
+
+    def _write_request(self, frame: bytes) -> None:
+        """Write the request frame, along with the deferred handshake (if any), in a single write."""
+        if self._deferred:
+            frame = self._deferred + frame
+            self._deferred = b""
+        self.connection.write(frame)
 
     @abstractmethod
     def read_status(self) -> JavaStatusResponse | Awaitable[JavaStatusResponse]:
@@ -46,13 +132,14 @@ class _BaseServerPinger(ABC):
         if response.read_varint() != 0:
             raise IOError("Received invalid status response packet.")
         try:
-            raw: RawJavaResponse = json.loads(response.read_utf())
+            with response.read_utf_view() as data:
+                raw: RawJavaResponse = json_decoder(data)
         except ValueError:
             raise IOError("Received invalid JSON")
 
         try:
             latency_ms = (end - start) * 1000
-            return JavaStatusResponse.build(raw, latency=latency_ms)
+            return JavaStatusResponse.build(raw, latency=latency_ms, lazy=self.lazy)
         except KeyError as e:
             raise IOError(f"Received invalid status response: {e!r}")
 
@@ -73,9 +160,7 @@ class ServerPinger(_BaseServerPinger):
 
     def read_status(self) -> JavaStatusResponse:
         """Send the status request and read the response."""
-        request = Connection()
-        request.write_varint(0)  # Request status
-        self.connection.write_buffer(request)
+        self._write_request(_STATUS_REQUEST_FRAME)
 
         start = perf_counter()
         response = self.connection.read_buffer()
@@ -84,11 +169,9 @@ class ServerPinger(_BaseServerPinger):
 
     def test_ping(self) -> float:
         """Send a ping token and measure the latency."""
-        request = Connection()
-        request.write_varint(1)  # Test ping
-        request.write_long(self.ping_token)
+        request = _encode_ping_request(self.ping_token)
         start = perf_counter()
-        self.connection.write_buffer(request)
+        self._write_request(request)
 
         response = self.connection.read_buffer()
         end = perf_counter()
@@ -102,9 +185,7 @@ class AsyncServerPinger(_BaseServerPinger):
 
     async def read_status(self) -> JavaStatusResponse:
         """Send the status request and read the response."""
-        request = Connection()
-        request.write_varint(0)  # Request status
-        self.connection.write_buffer(request)
+        self._write_request(_STATUS_REQUEST_FRAME)
 
         start = perf_counter()
         response = await self.connection.read_buffer()
@@ -113,11 +194,9 @@ class AsyncServerPinger(_BaseServerPinger):
 
     async def test_ping(self) -> float:
         """Send a ping token and measure the latency."""
-        request = Connection()
-        request.write_varint(1)  # Test ping
-        request.write_long(self.ping_token)
+        request = _encode_ping_request(self.ping_token)
         start = perf_counter()
-        self.connection.write_buffer(request)
+        self._write_request(request)
 
         response = await self.connection.read_buffer()
         end = perf_counter()
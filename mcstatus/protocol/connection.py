@@ -4,6 +4,7 @@ import asyncio
 import errno
 import socket
 import struct
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from ctypes import c_int32 as signed_int32
@@ -11,11 +12,13 @@ from ctypes import c_int64 as signed_int64
 from ctypes import c_uint32 as unsigned_int32
 from ctypes import c_uint64 as unsigned_int64
 from ipaddress import ip_address
-from typing import TYPE_CHECKING, cast
+from typing import Final, TYPE_CHECKING, cast
 
 import asyncio_dgram
 
-from mcstatus.address import Address
+import dns.exception
+
+from mcstatus.address import Address, _async_connect_fastest, _async_resolve_ips, _connect_fastest, _resolve_ips
 
 if TYPE_CHECKING:
     from typing_extensions import Self, SupportsIndex, TypeAlias
@@ -127,10 +130,15 @@ class BaseWriteSync(ABC):
         self.write(self._pack("?", value))
 
     def write_buffer(self, buffer: "Connection") -> None:
-        """Flush buffer, then write a varint of the length of the buffer's data, then write buffer data."""
+        """Flush buffer, then write a varint of the length of the buffer's data, then write buffer data.
+
+        The length and the data are written together, in a single :meth:`.write` call.
+        """
         data = buffer.flush()
-        self.write_varint(len(data))
-        self.write(data)
+        frame = Connection()
+        frame.write_varint(len(data))
+        frame.write(data)
+        self.write(frame.flush())
 
 
 class BaseWriteAsync(ABC):
@@ -223,10 +231,15 @@ class BaseWriteAsync(ABC):
         await self.write(self._pack("?", value))
 
     async def write_buffer(self, buffer: "Connection") -> None:
-        """Flush buffer, then write a varint of the length of the buffer's data, then write buffer data."""
+        """Flush buffer, then write a varint of the length of the buffer's data, then write buffer data.
+
+        The length and the data are written together, in a single :meth:`.write` call.
+        """
         data = buffer.flush()
-        await self.write_varint(len(data))
-        await self.write(data)
+        frame = Connection()
+        frame.write_varint(len(data))
+        frame.write(data)
+        await self.write(frame.flush())
 
 
 class BaseReadSync(ABC):
@@ -455,21 +468,92 @@ class BaseAsyncConnection(BaseConnection, BaseReadAsync, BaseWriteAsync):
 
 
 class Connection(BaseSyncConnection):
-    """Base connection class."""
+    """Base connection class.
+
+    Received data is consumed by moving a read cursor forward, rather than by cutting
+    the read bytes off the buffer, so a read never copies the data that comes after it.
+    """
 
-    __slots__ = ("received", "sent")
+    __slots__ = ("_buffer", "_position", "sent")
 
     def __init__(self) -> None:
         self.sent = bytearray()
-        self.received = bytearray()
+        self._buffer = bytearray()
+        self._position = 0
+
+    @property
+    def received(self) -> memoryview:
+        """Data which was received, but not read yet.
+
+        This is a :class:`memoryview` into the internal buffer, not a copy of it.
+        """
+        return memoryview(self._buffer)[self._position :]
+
+    @received.setter
+    def received(self, value: BytesConvertable | bytearray) -> None:
+        self._buffer = bytearray(value)
+        self._position = 0
+
+    def _read_view(self, length: int) -> memoryview:
+        """Return a view of the next ``length`` bytes of :attr:`.received`, and move the read cursor past them."""
+        start = self._position
+        end = start + length
+        if len(self._buffer) < end:
+            raise IOError(f"Not enough data to read! {len(self._buffer) - start} < {length}")
+
+        self._position = end
+        return memoryview(self._buffer)[start:end]
 
     def read(self, length: int) -> bytearray:
-        """Return :attr:`.received` up to length bytes, then cut received up to that point."""
-        if len(self.received) < length:
-            raise IOError(f"Not enough data to read! {len(self.received)} < {length}")
+        """Return :attr:`.received` up to length bytes, then move the read cursor past them."""
+        return bytearray(self._read_view(length))
+
+    def read_varint(self) -> int:
+        """Read varint from ``self`` and return it.
+
+        :param value: Maximum is ``2 ** 31 - 1``, minimum is ``-(2 ** 31)``.
+        :raises IOError: If varint received is out of range.
+        """
+        buffer = self._buffer
+        result = 0
+        for i in range(5):
+            if self._position >= len(buffer):
+                raise IOError("Not enough data to read! 0 < 1")
+            part = buffer[self._position]
+            self._position += 1
+            result |= (part & 0x7F) << (7 * i)
+            if not part & 0x80:
+                return signed_int32(result).value
+        raise IOError("Received varint is too big!")
+
+    def read_utf(self) -> str:
+        """Read up to 32767 bytes by reading a varint, then decode bytes as ``UTF-8``."""
+        length = self.read_varint()
+        return str(self._read_view(length), "utf8")
+
+    def read_utf_view(self) -> memoryview:
+        """Like :meth:`.read_utf`, but return a view of the raw ``UTF-8`` bytes instead of decoding them.
+
+        Nothing is copied here. Release the view before receiving more data into this connection.
+        """
+        length = self.read_varint()
+        return self._read_view(length)
 
-        result = self.received[:length]
-        self.received = self.received[length:]
+    def read_ascii(self) -> str:
+        """Read ``self`` until last value is not zero, then return that decoded with ``ISO-8859-1``"""
+        end = self._buffer.find(0, self._position)
+        if end == -1:
+            raise IOError(f"Not enough data to read! {self.remaining()} bytes without a null terminator")
+
+        result = str(memoryview(self._buffer)[self._position : end], "ISO-8859-1")
+        self._position = end + 1
+        return result
+
+    def read_buffer(self) -> Connection:
+        """Read a varint for length, then return a new connection from length read bytes."""
+        length = self.read_varint()
+        result = Connection()
+        result._buffer = self.read(length)
         return result
 
     def write(self, data: Connection | str | bytearray | bytes) -> None:
@@ -484,11 +568,21 @@ class Connection(BaseSyncConnection):
         """Extend :attr:`.received` with ``data``."""
         if not isinstance(data, bytearray):
             data = bytearray(data)
-        self.received.extend(data)
+
+        if self._position:
+            # Drop the already read data. This rebinds the buffer instead of resizing it in place,
+            # so views returned from :attr:`.received` stay valid.
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
+
+        try:
+            self._buffer.extend(data)
+        except BufferError:  # A view from :attr:`.received` is still alive, the buffer can't be resized
+            self._buffer = self._buffer + data
 
     def remaining(self) -> int:
         """Return length of :attr:`.received`."""
-        return len(self.received)
+        return len(self._buffer) - self._position
 
     def flush(self) -> bytearray:
         """Return :attr:`.sent`, also clears :attr:`.sent`."""
@@ -503,6 +597,53 @@ class Connection(BaseSyncConnection):
         return new
 
 
+class BufferPool:
+    """Pool of reusable receive buffers, which can be shared across connections.
+
+    Connections take a buffer from the pool for the duration of a single receive
+    and return it right after, so the pool only ever holds as many buffers as there
+    were concurrent receives (up to ``max_buffers``).
+    """
+
+    __slots__ = ("_buffers", "buffer_size", "max_buffers")
+
+    def __init__(self, buffer_size: int = 65535, max_buffers: int = 16) -> None:
+        """
+        :param buffer_size: Size of the buffers in bytes, the largest amount of data a single receive can get.
+        :param max_buffers: How many released buffers to keep around, extra buffers are left for garbage collection.
+        """
+        self.buffer_size = buffer_size
+        self.max_buffers = max_buffers
+        self._buffers: list[bytearray] = []
+
+    def acquire(self) -> bytearray:
+        """Take a buffer from the pool, or allocate a new one if the pool is empty."""
+        try:
+            # list.pop and list.append are atomic, so the pool can be shared across threads
+            return self._buffers.pop()
+        except IndexError:
+            return bytearray(self.buffer_size)
+
+    def release(self, buffer: bytearray) -> None:
+        """Return a buffer taken by :meth:`.acquire` to the pool."""
+        if len(self._buffers) < self.max_buffers:
+            self._buffers.append(buffer)
+
+
+#: Buffer pool used by :class:`UDPSocketConnection` when no other pool is given.
+DEFAULT_BUFFER_POOL: Final = BufferPool()
+
+
+#: How long in seconds :class:`TCPSocketConnection` and :class:`TCPAsyncSocketConnection` wait for
+#: a connection to one IP of the server, before also trying the next one (the "Connection Attempt Delay"
+#: recommended by :rfc:`8305`).
+DEFAULT_HAPPY_EYEBALLS_DELAY: Final = 0.25
+
+# The share of the connect timeout the DNS queries for the IPs to race may take. If the DNS doesn't
+# answer in time, the rest of the timeout is left for the system resolver (which also knows the hosts file)
+_DNS_TIMEOUT_SHARE: Final = 0.5
+
+
 class SocketConnection(BaseSyncConnection):
     """Socket connection."""
 
@@ -530,43 +671,115 @@ class SocketConnection(BaseSyncConnection):
         self.close()
 
 
+def _cached_ips(addr: tuple[str | None, int]) -> list[str]:
+    """Get the IPs already resolved for an :class:`Address` (if any), in the order to try them."""
+    ips = getattr(addr, "_cached_ips", None)
+    if ips:
+        return [str(ip) for ip in ips]
+    ip = getattr(addr, "_cached_ip", None)
+    return [] if ip is None else [str(ip)]
+
+
+def _ips_to_connect(addr: tuple[str | None, int], timeout: float) -> list[str]:
+    """Get the IPs of the address to connect to, in the order to try them.
+
+    Unless they were already resolved, the AAAA and A records of the host are resolved, with
+    :data:`_DNS_TIMEOUT_SHARE` of the timeout. Names which the DNS doesn't answer in time or
+    doesn't know about (like the ones from the hosts file) are left for the system to resolve,
+    for those (and for no host) this returns no IPs.
+    """
+    ips = _cached_ips(addr)
+    if ips or addr[0] is None:
+        return ips
+    try:
+        return _resolve_ips(addr[0], lifetime=timeout * _DNS_TIMEOUT_SHARE)[0]
+    except dns.exception.DNSException:
+        return []
+
+
+async def _async_ips_to_connect(addr: tuple[str | None, int], timeout: float) -> list[str]:
+    """Asynchronous alternative to :func:`._ips_to_connect`."""
+    ips = _cached_ips(addr)
+    if ips or addr[0] is None:
+        return ips
+    try:
+        return (await _async_resolve_ips(addr[0], lifetime=timeout * _DNS_TIMEOUT_SHARE))[0]
+    except dns.exception.DNSException:
+        return []
+
+
 class TCPSocketConnection(SocketConnection):
-    """TCP Connection to address. Timeout defaults to 3 seconds."""
+    """TCP Connection to address. Timeout defaults to 3 seconds.
+
+    If the host has several IPs (like an IPv6 and an IPv4 one), the connections to them are
+    raced as described in :rfc:`8305`, so a broken IPv6 setup doesn't hold up the connection.
+    Resolving the IPs and connecting share the timeout, so connecting never takes longer than that.
+    If the DNS doesn't answer quickly, the system resolver is used for the rest of the timeout instead.
+    """
 
     __slots__ = ()
 
-    def __init__(self, addr: tuple[str | None, int], timeout: float = 3):
+    def __init__(
+        self,
+        addr: tuple[str | None, int],
+        timeout: float = 3,
+        *,
+        happy_eyeballs_delay: float = DEFAULT_HAPPY_EYEBALLS_DELAY,
+    ):
+        """
+        :param addr: Address to connect to.
+        :param timeout: The timeout in seconds for connecting, and for every receive.
+        :param happy_eyeballs_delay: How long in seconds to wait for a connection to one IP, before also trying the next one.
+        """
         super().__init__()
-        self.socket = socket.create_connection(addr, timeout=timeout)
+        deadline = time.monotonic() + timeout
+        host, port = addr
+        ips = _ips_to_connect(addr, timeout)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Timed out while resolving the IPs of the server")
+        if len(ips) > 1:
+            self.socket, _ = _connect_fastest([(ip, port) for ip in ips], remaining, happy_eyeballs_delay)
+        else:
+            self.socket = socket.create_connection((ips[0] if ips else host, port), timeout=remaining)
+        self.socket.settimeout(timeout)
         self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     def read(self, length: int) -> bytearray:
         """Return length bytes read from :attr:`.socket`. Raises :exc:`IOError` when server doesn't respond."""
-        result = bytearray()
-        while len(result) < length:
-            new = self.socket.recv(length - len(result))
-            if len(new) == 0:
+        result = bytearray(length)
+        view = memoryview(result)
+        received = 0
+        while received < length:
+            new = self.socket.recv_into(view[received:], length - received)
+            if new == 0:
                 raise IOError("Server did not respond with any information!")
-            result.extend(new)
+            received += new
         return result
 
     def write(self, data: Connection | str | bytes | bytearray) -> None:
-        """Send data on :attr:`.socket`."""
+        """Send all of the data on :attr:`.socket`."""
         if isinstance(data, Connection):
             data = bytearray(data.flush())
         elif isinstance(data, str):
             data = bytearray(data, "utf-8")
-        self.socket.send(data)
+        self.socket.sendall(data)
 
 
 class UDPSocketConnection(SocketConnection):
     """UDP Connection class"""
 
-    __slots__ = ("addr",)
+    __slots__ = ("addr", "buffer_pool")
 
-    def __init__(self, addr: Address, timeout: float = 3):
+    def __init__(self, addr: Address, timeout: float = 3, buffer_pool: BufferPool = DEFAULT_BUFFER_POOL):
+        """
+        :param addr: Address to send the data to.
+        :param timeout: The timeout in seconds for every receive.
+        :param buffer_pool: Pool from which the datagrams are received into.
+        """
         super().__init__()
         self.addr = addr
+        self.buffer_pool = buffer_pool
         self.socket = socket.socket(
             socket.AF_INET if ip_type(addr[0]) == 4 else socket.AF_INET6,
             socket.SOCK_DGRAM,
@@ -578,11 +791,19 @@ class UDPSocketConnection(SocketConnection):
         return 65535
 
     def read(self, length: int) -> bytearray:
-        """Return up to :meth:`.remaining` bytes. Length does nothing here."""
-        result = bytearray()
-        while len(result) == 0:
-            result.extend(self.socket.recvfrom(self.remaining())[0])
-        return result
+        """Return up to :meth:`.remaining` bytes. Length does nothing here.
+
+        The datagram is received into a buffer from :attr:`.buffer_pool`,
+        and only the received part of it is copied out.
+        """
+        buffer = self.buffer_pool.acquire()
+        try:
+            received = 0
+            while received == 0:
+                received = self.socket.recvfrom_into(buffer)[0]
+            return buffer[:received]
+        finally:
+            self.buffer_pool.release(buffer)
 
     def write(self, data: Connection | str | bytes | bytearray) -> None:
         """Use :attr:`.socket` to send data to :attr:`.addr`."""
@@ -596,26 +817,57 @@ class UDPSocketConnection(SocketConnection):
 class TCPAsyncSocketConnection(BaseAsyncReadSyncWriteConnection):
     """Asynchronous TCP Connection class"""
 
-    __slots__ = ("_addr", "reader", "timeout", "writer")
+    __slots__ = ("_addr", "_buffered", "happy_eyeballs_delay", "reader", "timeout", "writer")
 
-    def __init__(self, addr: Address, timeout: float = 3) -> None:
+    #: How many bytes to ask :attr:`.reader` for at once, when reading a frame.
+    READ_CHUNK_SIZE = 2**16
+
+    def __init__(
+        self,
+        addr: Address,
+        timeout: float = 3,
+        *,
+        happy_eyeballs_delay: float = DEFAULT_HAPPY_EYEBALLS_DELAY,
+    ) -> None:
         # These will only be None until connect is called, ignore the None type assignment
         self.reader: asyncio.StreamReader = None  # type: ignore[assignment]
         self.writer: asyncio.StreamWriter = None  # type: ignore[assignment]
         self.timeout: float = timeout
+        self.happy_eyeballs_delay = happy_eyeballs_delay
         self._addr = addr
+        # Data pulled from the reader while reading a frame, which belongs to the next reads
+        self._buffered = bytearray()
 
     async def connect(self) -> None:
-        """Use :mod:`asyncio` to open a connection to address. Timeout is in seconds."""
-        conn = asyncio.open_connection(*self._addr)
-        self.reader, self.writer = await asyncio.wait_for(conn, timeout=self.timeout)
+        """Use :mod:`asyncio` to open a connection to address. Timeout is in seconds.
+
+        Same as with :class:`TCPSocketConnection`, the connections to the IPs of the host are raced,
+        and resolving the IPs shares the timeout with connecting.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        host, port = self._addr
+        try:
+            # The queries have a lifetime already, this makes sure that a slow event loop can't stretch it either
+            ips = await asyncio.wait_for(_async_ips_to_connect(self._addr, self.timeout), self.timeout * _DNS_TIMEOUT_SHARE)
+        except asyncio.TimeoutError:
+            ips = []
+        remaining = deadline - loop.time()
+        if len(ips) > 1:
+            self.reader, self.writer, _ = await _async_connect_fastest(
+                [(ip, port) for ip in ips], remaining, self.happy_eyeballs_delay
+            )
+        else:
+            conn = asyncio.open_connection(ips[0] if ips else host, port)
+            self.reader, self.writer = await asyncio.wait_for(conn, timeout=remaining)
         if self.writer is not None:  # it might be None in unittest
             sock: socket.socket = self.writer.transport.get_extra_info("socket")
             sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     async def read(self, length: int) -> bytearray:
         """Read up to ``length`` bytes from :attr:`.reader`."""
-        result = bytearray()
+        result = self._buffered[:length]
+        del self._buffered[:length]
         while len(result) < length:
             new = await asyncio.wait_for(self.reader.read(length - len(result)), timeout=self.timeout)
             if len(new) == 0:
@@ -623,6 +875,55 @@ class TCPAsyncSocketConnection(BaseAsyncReadSyncWriteConnection):
             result.extend(new)
         return result
 
+    async def read_buffer(self) -> Connection:
+        """Read a varint for length, then return a new connection from length read bytes.
+
+        The whole frame is read under a single timeout. Instead of awaiting each byte of the
+        length varint, everything :attr:`.reader` already has is pulled into an internal buffer,
+        and the frame is decoded from there.
+        """
+        return await asyncio.wait_for(self._read_frame(), timeout=self.timeout)
+
+    async def _read_frame(self) -> Connection:
+        """Pull data from :attr:`.reader` until a whole length-prefixed frame is buffered, then return it."""
+        while True:
+            header = self._buffered_frame_header()
+            if header is not None and len(self._buffered) >= sum(header):
+                break
+
+            missing = 1 if header is None else sum(header) - len(self._buffered)
+            new = await self.reader.read(max(missing, self.READ_CHUNK_SIZE))
+            if len(new) == 0:
+                raise IOError("Socket did not respond with any information!")
+            self._buffered.extend(new)
+
+        start, length = header
+        result = Connection()
+        result.receive(self._buffered[start : start + length])
+        del self._buffered[: start + length]
+        return result
+
+    def _buffered_frame_header(self) -> tuple[int, int] | None:
+        """Decode the length varint at the start of the internal buffer.
+
+        :return:
+            A tuple of the frame's start (the size of the varint) and the frame's length,
+            or :obj:`None` if the varint isn't fully buffered yet.
+        :raises IOError: If the varint is out of range, or the length is negative.
+        """
+        result = 0
+        for i in range(min(len(self._buffered), 5)):
+            part = self._buffered[i]
+            result |= (part & 0x7F) << (7 * i)
+            if not part & 0x80:
+                length = signed_int32(result).value
+                if length < 0:
+                    raise IOError(f"Received invalid frame length: {length}")
+                return i + 1, length
+        if len(self._buffered) >= 5:
+            raise IOError("Received varint is too big!")
+        return None
+
     def write(self, data: Connection | str | bytes | bytearray) -> None:
         """Write data to :attr:`.writer`."""
         if isinstance(data, Connection):
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
-from typing import Any, Literal, TYPE_CHECKING
+from typing import Any, ClassVar, Literal, TYPE_CHECKING
 
 from mcstatus.forge_data import ForgeData, RawForgeData
 from mcstatus.motd import Motd
@@ -163,35 +163,75 @@ class JavaStatusResponse(BaseStatusResponse):
     forge_data: ForgeData | None
     """Forge mod data (mod list, channels, etc). Only present if this is a forge (modded) server."""
 
+    _LAZY_FIELDS: ClassVar[frozenset[str]] = frozenset({"motd", "icon", "forge_data"})
+
     @classmethod
-    def build(cls, raw: RawJavaResponse, latency: float = 0) -> Self:
+    def build(cls, raw: RawJavaResponse, latency: float = 0, *, lazy: bool = False) -> Self:
         """Build JavaStatusResponse and check is it valid.
 
         :param raw: Raw response :class:`dict`.
         :param latency: Time that server took to response (in milliseconds).
+        :param lazy:
+            Decode :attr:`.motd`, :attr:`.icon`, :attr:`.forge_data` and
+            :attr:`players.sample <mcstatus.responses.JavaStatusPlayers.sample>` only once they're
+            first accessed, instead of right away. That saves most of the work if you don't need
+            them, but any errors in those fields will only be raised on the access.
         :raise ValueError: If the required keys (``players``, ``version``, ``description``) are not present.
         :raise TypeError:
             If the required keys (``players`` - :class:`dict`, ``version`` - :class:`dict`,
             ``description`` - :class:`str`) are not of the expected type.
         :return: :class:`JavaStatusResponse` object.
         """
-        forge_data: ForgeData | None = None
-        if "forgeData" in raw or "modinfo" in raw:
-            raw_forge = raw.get("forgeData") or raw.get("modinfo")
-            assert raw_forge is not None
-            forge_data = ForgeData.build(raw_forge)
+        players = JavaStatusPlayers.build(raw["players"], lazy=lazy)
+        version = JavaStatusVersion.build(raw["version"])
+
+        if lazy:
+            # Leave out the lazy fields, __getattr__ decodes them once they're accessed
+            self = cls.__new__(cls)
+            object.__setattr__(self, "raw", raw)
+            object.__setattr__(self, "players", players)
+            object.__setattr__(self, "version", version)
+            object.__setattr__(self, "enforces_secure_chat", raw.get("enforcesSecureChat"))
+            object.__setattr__(self, "latency", latency)
+            return self
 
         return cls(
             raw=raw,
-            players=JavaStatusPlayers.build(raw["players"]),
-            version=JavaStatusVersion.build(raw["version"]),
-            motd=Motd.parse(raw.get("description", ""), bedrock=False),
+            players=players,
+            version=version,
+            motd=cls._decode_motd(raw),
             enforces_secure_chat=raw.get("enforcesSecureChat"),
-            icon=raw.get("favicon"),
+            icon=cls._decode_icon(raw),
             latency=latency,
-            forge_data=forge_data,
+            forge_data=cls._decode_forge_data(raw),
         )
 
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        # Only called for the attributes which aren't set, like the fields left out by ``build(lazy=True)``
+        raw = self.__dict__.get("raw")
+        if name not in self._LAZY_FIELDS or raw is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        value = getattr(self, f"_decode_{name}")(raw)
+        object.__setattr__(self, name, value)
+        return value
+
+    @staticmethod
+    def _decode_motd(raw: RawJavaResponse) -> Motd:
+        return Motd.parse(raw.get("description", ""), bedrock=False)
+
+    @staticmethod
+    def _decode_icon(raw: RawJavaResponse) -> str | None:
+        return raw.get("favicon")
+
+    @staticmethod
+    def _decode_forge_data(raw: RawJavaResponse) -> ForgeData | None:
+        if "forgeData" in raw or "modinfo" in raw:
+            raw_forge = raw.get("forgeData") or raw.get("modinfo")
+            assert raw_forge is not None
+            return ForgeData.build(raw_forge)
+        return None
+
 
 @dataclass(frozen=True)
 class BedrockStatusResponse(BaseStatusResponse):
@@ -266,25 +306,47 @@ class JavaStatusPlayers(BaseStatusPlayers):
     """
 
     @classmethod
-    def build(cls, raw: RawJavaResponsePlayers) -> Self:
+    def build(cls, raw: RawJavaResponsePlayers, *, lazy: bool = False) -> Self:
         """Build :class:`JavaStatusPlayers` from raw response :class:`dict`.
 
         :param raw: Raw response :class:`dict`.
+        :param lazy: Decode the :attr:`.sample` only once it's first accessed.
         :raise ValueError: If the required keys (``online``, ``max``) are not present.
         :raise TypeError:
             If the required keys (``online`` - :class:`int`, ``max`` - :class:`int`,
             ``sample`` - :class:`list`) are not of the expected type.
         :return: :class:`JavaStatusPlayers` object.
         """
-        sample = None
-        if "sample" in raw:
-            sample = [JavaStatusPlayer.build(player) for player in raw["sample"]]
+        if lazy:
+            # Leave out the sample, __getattr__ decodes it once it's accessed
+            self = cls.__new__(cls)
+            object.__setattr__(self, "online", raw["online"])
+            object.__setattr__(self, "max", raw["max"])
+            object.__setattr__(self, "_raw", raw)
+            return self
+
         return cls(
             online=raw["online"],
             max=raw["max"],
-            sample=sample,
+            sample=cls._decode_sample(raw),
         )
 
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        # Only called for the attributes which aren't set, like the sample left out by ``build(lazy=True)``
+        raw = self.__dict__.get("_raw")
+        if name != "sample" or raw is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        sample = self._decode_sample(raw)
+        object.__setattr__(self, "sample", sample)
+        return sample
+
+    @staticmethod
+    def _decode_sample(raw: RawJavaResponsePlayers) -> list[JavaStatusPlayer] | None:
+        if "sample" in raw:
+            return [JavaStatusPlayer.build(player) for player in raw["sample"]]
+        return None
+
 
 @dataclass(frozen=True)
 class BedrockStatusPlayers(BaseStatusPlayers):
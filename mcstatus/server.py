@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
-from mcstatus.address import Address, async_minecraft_srv_address_lookup, minecraft_srv_address_lookup
+from mcstatus.address import (
+    Address,
+    async_fastest_address_lookup,
+    async_minecraft_srv_address_lookup,
+    fastest_address_lookup,
+    minecraft_srv_address_lookup,
+)
 from mcstatus.bedrock_status import BedrockServerStatus
 from mcstatus.pinger import AsyncServerPinger, ServerPinger
 from mcstatus.protocol.connection import (
+    DEFAULT_HAPPY_EYEBALLS_DELAY,
     TCPAsyncSocketConnection,
     TCPSocketConnection,
     UDPAsyncSocketConnection,
@@ -14,9 +23,11 @@ from mcstatus.protocol.connection import (
 )
 from mcstatus.querier import AsyncServerQuerier, QueryResponse, ServerQuerier
 from mcstatus.responses import BedrockStatusResponse, JavaStatusResponse
-from mcstatus.utils import retry
+from mcstatus.utils import is_connect_retryable, retry, within_budget
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from typing_extensions import Self
 
 
@@ -59,6 +70,13 @@ class JavaServer(MCServer):
 
     DEFAULT_PORT = 25565
 
+    happy_eyeballs_delay: float = DEFAULT_HAPPY_EYEBALLS_DELAY
+    """How long in seconds to wait for a connection to one IP of the server, before also trying the next one.
+
+    Servers with both IPv6 and IPv4 addresses are connected to as described in :rfc:`8305`,
+    this is its "Connection Attempt Delay".
+    """
+
     def __init__(self, host: str, port: int | None = None, timeout: float = 3, query_port: int | None = None):
         """
         :param host: The host/ip of the minecraft server.
@@ -73,7 +91,7 @@ class JavaServer(MCServer):
         _ = Address(host, self.query_port)  # Ensure query_port is valid
 
     @classmethod
-    def lookup(cls, address: str, timeout: float = 3) -> Self:
+    def lookup(cls, address: str, timeout: float = 3, *, fastest: bool = False) -> Self:
         """Mimics minecraft's server address field.
 
         With Java servers, on top of just parsing the address, we also check the
@@ -83,18 +101,67 @@ class JavaServer(MCServer):
 
         :param address: The address of the Minecraft server, like ``example.com:25565``.
         :param timeout: The timeout in seconds before failing to connect.
+        :param fastest:
+            Race all of the SRV targets and their IPs, and use the one which connects the fastest
+            (see :func:`~mcstatus.address.fastest_address_lookup`), instead of just the first one.
         """
+        if fastest:
+            addr = fastest_address_lookup(address, default_port=cls.DEFAULT_PORT, lifetime=timeout, timeout=timeout)
+            return cls._with_endpoint(addr, timeout)
         addr = minecraft_srv_address_lookup(address, default_port=cls.DEFAULT_PORT, lifetime=timeout)
         return cls(addr.host, addr.port, timeout=timeout)
 
     @classmethod
-    async def async_lookup(cls, address: str, timeout: float = 3) -> Self:
+    async def async_lookup(
+        cls, address: str, timeout: float = 3, *, budget: float | None = None, fastest: bool = False
+    ) -> Self:
         """Asynchronous alternative to :meth:`.lookup`.
 
         For more details, check the :meth:`JavaServer.lookup() <.lookup>` docstring.
+
+        :param budget: The longest time in seconds the whole DNS resolution may take.
+        :raises asyncio.TimeoutError: If the ``budget`` runs out.
         """
-        addr = await async_minecraft_srv_address_lookup(address, default_port=cls.DEFAULT_PORT, lifetime=timeout)
-        return cls(addr.host, addr.port, timeout=timeout)
+        if fastest:
+            addr = await within_budget(
+                async_fastest_address_lookup(address, default_port=cls.DEFAULT_PORT, lifetime=timeout, timeout=timeout),
+                budget,
+            )
+            return cls._with_endpoint(addr, timeout)
+        addr = await within_budget(
+            async_minecraft_srv_address_lookup(address, default_port=cls.DEFAULT_PORT, lifetime=timeout),
+            budget,
+        )
+        # Keep the IP resolved along with the SRV record, so it isn't resolved again
+        return cls._with_endpoint(addr, timeout)
+
+    @classmethod
+    def _with_endpoint(cls, endpoint: Address, timeout: float) -> Self:
+        """Make the server connecting to the already resolved IPs of the endpoint (if any)."""
+        server = cls(endpoint.host, endpoint.port, timeout=timeout)
+        server.address._cached_ip = endpoint._cached_ip
+        server.address._cached_ips = endpoint._cached_ips
+        return server
+
+    # Connecting is retried separately from the requests made over the connection, and only
+    # when the connection got reset, so offline servers cost a single connect timeout
+    @retry(tries=3, delay=0.1, retryable=is_connect_retryable)
+    def _connect(self) -> TCPSocketConnection:
+        return TCPSocketConnection(self.address, self.timeout, happy_eyeballs_delay=self.happy_eyeballs_delay)
+
+    @asynccontextmanager
+    async def _async_connect(self) -> AsyncIterator[TCPAsyncSocketConnection]:
+        connection = await self._retry_async_connect()
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @retry(tries=3, delay=0.1, retryable=is_connect_retryable)
+    async def _retry_async_connect(self) -> TCPAsyncSocketConnection:
+        connection = TCPAsyncSocketConnection(self.address, self.timeout, happy_eyeballs_delay=self.happy_eyeballs_delay)
+        await connection.connect()
+        return connection
 
     def ping(self, **kwargs) -> float:
         """Checks the latency between a Minecraft Java Edition server and the client (you).
@@ -108,16 +175,16 @@ class JavaServer(MCServer):
         :return: The latency between the Minecraft Server and you.
         """
 
-        with TCPSocketConnection(self.address, self.timeout) as connection:
+        with self._connect() as connection:
             return self._retry_ping(connection, **kwargs)
 
-    @retry(tries=3)
+    @retry(tries=3, delay=0.1)
     def _retry_ping(self, connection: TCPSocketConnection, **kwargs) -> float:
         pinger = ServerPinger(connection, address=self.address, **kwargs)
-        pinger.handshake()
+        pinger.handshake(defer=True)
         return pinger.test_ping()
 
-    async def async_ping(self, **kwargs) -> float:
+    async def async_ping(self, *, budget: float | None = None, **kwargs) -> float:
         """Asynchronously checks the latency between a Minecraft Java Edition server and the client (you).
 
         Note that most non-vanilla implementations fail to respond to a ping
@@ -125,17 +192,23 @@ class JavaServer(MCServer):
         did not respond with any information!`` in those cases. The workaround
         is to use the latency provided with :meth:`.async_status` as ping time.
 
+        :param budget:
+            The longest time in seconds the whole request may take, including connecting
+            and all of the retries. By default, only the individual steps are limited by ``timeout``.
         :param kwargs: Passed to a :class:`~mcstatus.pinger.AsyncServerPinger` instance.
         :return: The latency between the Minecraft Server and you.
+        :raises asyncio.TimeoutError: If the ``budget`` runs out.
         """
+        return await within_budget(self._async_ping(**kwargs), budget)
 
-        async with TCPAsyncSocketConnection(self.address, self.timeout) as connection:
+    async def _async_ping(self, **kwargs) -> float:
+        async with self._async_connect() as connection:
             return await self._retry_async_ping(connection, **kwargs)
 
-    @retry(tries=3)
+    @retry(tries=3, delay=0.1)
     async def _retry_async_ping(self, connection: TCPAsyncSocketConnection, **kwargs) -> float:
         pinger = AsyncServerPinger(connection, address=self.address, **kwargs)
-        pinger.handshake()
+        pinger.handshake(defer=True)
         ping = await pinger.test_ping()
         return ping
 
@@ -146,33 +219,93 @@ class JavaServer(MCServer):
         :return: Status information in a :class:`~mcstatus.responses.JavaStatusResponse` instance.
         """
 
-        with TCPSocketConnection(self.address, self.timeout) as connection:
+        with self._connect() as connection:
             return self._retry_status(connection, **kwargs)
 
-    @retry(tries=3)
+    @retry(tries=3, delay=0.1)
     def _retry_status(self, connection: TCPSocketConnection, **kwargs) -> JavaStatusResponse:
         pinger = ServerPinger(connection, address=self.address, **kwargs)
-        pinger.handshake()
+        pinger.handshake(defer=True)
         result = pinger.read_status()
         return result
 
-    async def async_status(self, **kwargs) -> JavaStatusResponse:
+    async def async_status(self, *, budget: float | None = None, **kwargs) -> JavaStatusResponse:
         """Asynchronously checks the status of a Minecraft Java Edition server via the status protocol.
 
+        :param budget:
+            The longest time in seconds the whole request may take, including connecting
+            and all of the retries. By default, only the individual steps are limited by ``timeout``.
         :param kwargs: Passed to a :class:`~mcstatus.pinger.AsyncServerPinger` instance.
         :return: Status information in a :class:`~mcstatus.responses.JavaStatusResponse` instance.
+        :raises asyncio.TimeoutError: If the ``budget`` runs out.
         """
+        return await within_budget(self._async_status(**kwargs), budget)
 
-        async with TCPAsyncSocketConnection(self.address, self.timeout) as connection:
+    async def _async_status(self, **kwargs) -> JavaStatusResponse:
+        async with self._async_connect() as connection:
             return await self._retry_async_status(connection, **kwargs)
 
-    @retry(tries=3)
+    @retry(tries=3, delay=0.1)
     async def _retry_async_status(self, connection: TCPAsyncSocketConnection, **kwargs) -> JavaStatusResponse:
         pinger = AsyncServerPinger(connection, address=self.address, **kwargs)
-        pinger.handshake()
+        pinger.handshake(defer=True)
         result = await pinger.read_status()
         return result
 
+    def status_and_ping(self, **kwargs) -> tuple[JavaStatusResponse, float]:
+        """Checks the status of a Minecraft Java Edition server, and the latency to it, over a single connection.
+
+        Instead of connecting twice (and handshaking twice) for :meth:`.status` and :meth:`.ping`,
+        the ping request is sent right after the status response arrives, on the same connection.
+        Unlike with :meth:`.ping`, this also works with the non-vanilla servers which only respond
+        to the ping after a status request. If the server doesn't respond to the ping at all (some
+        close the connection right after the status), the latency of the status request is used.
+
+        The connection is handshaken only once, so unlike with :meth:`.status`, a failed status
+        request isn't retried, and neither is the ping.
+
+        :param kwargs: Passed to a :class:`~mcstatus.pinger.ServerPinger` instance.
+        :return:
+            Status information in a :class:`~mcstatus.responses.JavaStatusResponse` instance,
+            and the latency between the Minecraft Server and you, measured with the ping if possible.
+        """
+        status, ping = self._status_and_try_ping(**kwargs)
+        return status, status.latency if isinstance(ping, Exception) else ping
+
+    def _status_and_try_ping(self, **kwargs) -> tuple[JavaStatusResponse, float | Exception]:
+        """Get the status and the ping latency like :meth:`.status_and_ping`, or the error the ping failed with."""
+        with self._connect() as connection:
+            pinger = ServerPinger(connection, address=self.address, **kwargs)
+            pinger.handshake(defer=True)
+            status = pinger.read_status()
+            try:
+                return status, pinger.test_ping()
+            except OSError as exc:
+                return status, exc
+
+    async def async_status_and_ping(self, *, budget: float | None = None, **kwargs) -> tuple[JavaStatusResponse, float]:
+        """Asynchronous alternative to :meth:`.status_and_ping`.
+
+        :param budget:
+            The longest time in seconds the whole request may take, including connecting.
+            By default, only the individual steps are limited by ``timeout``.
+        :param kwargs: Passed to a :class:`~mcstatus.pinger.AsyncServerPinger` instance.
+        :return: Same as :meth:`.status_and_ping`.
+        :raises asyncio.TimeoutError: If the ``budget`` runs out.
+        """
+        status, ping = await within_budget(self._async_status_and_try_ping(**kwargs), budget)
+        return status, status.latency if isinstance(ping, Exception) else ping
+
+    async def _async_status_and_try_ping(self, **kwargs) -> tuple[JavaStatusResponse, float | Exception]:
+        async with self._async_connect() as connection:
+            pinger = AsyncServerPinger(connection, address=self.address, **kwargs)
+            pinger.handshake(defer=True)
+            status = await pinger.read_status()
+            try:
+                return status, await pinger.test_ping()
+            except (OSError, asyncio.TimeoutError) as exc:
+                return status, exc
+
     def query(self, *, tries: int = 3) -> QueryResponse:
         """Checks the status of a Minecraft Java Edition server via the query protocol.
 
@@ -182,23 +315,30 @@ class JavaServer(MCServer):
         ip = str(self.address.resolve_ip())
         return self._retry_query(Address(ip, self.query_port), tries=tries)
 
-    @retry(tries=3)
+    @retry(tries=3, delay=0.1)
     def _retry_query(self, addr: Address, **_kwargs) -> QueryResponse:
         with UDPSocketConnection(addr, self.timeout) as connection:
             querier = ServerQuerier(connection)
             querier.handshake()
             return querier.read_query()
 
-    async def async_query(self, *, tries: int = 3) -> QueryResponse:
+    async def async_query(self, *, tries: int = 3, budget: float | None = None) -> QueryResponse:
         """Asynchronously checks the status of a Minecraft Java Edition server via the query protocol.
 
         :param tries: The number of times to retry if an error is encountered.
+        :param budget:
+            The longest time in seconds the whole request may take, including resolving the IP
+            and all of the retries. By default, only the individual steps are limited by ``timeout``.
         :return: Query information in a :class:`~mcstatus.querier.QueryResponse` instance.
+        :raises asyncio.TimeoutError: If the ``budget`` runs out.
         """
+        return await within_budget(self._async_query(tries=tries), budget)
+
+    async def _async_query(self, *, tries: int) -> QueryResponse:
         ip = str(await self.address.async_resolve_ip())
         return await self._retry_async_query(Address(ip, self.query_port), tries=tries)
 
-    @retry(tries=3)
+    @retry(tries=3, delay=0.1)
     async def _retry_async_query(self, address: Address, **_kwargs) -> QueryResponse:
         async with UDPAsyncSocketConnection(address, self.timeout) as connection:
             querier = AsyncServerQuerier(connection)
@@ -211,7 +351,7 @@ class BedrockServer(MCServer):
 
     DEFAULT_PORT = 19132
 
-    @retry(tries=3)
+    @retry(tries=3, delay=0.1)
     def status(self, **kwargs) -> BedrockStatusResponse:
         """Checks the status of a Minecraft Bedrock Edition server.
 
@@ -220,11 +360,18 @@ class BedrockServer(MCServer):
         """
         return BedrockServerStatus(self.address, self.timeout, **kwargs).read_status()
 
-    @retry(tries=3)
-    async def async_status(self, **kwargs) -> BedrockStatusResponse:
+    async def async_status(self, *, budget: float | None = None, **kwargs) -> BedrockStatusResponse:
         """Asynchronously checks the status of a Minecraft Bedrock Edition server.
 
+        :param budget:
+            The longest time in seconds the whole request may take, including all of the
+            retries. By default, only the individual steps are limited by ``timeout``.
         :param kwargs: Passed to a :class:`~mcstatus.bedrock_status.BedrockServerStatus` instance.
         :return: Status information in a :class:`~mcstatus.responses.BedrockStatusResponse` instance.
+        :raises asyncio.TimeoutError: If the ``budget`` runs out.
         """
+        return await within_budget(self._retry_async_status(**kwargs), budget)
+
+    @retry(tries=3, delay=0.1)
+    async def _retry_async_status(self, **kwargs) -> BedrockStatusResponse:
         return await BedrockServerStatus(self.address, self.timeout, **kwargs).read_status_async()
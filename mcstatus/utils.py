@@ -1,11 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import errno
 import inspect
+import random
+import socket
+import threading
+import time
 import warnings
-from collections.abc import Callable, Iterable
+from collections.abc import Awaitable, Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from functools import wraps
-from typing import Any, TYPE_CHECKING, TypeVar, cast, overload
+from typing import Any, Final, TYPE_CHECKING, TypeVar, cast, overload
+
+import dns.resolver
+
+from mcstatus.motd import MotdLimitError
 
 if TYPE_CHECKING:
     from typing_extensions import ParamSpec, Protocol
@@ -21,20 +32,120 @@ R = TypeVar("R")
 R2 = TypeVar("R2")
 
 
-def retry(tries: int, exceptions: tuple[type[BaseException]] = (Exception,)) -> Callable[[Callable[P, R]], Callable[P, R]]:
-    """Decorator that re-runs given function ``tries`` times if error occurs.
+# Errors of the OS meaning the host can't be reached at all, retrying those won't help
+_UNREACHABLE_ERRNOS: Final = frozenset({errno.ENETUNREACH, errno.EHOSTUNREACH, errno.ENETDOWN, errno.EHOSTDOWN})
+
+
+def _is_temporary_resolver_failure(exc: BaseException) -> bool:
+    """Whether the error is the system resolver failing temporarily (``EAI_AGAIN``)."""
+    return isinstance(exc, socket.gaierror) and exc.errno == socket.EAI_AGAIN
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether retrying could help with the given error.
+
+    Refused connections, unreachable hosts, non-existent domains and too large MOTDs fail
+    the same way every time, so they aren't worth retrying. Anything else (most notably timeouts,
+    reset connections and temporary failures of the resolver) could be a transient failure, and is retryable.
+    """
+    if _is_temporary_resolver_failure(exc):
+        return True
+    if isinstance(
+        exc, (ConnectionRefusedError, socket.gaierror, dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, MotdLimitError)
+    ):
+        return False
+    return not (isinstance(exc, OSError) and exc.errno in _UNREACHABLE_ERRNOS)
+
+
+def is_connect_retryable(exc: BaseException) -> bool:
+    """Whether retrying to connect could help with the given error.
+
+    A server which doesn't accept the connection in time is most likely offline, and waiting for it
+    again would only multiply the time wasted on it. Only connections which were reset or aborted
+    right after being accepted, and temporary failures of the resolver, are worth another attempt.
+    """
+    return isinstance(exc, (ConnectionResetError, ConnectionAbortedError)) or _is_temporary_resolver_failure(exc)
+
+
+@dataclass
+class RetryBudget:
+    """Retries shared by many requests, like all of the servers of a bulk job.
+
+    With a lot of servers failing at once (e.g. when the network is down), retrying
+    every one of them would only multiply the time wasted. Once the budget runs out,
+    the requests fail right after their first failed attempt.
+    """
+
+    retries: int
+    """How many more retries are allowed."""
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def spend(self) -> bool:
+        """Take one retry from the budget, returning whether there was any left."""
+        with self._lock:
+            if self.retries <= 0:
+                return False
+            self.retries -= 1
+            return True
+
+
+@dataclass
+class _RetryContext:
+    """State of the retries of a single request, kept in :data:`_retry_context`."""
+
+    budget: RetryBudget | None = None
+    retries: int = 0
+
+
+_retry_context: ContextVar[_RetryContext | None] = ContextVar("_retry_context", default=None)
+
+
+def retry(
+    tries: int,
+    exceptions: tuple[type[BaseException]] = (Exception,),
+    *,
+    delay: float = 0.1,
+    max_delay: float = 1,
+    retryable: Callable[[BaseException], bool] = is_retryable,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorator that re-runs given function ``tries`` times if a retryable error occurs.
 
     The amount of tries will either be the value given to the decorator,
     or if tries is present in keyword arguments on function call, this
     specified value will take precedence.
 
+    Before each retry, the function waits for a random time (full jitter) of up to ``delay``
+    seconds, doubling with every retry, but at most ``max_delay`` seconds. Errors which aren't
+    ``retryable`` are raised right away, and so is any error once the :class:`RetryBudget`
+    of the current request (if any) runs out.
+
     If the function fails even after all the retries, raise the last
     exception that the function raised.
 
     .. note::
         Even if the previous failures caused a different exception, this will only raise the last one.
+
+    :param tries: How many times to call the function at most.
+    :param exceptions: The exceptions to retry on, others are raised right away.
+    :param delay: The longest time in seconds to wait before the first retry.
+    :param max_delay: The longest time in seconds to wait before any retry.
+    :param retryable: Decides whether an error is worth retrying, see :func:`is_retryable`.
     """
 
+    def next_delay(exc: BaseException, attempt: int, tries: int) -> float | None:
+        """Get the time to wait before the next attempt, or :obj:`None` to give up."""
+        if attempt >= tries or not retryable(exc):
+            return None
+        context = _retry_context.get()
+        if context is not None and context.budget is not None and not context.budget.spend():
+            return None
+        return random.uniform(0, min(max_delay, delay * 2 ** (attempt - 1)))
+
+    def record_retry() -> None:
+        context = _retry_context.get()
+        if context is not None:
+            context.retries += 1
+
     def decorate(func: Callable[P, R]) -> Callable[P, R]:
         @wraps(func)
         async def async_wrapper(
@@ -42,14 +153,17 @@ def retry(tries: int, exceptions: tuple[type[BaseException]] = (Exception,)) ->
             tries: int = tries,  # type: ignore # (No support for adding kw-only args)
             **kwargs: P.kwargs,
         ) -> R:
-            last_exc: BaseException
-            for _ in range(tries):
+            attempt = 0
+            while True:
+                attempt += 1
                 try:
                     return await func(*args, **kwargs)  # type: ignore # (We know func is awaitable here)
                 except exceptions as exc:
-                    last_exc = exc
-            else:
-                raise last_exc  # type: ignore # (This won't actually be unbound)
+                    wait = next_delay(exc, attempt, tries)
+                    if wait is None:
+                        raise
+                record_retry()
+                await asyncio.sleep(wait)
 
         @wraps(func)
         def sync_wrapper(
@@ -57,14 +171,17 @@ def retry(tries: int, exceptions: tuple[type[BaseException]] = (Exception,)) ->
             tries: int = tries,  # type: ignore # (No support for adding kw-only args)
             **kwargs: P.kwargs,
         ) -> R:
-            last_exc: BaseException
-            for _ in range(tries):
+            attempt = 0
+            while True:
+                attempt += 1
                 try:
                     return func(*args, **kwargs)
                 except exceptions as exc:
-                    last_exc = exc
-            else:
-                raise last_exc  # type: ignore # (This won't actually be unbound)
+                    wait = next_delay(exc, attempt, tries)
+                    if wait is None:
+                        raise
+                record_retry()
+                time.sleep(wait)
 
         # We cast here since pythons typing doesn't support adding keyword-only arguments to signature
         # (Support for this was a rejected idea https://peps.python.org/pep-0612/#concatenating-keyword-parameters)
@@ -75,6 +192,22 @@ def retry(tries: int, exceptions: tuple[type[BaseException]] = (Exception,)) ->
     return decorate
 
 
+async def within_budget(awaitable: Awaitable[T], budget: float | None) -> T:
+    """Await ``awaitable`` under a single timeout scope of ``budget`` seconds.
+
+    Unlike timeouts of the individual reads (which restart with every read, and every retry),
+    this bounds the total time, so even a server which sends its response one byte at a time
+    can't hold the caller for any longer than the budget.
+
+    :param awaitable: The operation to await, it's cancelled when the budget runs out.
+    :param budget: The total time in seconds available, or :obj:`None` for no limit.
+    :raises asyncio.TimeoutError: If the budget runs out.
+    """
+    if budget is None:
+        return await awaitable
+    return await asyncio.wait_for(awaitable, timeout=budget)
+
+
 class DeprecatedReturn(Protocol):
     @overload
     def __call__(self, __x: type[T]) -> type[T]: ...
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import typing as t
+
 import pytest
 
-from mcstatus.motd import Motd
+import mcstatus.motd
+from mcstatus.motd import MOTD_COLORS_RE, Motd, MotdCache, _LEGACY_CODES
 from mcstatus.motd.components import Formatting, MinecraftColor, TranslationTag, WebColor
 from mcstatus.responses import RawJavaResponseMotdWhenDict
 
+if t.TYPE_CHECKING:
+    from mcstatus.responses import RawJavaResponseMotd
+
 
 class TestMotdParse:
     def test_correct_result(self, source):
@@ -58,6 +64,32 @@ class TestMotdParse:
     def test_parse_uppercase_passes(self):
         assert Motd.parse("&A").parsed == ["", MinecraftColor.GREEN, ""]
 
+    @pytest.mark.parametrize(
+        "motd,expected",
+        [
+            ("§aa&Lb", ["", MinecraftColor.GREEN, "a", Formatting.BOLD, "b"]),
+            ("&&a§§r", ["&", MinecraftColor.GREEN, "§", Formatting.RESET, ""]),
+            ("|ab", ["", "|a", "b"]),
+            ("\u00a7\u212ax", ["", Formatting.OBFUSCATED, "x"]),
+            ("§g§ax", ["§g", MinecraftColor.GREEN, "x"]),
+            ("§§g", [MinecraftColor.MINECOIN_GOLD]),
+            ("§gx", ["§gx"]),
+        ],
+    )
+    def test_parse_section_codes(self, motd: str, expected):
+        assert Motd._parse_as_str(motd) == expected
+
+    def test_section_code_table_matches_pattern(self):
+        for prefix in ("§", "&", "|"):
+            for char in map(chr, range(0x10000)):
+                code = prefix + char
+                if prefix != "|" and MOTD_COLORS_RE.fullmatch(code):
+                    component = _LEGACY_CODES[code]
+                    assert isinstance(component, (Formatting, MinecraftColor))
+                    assert component.value == char.lower()
+                else:
+                    assert code not in _LEGACY_CODES
+
     @pytest.mark.parametrize(
         "input,expected", [("", [""]), ([], [Formatting.RESET]), ({"extra": [], "text": ""}, ["", Formatting.RESET])]
     )
@@ -189,3 +221,117 @@ class TestMotdParse:
     def test_raw_attribute(self, source):
         motd = Motd.parse(source)
         assert motd.raw == source
+
+
+def nested_motd(depth: int) -> RawJavaResponseMotdWhenDict:
+    motd: RawJavaResponseMotdWhenDict = {"text": "deepest"}
+    for _ in range(depth):
+        motd = {"text": "", "extra": [motd, "after"]}
+    return motd
+
+
+class TestMotdParseLimits:
+    def test_deep_nesting_does_not_recurse(self, monkeypatch):
+        monkeypatch.setattr(Motd, "MAX_DEPTH", 10_000)
+        parsed = Motd.parse(nested_motd(5_000)).parsed
+
+        assert parsed.count("deepest") == 1
+        assert parsed.count("after") == 5_000
+
+    def test_too_deep(self):
+        with pytest.raises(ValueError, match="nested deeper"):
+            Motd.parse(nested_motd(Motd.MAX_DEPTH + 1))
+
+    def test_max_depth_passes(self):
+        Motd.parse(nested_motd(Motd.MAX_DEPTH))
+
+    def test_too_many_components(self, monkeypatch):
+        monkeypatch.setattr(Motd, "MAX_COMPONENTS", 100)
+        with pytest.raises(ValueError, match="more than 100 components"):
+            Motd.parse({"text": "", "extra": ["a"] * 100})
+
+    def test_inherited_formatting_is_not_shared(self):
+        parsed = Motd.parse({"text": "", "bold": True, "extra": [{"text": "a", "bold": False}, {"text": "b"}]}).parsed
+
+        assert parsed == [Formatting.BOLD, "", Formatting.RESET, "a", Formatting.RESET, Formatting.BOLD, "b", Formatting.RESET]
+
+
+class TestMotdCache:
+    @pytest.fixture(autouse=True)
+    def enabled_cache(self):
+        mcstatus.motd.cache.clear()
+        mcstatus.motd.cache.max_size = 512
+        yield
+        mcstatus.motd.cache.max_size = 0
+        mcstatus.motd.cache.clear()
+
+    def test_disabled_by_default(self):
+        cache = MotdCache()
+        cache.put((Motd, False, "a"), ["a"])
+
+        assert len(cache) == 0
+
+    def test_same_motd_is_parsed_once(self, source):
+        first = Motd.parse(source)
+        second = Motd.parse(t.cast("RawJavaResponseMotd", {**source}))
+
+        assert first == second
+        assert (mcstatus.motd.cache.hits, mcstatus.motd.cache.misses) == (1, 1)
+        assert mcstatus.motd.cache.hit_rate == 0.5
+
+    def test_cached_motd_is_not_shared(self):
+        first = Motd.parse({"text": "a", "bold": True})
+        first.parsed.append("b")
+        first.raw["text"] = "b"  # type: ignore # raw is a dict here
+        second = Motd.parse({"text": "a", "bold": True})
+
+        assert mcstatus.motd.cache.hits == 1
+        assert second.parsed == [Formatting.BOLD, "a", Formatting.RESET]
+        assert second.raw == {"text": "a", "bold": True}
+
+    def test_key_order_does_not_matter(self):
+        Motd.parse({"text": "a", "bold": True})
+        Motd.parse({"bold": True, "text": "a"})
+
+        assert mcstatus.motd.cache.hits == 1
+
+    def test_bedrock_flag_is_in_key(self):
+        java = Motd.parse("&afoo")
+        bedrock = Motd.parse("&afoo", bedrock=True)
+
+        assert mcstatus.motd.cache.hits == 0
+        assert (java.bedrock, bedrock.bedrock) == (False, True)
+
+    @pytest.mark.parametrize(
+        ("first", "second"),
+        [
+            ("foo", ["foo"]),
+            ({"text": "foo", "bold": True}, {"text": "foo", "bold": 1}),
+            ({"extra": ["foo"]}, ["foo"]),
+        ],
+    )
+    def test_different_raw_types_are_not_shared(self, first, second):
+        assert Motd.parse(first).raw == first
+        assert Motd.parse(second).raw == second
+        assert mcstatus.motd.cache.hits == 0
+
+    def test_least_recently_used_is_evicted(self):
+        mcstatus.motd.cache.max_size = 2
+        Motd.parse("a")
+        Motd.parse("b")
+        Motd.parse("a")
+        Motd.parse("c")
+
+        assert len(mcstatus.motd.cache) == 2
+        Motd.parse("a")
+        assert mcstatus.motd.cache.misses == 3
+        Motd.parse("b")
+        assert mcstatus.motd.cache.misses == 4
+
+    def test_zero_size_disables_cache(self):
+        cache = MotdCache(max_size=0)
+        cache.put((Motd, False, "a"), ["a"])
+
+        assert cache.get((Motd, False, "a")) is None
+        assert len(cache) == 0
+        assert cache.hit_rate == 0
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import random
+from collections.abc import Sequence
 from contextlib import ExitStack
+from typing import TYPE_CHECKING
 from unittest import mock
 
 import pytest
 
 from mcstatus.motd import Motd
-from mcstatus.motd.components import Formatting, MinecraftColor, TranslationTag, WebColor
+from mcstatus.motd.components import Formatting, MinecraftColor, ParsedMotdComponent, TranslationTag, WebColor
 from mcstatus.motd.simplifies import (
     get_double_colors,
     get_double_items,
@@ -14,8 +17,49 @@ from mcstatus.motd.simplifies import (
     get_end_non_text,
     get_formatting_before_color,
     get_unused_elements,
+    simplify,
+    squash_nearby_strings,
 )
 
+if TYPE_CHECKING:
+    from mcstatus.responses import RawJavaResponseMotdWhenDict
+
+
+def reference_simplify(parsed: Sequence[ParsedMotdComponent]) -> list[ParsedMotdComponent]:
+    """Apply the simplifiers one by one, until nothing changes.
+
+    The strings are squashed here independently of :func:`squash_nearby_strings`, so that it's checked too.
+    """
+    parsed = list(parsed)
+    old_parsed: list[ParsedMotdComponent] | None = None
+
+    while parsed != old_parsed:
+        old_parsed = parsed.copy()
+        unused_elements = get_unused_elements(parsed)
+        parsed = [el for index, el in enumerate(parsed) if index not in unused_elements]
+
+    squashed: list[ParsedMotdComponent] = []
+    for item in parsed:
+        if isinstance(item, str) and squashed and isinstance(squashed[-1], str):
+            squashed[-1] += item
+        else:
+            squashed.append(item)
+    return squashed
+
+
+COMPONENTS: list[ParsedMotdComponent] = [
+    "",
+    " ",
+    "a",
+    "bc",
+    MinecraftColor.RED,
+    MinecraftColor.BLUE,
+    WebColor.from_hex("#123456"),
+    WebColor.from_hex("#123457"),
+    *Formatting,
+    TranslationTag("key"),
+]
+
 
 class TestMotdSimplifies:
     def test_get_unused_elements_call_every_simplifier(self):
@@ -102,28 +146,10 @@ class TestMotdSimplifies:
     def test_translation_tag_in_the_end(self):
         assert get_end_non_text(["abc", Formatting.BOLD, "def", Formatting.RESET, "ghi", TranslationTag("key")]) == set()
 
-    def test_no_conflict_on_poping_items(self):
-        """See `https://github.com/py-mine/mcstatus/pull/335#discussion_r1045303652`_."""
-        obj = Motd(["0", "1"], raw="")
-        call_count = 0
-
-        def remove_first_element(*_, **__):
-            nonlocal call_count
-            call_count += 1
-            if call_count in (1, 2):
-                return {0}
-            return set()
-
-        with ExitStack() as stack:
-            for simplifier in [
-                get_double_items.__name__,
-                get_double_colors.__name__,
-                get_formatting_before_color.__name__,
-                get_empty_text.__name__,
-                get_end_non_text.__name__,
-            ]:
-                stack.enter_context(mock.patch("mcstatus.motd.simplifies." + simplifier, remove_first_element))
-            assert obj.simplify().parsed == ["1"]
+    def test_simplify_does_not_modify_input(self):
+        parsed = [Formatting.BOLD, "", MinecraftColor.RED, "0", "1"]
+        assert simplify(parsed) == [MinecraftColor.RED, "01"]
+        assert parsed == [Formatting.BOLD, "", MinecraftColor.RED, "0", "1"]
 
     def test_simplify_function_provides_the_same_raw(self):
         obj = object()
@@ -143,3 +169,35 @@ class TestMotdSimplifies:
 
     def test_squash_nearby_strings(self):
         assert Motd(["123", "123", "123"], raw="").simplify().parsed == ["123123123"]
+
+    def test_squash_nearby_strings_keeps_other_items(self):
+        # Previously, the squashed strings were popped in the order of a set of their indices, which
+        # isn't sorted once the indices don't fit its table. Then, wrong items were removed (here, the
+        # first reset), while some strings were kept twice (["a", "ab", ...]).
+        parsed = [Formatting.RESET, "a", "b", *[Formatting.RESET] * 5, "c", "d", "e"]
+        assert squash_nearby_strings(parsed) == [Formatting.RESET, "ab", *[Formatting.RESET] * 5, "cde"]
+
+
+class TestSimplifyEquivalence:
+    """:func:`simplify` must give the same result as running the simplifiers one by one."""
+
+    def test_random_motds(self):
+        rand = random.Random(0)
+        for _ in range(500):
+            parsed = [rand.choice(COMPONENTS) for _ in range(rand.randint(0, 20))]
+            assert simplify(parsed) == reference_simplify(parsed), parsed
+
+    def test_source(self, source):
+        parsed = Motd.parse(source).parsed
+        assert simplify(parsed) == reference_simplify(parsed)
+
+    def test_gradient(self):
+        extra: list[RawJavaResponseMotdWhenDict | str] = [
+            {"text": char, "color": f"#{i * 8:02x}00ff", "bold": i % 3 == 0} for i, char in enumerate("mcstatus" * 4)
+        ]
+        parsed = Motd.parse({"text": "", "extra": extra}).parsed
+        assert simplify(parsed) == reference_simplify(parsed)
+
+    def test_legacy_codes(self):
+        parsed = Motd.parse("&l&aA &r&a&lB&k&r§cC§c§lD&r&r").parsed
+        assert simplify(parsed) == reference_simplify(parsed)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import threading
 import typing
 from collections.abc import Callable
 
 import pytest
 
 from mcstatus.motd import Motd
+from mcstatus.motd.components import MinecraftColor
 from mcstatus.motd.transformers import AnsiTransformer, HtmlTransformer, MinecraftTransformer, PlainTransformer
 
 if typing.TYPE_CHECKING:
@@ -129,3 +131,40 @@ class TestMotdAnsi:
 
     def test_correct_output(self, result: Callable[[str | dict, bool], str], source, bedrock, expected_result):
         assert result(source, bedrock) == expected_result
+
+
+class TestTransformerDispatch:
+    def test_overridden_handler_is_used(self):
+        class UpperTransformer(PlainTransformer):
+            def _handle_str(self, element: str, /) -> str:
+                return element.upper()
+
+        assert UpperTransformer().transform(Motd.parse("&aabc&ldef").parsed) == "ABCDEF"
+        assert PlainTransformer().transform(Motd.parse("&aabc&ldef").parsed) == "abcdef"
+
+    def test_transformer_is_reusable(self):
+        transformer = HtmlTransformer()
+        parsed = Motd.parse("&aabc").parsed
+
+        assert transformer.transform(parsed) == transformer.transform(parsed)
+
+    def test_html_in_threads(self):
+        motds = [Motd.parse(typing.cast("RawJavaResponseMotd", ["&a" + str(i)] * 200)) for i in range(8)]
+        expected = [HtmlTransformer().transform(motd.parsed) for motd in motds]
+        results: list[str | None] = [None] * len(motds)
+
+        def render(index: int) -> None:
+            for _ in range(50):
+                results[index] = motds[index].to_html()
+
+        threads = [threading.Thread(target=render, args=(index,)) for index in range(len(motds))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == expected
+
+    def test_minecraft_color_resets_formatting(self):
+        assert AnsiTransformer().transform([MinecraftColor.RED, "a"]) == "\033[0m\033[0m\033[38;2;255;85;85ma\033[0m"
+        assert MinecraftTransformer().transform([MinecraftColor.RED, "a"]) == "§ca"
@@ -1,9 +1,17 @@
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
+import pytest_asyncio
 
 from mcstatus.address import Address
-from mcstatus.protocol.connection import Connection, TCPSocketConnection, UDPSocketConnection
+from mcstatus.protocol.connection import (
+    BufferPool,
+    Connection,
+    TCPAsyncSocketConnection,
+    TCPSocketConnection,
+    UDPSocketConnection,
+)
 
 
 class TestConnection:
@@ -42,6 +50,29 @@ class TestConnection:
         assert self.connection.read(2) == bytearray.fromhex("7FAA")
         assert self.connection.read(1) == bytearray.fromhex("BB")
 
+    def test_read_keeps_unread_data(self):
+        self.connection.receive(bytearray.fromhex("7FAABB"))
+        self.connection.read(1)
+
+        assert self.connection.received == bytearray.fromhex("AABB")
+        assert self.connection.remaining() == 2
+
+    def test_receive_after_read(self):
+        self.connection.receive(bytearray.fromhex("7FAA"))
+        self.connection.read(1)
+        self.connection.receive(bytearray.fromhex("BB"))
+
+        assert self.connection.received == bytearray.fromhex("AABB")
+        assert self.connection.read(2) == bytearray.fromhex("AABB")
+
+    def test_receive_with_alive_received_view(self):
+        self.connection.receive(bytearray.fromhex("7F"))
+        view = self.connection.received
+        self.connection.receive(bytearray.fromhex("AA"))
+
+        assert view == bytearray.fromhex("7F")
+        assert self.connection.received == bytearray.fromhex("7FAA")
+
     def _assert_varint_read_write(self, hexstr, value) -> None:
         self.connection.receive(bytearray.fromhex(hexstr))
         assert self.connection.read_varint() == value
@@ -90,6 +121,18 @@ class TestConnection:
 
         assert self.connection.read_ascii() == "Hello, world!"
 
+    def test_read_ascii_without_terminator(self):
+        self.connection.receive(bytearray.fromhex("48656C6C6F"))
+
+        with pytest.raises(IOError):
+            self.connection.read_ascii()
+
+    def test_read_varint_not_enough(self):
+        self.connection.receive(bytearray.fromhex("FF"))
+
+        with pytest.raises(IOError):
+            self.connection.read_varint()
+
     def test_write_ascii(self):
         self.connection.write_ascii("Hello, world!")
 
@@ -229,14 +272,26 @@ class TestConnection:
             self.connection.read(2)
 
 
+def fake_recv_into(*chunks: bytes):
+    """Create a ``side_effect`` for a mocked ``socket.recv_into``, receiving given chunks one by one."""
+    remaining = list(chunks)
+
+    def recv_into(buffer, nbytes=0):
+        chunk = remaining.pop(0)
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    return recv_into
+
+
 class TestTCPSocketConnection:
     @pytest.fixture(scope="class")
     def connection(self):
         test_addr = Address("localhost", 1234)
 
         socket = Mock()
-        socket.recv = Mock()
-        socket.send = Mock()
+        socket.recv_into = Mock()
+        socket.sendall = Mock()
         with patch("socket.create_connection") as create_connection:
             create_connection.return_value = socket
             with TCPSocketConnection(test_addr) as connection:
@@ -255,18 +310,23 @@ class TestTCPSocketConnection:
             connection.remaining()
 
     def test_read(self, connection):
-        connection.socket.recv.return_value = bytearray.fromhex("7FAA")
+        connection.socket.recv_into.side_effect = fake_recv_into(bytes.fromhex("7FAA"))
 
         assert connection.read(2) == bytearray.fromhex("7FAA")
 
+    def test_read_in_parts(self, connection):
+        connection.socket.recv_into.side_effect = fake_recv_into(bytes.fromhex("7F"), bytes.fromhex("AABB"))
+
+        assert connection.read(3) == bytearray.fromhex("7FAABB")
+
     def test_read_empty(self, connection):
-        connection.socket.recv.return_value = bytearray()
+        connection.socket.recv_into.side_effect = fake_recv_into(b"")
 
         with pytest.raises(IOError):
             connection.read(1)
 
     def test_read_not_enough(self, connection):
-        connection.socket.recv.side_effect = [bytearray(b"a"), bytearray()]
+        connection.socket.recv_into.side_effect = fake_recv_into(b"a", b"")
 
         with pytest.raises(IOError):
             connection.read(2)
@@ -274,7 +334,49 @@ class TestTCPSocketConnection:
     def test_write(self, connection):
         connection.write(bytearray.fromhex("7FAA"))
 
-        connection.socket.send.assert_called_once_with(bytearray.fromhex("7FAA"))  # type: ignore[attr-defined]
+        connection.socket.sendall.assert_called_once_with(bytearray.fromhex("7FAA"))  # type: ignore[attr-defined]
+
+    def test_write_buffer(self, connection):
+        connection.socket.sendall.reset_mock()
+        buffer = Connection()
+        buffer.write(bytearray.fromhex("7FAA"))
+        connection.write_buffer(buffer)
+
+        connection.socket.sendall.assert_called_once_with(bytearray.fromhex("027FAA"))  # type: ignore[attr-defined]
+
+
+def fake_recvfrom_into(*datagrams: bytes):
+    """Create a ``side_effect`` for a mocked ``socket.recvfrom_into``, receiving given datagrams one by one."""
+    recv_into = fake_recv_into(*datagrams)
+
+    def recvfrom_into(buffer, nbytes=0):
+        return recv_into(buffer, nbytes), ("localhost", 1234)
+
+    return recvfrom_into
+
+
+class TestBufferPool:
+    def test_acquire_reuses_released(self):
+        pool = BufferPool(buffer_size=16)
+        buffer = pool.acquire()
+        pool.release(buffer)
+
+        assert pool.acquire() is buffer
+
+    def test_acquire_allocates_when_empty(self):
+        pool = BufferPool(buffer_size=16)
+
+        assert pool.acquire() is not pool.acquire()
+        assert len(pool.acquire()) == 16
+
+    def test_release_over_limit(self):
+        pool = BufferPool(buffer_size=16, max_buffers=1)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+
+        assert pool.acquire() is first
+        assert pool.acquire() is not second
 
 
 class TestUDPSocketConnection:
@@ -283,7 +385,7 @@ class TestUDPSocketConnection:
         test_addr = Address("localhost", 1234)
 
         socket = Mock()
-        socket.recvfrom = Mock()
+        socket.recvfrom_into = Mock()
         socket.sendto = Mock()
         with patch("socket.socket") as create_socket:
             create_socket.return_value = socket
@@ -302,15 +404,23 @@ class TestUDPSocketConnection:
         assert connection.remaining() == 65535
 
     def test_read(self, connection):
-        connection.socket.recvfrom.return_value = [bytearray.fromhex("7FAA")]
+        connection.socket.recvfrom_into.side_effect = fake_recvfrom_into(bytes.fromhex("7FAA"))
 
         assert connection.read(2) == bytearray.fromhex("7FAA")
 
-    def test_read_empty(self, connection):
-        connection.socket.recvfrom.return_value = []
+    def test_read_skips_empty(self, connection):
+        connection.socket.recvfrom_into.side_effect = fake_recvfrom_into(b"", bytes.fromhex("7FAA"))
 
-        with pytest.raises(IndexError):
-            connection.read(1)
+        assert connection.read(2) == bytearray.fromhex("7FAA")
+
+    def test_read_reuses_buffer(self, connection):
+        connection.buffer_pool = BufferPool()
+        connection.socket.recvfrom_into.side_effect = fake_recvfrom_into(bytes.fromhex("7FAA"), bytes.fromhex("BB"))
+
+        assert connection.read(2) == bytearray.fromhex("7FAA")
+        assert connection.read(1) == bytearray.fromhex("BB")
+        first, second = (call.args[0] for call in connection.socket.recvfrom_into.call_args_list[-2:])
+        assert first is second
 
     def test_write(self, connection):
         connection.write(bytearray.fromhex("7FAA"))
@@ -319,3 +429,62 @@ class TestUDPSocketConnection:
             bytearray.fromhex("7FAA"),
             Address("localhost", 1234),
         )
+
+
+class TestTCPAsyncSocketConnection:
+    @pytest_asyncio.fixture
+    async def connection(self):
+        connection = TCPAsyncSocketConnection(Address("localhost", 1234), timeout=0.01)
+        connection.reader = asyncio.StreamReader()
+        return connection
+
+    @pytest.mark.asyncio
+    async def test_read_buffer(self, connection):
+        connection.reader.feed_data(bytearray.fromhex("027FAA"))
+
+        buffer = await connection.read_buffer()
+
+        assert buffer.received == bytearray.fromhex("7FAA")
+
+    @pytest.mark.asyncio
+    async def test_read_buffer_in_parts(self, connection):
+        async def feed():
+            for part in ("82", "01", "7F" * 100, "AA" * 30):
+                await asyncio.sleep(0)
+                connection.reader.feed_data(bytearray.fromhex(part))
+
+        feeder = asyncio.create_task(feed())
+        buffer = await connection.read_buffer()
+        await feeder
+
+        assert buffer.received == bytearray.fromhex("7F" * 100 + "AA" * 30)
+
+    @pytest.mark.asyncio
+    async def test_read_buffer_keeps_next_frame(self, connection):
+        connection.reader.feed_data(bytearray.fromhex("027FAA01BBCC"))
+
+        assert (await connection.read_buffer()).received == bytearray.fromhex("7FAA")
+        assert (await connection.read_buffer()).received == bytearray.fromhex("BB")
+        assert await connection.read(1) == bytearray.fromhex("CC")
+
+    @pytest.mark.asyncio
+    async def test_read_buffer_empty(self, connection):
+        connection.reader.feed_data(bytearray.fromhex("02"))
+        connection.reader.feed_eof()
+
+        with pytest.raises(IOError):
+            await connection.read_buffer()
+
+    @pytest.mark.asyncio
+    async def test_read_buffer_invalid_varint(self, connection):
+        connection.reader.feed_data(bytearray.fromhex("FFFFFFFF80"))
+
+        with pytest.raises(IOError):
+            await connection.read_buffer()
+
+    @pytest.mark.asyncio
+    async def test_read_buffer_timeout(self, connection):
+        connection.reader.feed_data(bytearray.fromhex("05AA"))
+
+        with pytest.raises(asyncio.TimeoutError):
+            await connection.read_buffer()
@@ -1,5 +1,9 @@
+import copy
+from io import StringIO
+
 import pytest
 
+from mcstatus import forge_data
 from mcstatus.forge_data import ForgeData, ForgeDataChannel, ForgeDataMod, RawForgeData
 from tests.responses import BaseResponseTest
 
@@ -656,3 +660,99 @@ class TestForgeData(BaseResponseTest):
         )
         assert value is not None
         return value
+
+
+class TestDecodeOptimized:
+    @pytest.mark.parametrize(
+        "string,expected",
+        [
+            ("\x03\x00ȁ", "010200"),  # missing data at the end are zeroes
+            ("\x01\x00ȁ", "01"),
+            ("\x0f\x00" + "翿" * 8, "ff" * 15),
+            ("\x0f\x00" + "￿" * 8, "ff" * 15),  # the sign bit is ignored
+            ("\x00\x00ȁ", ""),
+        ],
+    )
+    def test_decode(self, string, expected):
+        assert ForgeData._decode_optimized(string).received == bytes.fromhex(expected)
+
+    def test_size_spans_two_units(self):
+        assert ForgeData._decode_optimized("\x00\x01").remaining() == 1 << 15
+
+    @pytest.mark.parametrize("string", ["", "\x01"])
+    def test_missing_size(self, string):
+        with pytest.raises(IOError):
+            ForgeData._decode_optimized(string)
+
+    def test_deprecated_string_buffer(self):
+        string = "\x0f\x00" + "翿" * 8
+        with StringIO(string) as text:
+            with pytest.deprecated_call():
+                buffer = forge_data.StringBuffer(text)
+            assert buffer.read_optimized_buffer().received == ForgeData._decode_optimized(string).received
+
+
+class TestForgeDataCache:
+    RAW = {
+        "fmlNetworkVersion": 2,
+        "channels": [{"res": "fml:handshake", "version": "1.2.3.4", "required": True}],
+        "mods": [{"modId": "forge", "modmarker": "ANY"}],
+    }
+
+    @pytest.fixture(autouse=True)
+    def enabled_cache(self):
+        forge_data.cache.clear()
+        forge_data.cache.max_size = 2
+        yield forge_data.cache
+        forge_data.cache.max_size = 0
+        forge_data.cache.clear()
+
+    def test_same_payload_is_shared(self, enabled_cache):
+        first = ForgeData.build(copy.deepcopy(self.RAW))  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+        second = ForgeData.build(copy.deepcopy(self.RAW))  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+
+        assert first == second
+        assert first is not None and second is not None
+        assert first.mods[0] is second.mods[0]
+        assert (enabled_cache.hits, enabled_cache.misses) == (1, 1)
+
+    def test_cached_object_is_not_shared(self, enabled_cache):
+        first = ForgeData.build(self.RAW)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+        assert first is not None
+        first.mods.clear()
+        first.channels.clear()
+        second = ForgeData.build(self.RAW)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+
+        assert enabled_cache.hits == 1
+        assert second is not None
+        assert second.mods == [ForgeDataMod(name="forge", marker="ANY")]
+        assert len(second.channels) == 1
+
+    def test_different_payload_is_not_shared(self):
+        other = copy.deepcopy(self.RAW)
+        other["mods"][0]["modmarker"] = "1.0"
+
+        assert ForgeData.build(self.RAW) != ForgeData.build(other)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+
+    def test_key_order_does_not_matter(self, enabled_cache):
+        reordered = dict(reversed(list(self.RAW.items())))
+
+        ForgeData.build(self.RAW)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+        ForgeData.build(reordered)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+
+        assert enabled_cache.hits == 1
+
+    def test_size_is_bounded(self, enabled_cache):
+        for version in range(5):
+            ForgeData.build({**self.RAW, "fmlNetworkVersion": version})  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+
+        assert len(enabled_cache) == 2
+
+    def test_zero_size_disables_cache(self, enabled_cache):
+        enabled_cache.max_size = 0
+
+        ForgeData.build(self.RAW)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+        ForgeData.build(self.RAW)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+
+        assert enabled_cache.hits == 0
+        assert len(enabled_cache) == 0
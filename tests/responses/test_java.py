@@ -1,5 +1,9 @@
+import pickle
+from unittest.mock import patch
+
 import pytest
 
+from mcstatus.forge_data import ForgeData
 from mcstatus.motd import Motd
 from mcstatus.responses import JavaStatusPlayer, JavaStatusPlayers, JavaStatusResponse, JavaStatusVersion
 from tests.responses import BaseResponseTest
@@ -59,6 +63,52 @@ class TestJavaStatusResponse(BaseResponseTest):
         }
 
 
+class TestLazyJavaStatusResponse:
+    RAW = {
+        "players": {"max": 20, "online": 1, "sample": [{"name": "foo", "id": "0b3717c4-f45d-47c8-b8e2-3d9ff6f93a89"}]},
+        "version": {"name": "1.8-pre1", "protocol": 44},
+        "description": "A Minecraft Server",
+        "favicon": "data:image/png;base64,foo",
+        "forgeData": {"channels": [], "mods": [{"modId": "forge", "modmarker": "ANY"}], "fmlNetworkVersion": 2},
+    }
+
+    def test_equal_to_eager(self):
+        lazy = JavaStatusResponse.build(self.RAW, lazy=True)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+        assert lazy == JavaStatusResponse.build(self.RAW)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+
+    def test_fields_decoded_on_access(self):
+        with (
+            patch("mcstatus.responses.Motd.parse", wraps=Motd.parse) as parse,
+            patch("mcstatus.responses.ForgeData.build", wraps=ForgeData.build) as forge_build,
+        ):
+            build = JavaStatusResponse.build(self.RAW, lazy=True)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+            assert build.players.online == 1
+            parse.assert_not_called()
+            forge_build.assert_not_called()
+
+            assert build.motd is build.motd
+            assert build.forge_data is build.forge_data
+            parse.assert_called_once()
+            forge_build.assert_called_once()
+
+    def test_sample_decoded_on_access(self):
+        build = JavaStatusResponse.build(self.RAW, lazy=True)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+        assert "sample" not in vars(build.players)
+        assert build.players.sample == [JavaStatusPlayer("foo", "0b3717c4-f45d-47c8-b8e2-3d9ff6f93a89")]
+        assert build.icon == "data:image/png;base64,foo"
+
+    def test_unknown_attribute(self):
+        build = JavaStatusResponse.build(self.RAW, lazy=True)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+        with pytest.raises(AttributeError):
+            build.foo  # noqa: B018 # pyright: ignore[reportAttributeAccessIssue]
+        with pytest.raises(AttributeError):
+            build.players.foo  # noqa: B018 # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_pickle(self):
+        build = JavaStatusResponse.build(self.RAW, lazy=True)  # type: ignore # dict[str, Unknown] cannot be assigned to TypedDict
+        assert pickle.loads(pickle.dumps(build)) == build
+
+
 @BaseResponseTest.construct
 class TestJavaStatusPlayers(BaseResponseTest):
     EXPECTED_VALUES = [
@@ -1,16 +1,64 @@
 from __future__ import annotations
 
+import asyncio
 import ipaddress
+import socket
 import sys
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from pathlib import Path
 from typing import cast
 from unittest.mock import MagicMock, Mock, patch
 
+import dns.exception
 import dns.resolver
 import pytest
 from dns.rdatatype import RdataType
 
-from mcstatus.address import Address, async_minecraft_srv_address_lookup, minecraft_srv_address_lookup
+import mcstatus.address
+from mcstatus import JavaServer
+from mcstatus.address import (
+    Address,
+    EndpointCache,
+    _async_connect_fastest,
+    _async_resolve_ips,
+    _connect_fastest,
+    _interleave_families,
+    _resolve_ips,
+    async_fastest_address_lookup,
+    async_minecraft_srv_address_lookup,
+    fastest_address_lookup,
+    minecraft_srv_address_lookup,
+)
+from mcstatus.dns import SRVTarget
+from mcstatus.protocol.connection import TCPAsyncSocketConnection, TCPSocketConnection
+
+
+def make_a_answer(ip: str) -> MagicMock:
+    answer = MagicMock()
+    cast(MagicMock, answer.__str__).return_value = ip
+    return answer
+
+
+def fake_async_resolve(srv: object, a: dict[str, str], aaaa: dict[str, str] | None = None):
+    """Fake :func:`dns.asyncresolver.resolve`, answering the SRV query with ``srv``, and A/AAAA queries from ``a``/``aaaa``."""
+
+    async def resolve(name, rdtype, **kwargs):
+        if rdtype == RdataType.SRV:
+            if isinstance(srv, type) and issubclass(srv, Exception):
+                raise srv
+            return srv
+        if rdtype == RdataType.AAAA:
+            if not aaaa or name not in aaaa:
+                raise dns.resolver.NoAnswer
+            return [make_a_answer(aaaa[name])]
+        if name not in a:
+            raise dns.resolver.NXDOMAIN
+        return [make_a_answer(a[name])]
+
+    return resolve
 
 
 class TestSRVLookup:
@@ -40,12 +88,14 @@ class TestSRVLookup:
     @pytest.mark.parametrize("exception", [dns.resolver.NXDOMAIN, dns.resolver.NoAnswer])
     async def test_async_address_no_srv(self, exception):
         with patch("dns.asyncresolver.resolve") as resolve:
-            resolve.side_effect = [exception]
+            resolve.side_effect = fake_async_resolve(srv=exception, a={"example.org": "48.225.1.104"})
             address = await async_minecraft_srv_address_lookup("example.org", default_port=25565, lifetime=3)
-            resolve.assert_called_once_with("_minecraft._tcp.example.org", RdataType.SRV, lifetime=3, search=True)
+            resolve.assert_any_call("_minecraft._tcp.example.org", RdataType.SRV, lifetime=3, search=True)
+            resolve.assert_any_call("example.org", RdataType.A, lifetime=3, search=True)
 
         assert address.host == "example.org"
         assert address.port == 25565
+        assert await address.async_resolve_ip() == ipaddress.ip_address("48.225.1.104")
 
     @pytest.mark.asyncio
     async def test_async_address_with_srv(self):
@@ -53,12 +103,55 @@ class TestSRVLookup:
             answer = Mock()
             answer.target = "different.example.org."
             answer.port = 12345
-            resolve.return_value = [answer]
+            resolve.side_effect = fake_async_resolve(srv=[answer], a={"different.example.org": "48.225.1.104"})
 
             address = await async_minecraft_srv_address_lookup("example.org", lifetime=3)
-            resolve.assert_called_once_with("_minecraft._tcp.example.org", RdataType.SRV, lifetime=3, search=True)
+            resolve.assert_any_call("_minecraft._tcp.example.org", RdataType.SRV, lifetime=3, search=True)
+            resolve.assert_any_call("different.example.org", RdataType.A, lifetime=3, search=True)
         assert address.host == "different.example.org"
         assert address.port == 12345
+        assert await address.async_resolve_ip() == ipaddress.ip_address("48.225.1.104")
+
+    @pytest.mark.asyncio
+    async def test_async_srv_and_a_resolved_concurrently(self):
+        started: list[RdataType] = []
+        srv_release = asyncio.Event()
+
+        async def resolve(name, rdtype, **kwargs):
+            started.append(rdtype)
+            if rdtype == RdataType.SRV:
+                await srv_release.wait()
+                raise dns.resolver.NXDOMAIN
+            # The A query starts while the SRV query is still in progress
+            assert RdataType.SRV in started
+            srv_release.set()
+            return [make_a_answer("48.225.1.104")]
+
+        with patch("dns.asyncresolver.resolve", side_effect=resolve):
+            address = await async_minecraft_srv_address_lookup("example.org", default_port=25565, lifetime=3)
+
+        assert address._cached_ip == ipaddress.ip_address("48.225.1.104")
+
+    @pytest.mark.asyncio
+    async def test_async_address_caches_both_families(self):
+        with patch("dns.asyncresolver.resolve") as resolve:
+            resolve.side_effect = fake_async_resolve(
+                srv=dns.resolver.NXDOMAIN, a={"example.org": "48.225.1.104"}, aaaa={"example.org": "2001:db8::1"}
+            )
+            address = await async_minecraft_srv_address_lookup("example.org", default_port=25565, lifetime=3)
+
+        assert address._cached_ips == [ipaddress.ip_address("2001:db8::1"), ipaddress.ip_address("48.225.1.104")]
+        assert address._cached_ip == ipaddress.ip_address("48.225.1.104")
+
+    @pytest.mark.asyncio
+    async def test_async_address_ip_not_resolvable(self):
+        with patch("dns.asyncresolver.resolve") as resolve:
+            resolve.side_effect = fake_async_resolve(srv=dns.resolver.NXDOMAIN, a={})
+            address = await async_minecraft_srv_address_lookup("example.org", default_port=25565, lifetime=3)
+
+        assert address == ("example.org", 25565)
+        assert address._cached_ip is None
+        assert address._cached_ips == []
 
 
 class TestAddressValidity:
@@ -162,6 +255,15 @@ class TestAddressIPResolving:
             assert isinstance(resolved_ip, ipaddress.IPv4Address)
             assert str(resolved_ip) == "48.225.1.104"
 
+    def test_ip_resolver_with_ipv6_only_hostname(self):
+        with (
+            patch("mcstatus.dns.resolve_a_record", side_effect=dns.resolver.NoAnswer),
+            patch("mcstatus.dns.resolve_aaaa_records", return_value=["2001:db8::1"]),
+        ):
+            resolved_ip = self.host_addr.resolve_ip(lifetime=3)
+
+        assert resolved_ip == ipaddress.ip_address("2001:db8::1")
+
     @pytest.mark.asyncio
     async def test_async_ip_resolver_with_hostname(self):
         with patch("dns.asyncresolver.resolve") as resolve:
@@ -223,3 +325,302 @@ class TestAddressIPResolving:
         context_manager = pytest.warns(RuntimeWarning) if sys.platform == "darwin" else MagicMock()
         with context_manager:
             assert await addr.async_resolve_ip() == ipaddress.ip_address("127.0.0.1")
+
+
+@pytest.fixture
+def listening_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+@pytest.fixture
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(autouse=True)
+def clear_endpoint_cache():
+    mcstatus.address.cache.clear()
+    yield
+    mcstatus.address.cache.clear()
+
+
+@contextmanager
+def fake_ips(
+    ipv4: Sequence[str] = (),
+    ipv6: Sequence[str] = (),
+    *,
+    expiration: float | None = None,
+    missing: tuple[str, ...] = (),
+) -> Iterator[None]:
+    """Make every host resolve to the given IPs (a family without any has no answer), except the ``missing`` ones."""
+
+    def resolve_addresses(hostname: str, rdtype: RdataType, lifetime: float | None) -> tuple[list[str], float | None]:
+        ips = ipv6 if rdtype == RdataType.AAAA else ipv4
+        if hostname in missing:
+            raise dns.resolver.NXDOMAIN
+        if not ips:
+            raise dns.resolver.NoAnswer
+        return list(ips), expiration
+
+    async def async_resolve_addresses(
+        hostname: str, rdtype: RdataType, lifetime: float | None
+    ) -> tuple[list[str], float | None]:
+        return resolve_addresses(hostname, rdtype, lifetime)
+
+    with (
+        patch("mcstatus.dns._resolve_addresses", resolve_addresses),
+        patch("mcstatus.dns._async_resolve_addresses", async_resolve_addresses),
+    ):
+        yield
+
+
+class TestFastestLookup:
+    def test_connects_to_listening_endpoint(self, listening_port, closed_port):
+        sock, index = _connect_fastest([("127.0.0.1", closed_port), ("127.0.0.1", listening_port)], timeout=3)
+        sock.close()
+
+        assert index == 1
+
+    def test_raises_when_all_endpoints_fail(self, closed_port):
+        with pytest.raises(ConnectionRefusedError):
+            _connect_fastest([("127.0.0.1", closed_port)], timeout=3)
+
+    @pytest.mark.asyncio
+    async def test_async_connects_to_listening_endpoint(self, listening_port, closed_port):
+        _, writer, index = await _async_connect_fastest([("127.0.0.1", closed_port), ("127.0.0.1", listening_port)], timeout=3)
+        writer.close()
+
+        assert index == 1
+
+    @pytest.mark.asyncio
+    async def test_async_raises_when_all_endpoints_fail(self, closed_port):
+        with pytest.raises(ConnectionRefusedError):
+            await _async_connect_fastest([("127.0.0.1", closed_port)], timeout=3)
+
+    def test_next_priority_is_used_when_first_fails(self, listening_port, closed_port):
+        targets = [SRVTarget("primary.example.org", closed_port, 0, 0), SRVTarget("backup.example.org", listening_port, 10, 0)]
+        with patch("mcstatus.dns._resolve_srv_targets", return_value=(targets, None)), fake_ips(["127.0.0.1"]):
+            endpoint = fastest_address_lookup("example.org")
+
+        assert endpoint == Address("backup.example.org", listening_port)
+        assert endpoint._cached_ip == ipaddress.ip_address("127.0.0.1")
+
+    @pytest.mark.asyncio
+    async def test_async_next_priority_is_used_when_first_fails(self, listening_port, closed_port):
+        targets = [SRVTarget("primary.example.org", closed_port, 0, 0), SRVTarget("backup.example.org", listening_port, 10, 0)]
+        with patch("mcstatus.dns._async_resolve_srv_targets", return_value=(targets, None)), fake_ips(["127.0.0.1"]):
+            endpoint = await async_fastest_address_lookup("example.org")
+
+        assert endpoint == Address("backup.example.org", listening_port)
+
+    def test_picked_endpoint_is_cached(self, listening_port):
+        with patch("mcstatus.address._connect_fastest", wraps=mcstatus.address._connect_fastest) as connect:
+            fastest_address_lookup(f"127.0.0.1:{listening_port}")
+            endpoint = fastest_address_lookup(f"127.0.0.1:{listening_port}")
+
+        connect.assert_called_once()
+        assert endpoint == Address("127.0.0.1", listening_port)
+        assert (mcstatus.address.cache.hits, mcstatus.address.cache.misses) == (1, 1)
+
+    def test_expired_endpoint_is_not_used(self):
+        cache = EndpointCache(ttl=-1)
+        cache.put("example.org", None, Address("example.org", 25565))
+
+        assert cache.get("example.org", None) is None
+
+    def test_endpoint_expires_with_dns_records(self, listening_port):
+        targets = [SRVTarget("mc.example.org", listening_port, 0, 0)]
+        with (
+            patch("mcstatus.dns._resolve_srv_targets", return_value=(targets, time.time() + 3600)),
+            fake_ips(["127.0.0.1"], expiration=time.time() + 60),
+        ):
+            fastest_address_lookup("example.org")
+
+        expiration, _ = mcstatus.address.cache._entries["example.org", None]
+        assert 0 < expiration - time.monotonic() <= 60
+
+    def test_ttl_is_capped(self):
+        cache = EndpointCache(ttl=-1)
+        cache.put("example.org", None, Address("example.org", 25565), ttl=3600)
+
+        assert cache.get("example.org", None) is None
+
+    def test_zero_size_disables_cache(self):
+        cache = EndpointCache(max_size=0)
+        cache.put("example.org", None, Address("example.org", 25565))
+
+        assert len(cache) == 0
+
+    def test_unresolvable_targets_are_skipped(self, listening_port):
+        targets = [SRVTarget("gone.example.org", listening_port, 0, 0), SRVTarget("mc.example.org", listening_port, 0, 0)]
+
+        with (
+            patch("mcstatus.dns._resolve_srv_targets", return_value=(targets, None)),
+            fake_ips(["127.0.0.1"], missing=("gone.example.org",)),
+        ):
+            assert fastest_address_lookup("example.org").host == "mc.example.org"
+
+    def test_server_connects_to_picked_ip(self, listening_port):
+        targets = [SRVTarget("mc.example.org", listening_port, 0, 0)]
+        with patch("mcstatus.dns._resolve_srv_targets", return_value=(targets, None)), fake_ips(["127.0.0.1"]):
+            server = JavaServer.lookup("example.org", fastest=True)
+
+        assert server.address == Address("mc.example.org", listening_port)
+        with TCPSocketConnection(server.address) as connection:
+            assert connection.socket.getpeername() == ("127.0.0.1", listening_port)
+
+
+@pytest.fixture
+def ipv6_listening_port():
+    with socket.socket(socket.AF_INET6) as sock:
+        sock.bind(("::1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+class TestHappyEyeballs:
+    def test_families_are_interleaved(self):
+        assert _interleave_families(["::1", "::2", "::3"], ["1.1.1.1"]) == ["::1", "1.1.1.1", "::2", "::3"]
+        assert _interleave_families([], ["1.1.1.1", "2.2.2.2"]) == ["1.1.1.1", "2.2.2.2"]
+
+    def test_resolves_both_families(self):
+        with fake_ips(["127.0.0.1", "127.0.0.2"], ["::1"], expiration=123):
+            assert _resolve_ips("example.org") == (["::1", "127.0.0.1", "127.0.0.2"], 123)
+
+    def test_missing_family_is_skipped(self):
+        with fake_ips(["127.0.0.1"]):
+            assert _resolve_ips("example.org") == (["127.0.0.1"], None)
+
+    @pytest.mark.asyncio
+    async def test_async_resolves_both_families(self):
+        with fake_ips(["127.0.0.1"], ["::1"]):
+            assert await _async_resolve_ips("example.org") == (["::1", "127.0.0.1"], None)
+
+    def test_families_are_resolved_concurrently(self):
+        both_queried = threading.Barrier(2, timeout=3)
+
+        def resolve_addresses(hostname: str, rdtype: RdataType, lifetime: float | None) -> tuple[list[str], float | None]:
+            both_queried.wait()  # Only passes if the other family is being queried at the same time
+            return (["::1"] if rdtype == RdataType.AAAA else ["127.0.0.1"]), None
+
+        with patch("mcstatus.dns._resolve_addresses", resolve_addresses):
+            assert _resolve_ips("example.org") == (["::1", "127.0.0.1"], None)
+
+    def test_unresolvable_host_raises(self):
+        with fake_ips(missing=("example.org",)), pytest.raises(dns.resolver.NXDOMAIN):
+            _resolve_ips("example.org")
+
+    def test_next_endpoint_waits_for_stagger(self):
+        with socket.socket() as first, socket.socket() as second:
+            for listener in (first, second):
+                listener.bind(("127.0.0.1", 0))
+                listener.listen()
+            second.setblocking(False)
+
+            sock, index = _connect_fastest(
+                [("127.0.0.1", first.getsockname()[1]), ("127.0.0.1", second.getsockname()[1])], timeout=3, stagger=10
+            )
+            sock.close()
+
+            assert index == 0
+            with pytest.raises(BlockingIOError):
+                second.accept()  # Never connected to
+
+    def test_failure_starts_next_endpoint_right_away(self, listening_port, closed_port):
+        start = time.perf_counter()
+        sock, index = _connect_fastest([("127.0.0.1", closed_port), ("127.0.0.1", listening_port)], timeout=3, stagger=10)
+        sock.close()
+
+        assert index == 1
+        assert time.perf_counter() - start < 1
+
+    @pytest.mark.asyncio
+    async def test_async_failure_starts_next_endpoint_right_away(self, listening_port, closed_port):
+        start = time.perf_counter()
+        _, writer, index = await _async_connect_fastest(
+            [("127.0.0.1", closed_port), ("127.0.0.1", listening_port)], timeout=3, stagger=10
+        )
+        writer.close()
+
+        assert index == 1
+        assert time.perf_counter() - start < 1
+
+    def test_connection_falls_back_from_broken_ipv6(self, listening_port):
+        with patch("mcstatus.protocol.connection._resolve_ips", return_value=(["::1", "127.0.0.1"], None)):
+            with TCPSocketConnection(Address("example.org", listening_port), happy_eyeballs_delay=10) as connection:
+                assert connection.socket.getpeername() == ("127.0.0.1", listening_port)
+
+    def test_connection_prefers_ipv6(self, ipv6_listening_port):
+        with patch("mcstatus.protocol.connection._resolve_ips", return_value=(["::1", "127.0.0.1"], None)):
+            with TCPSocketConnection(Address("example.org", ipv6_listening_port)) as connection:
+                assert connection.socket.getpeername()[:2] == ("::1", ipv6_listening_port)
+
+    @pytest.mark.asyncio
+    async def test_async_connection_falls_back_from_broken_ipv6(self, listening_port):
+        with patch("mcstatus.protocol.connection._async_resolve_ips", return_value=(["::1", "127.0.0.1"], None)):
+            async with TCPAsyncSocketConnection(Address("example.org", listening_port), happy_eyeballs_delay=10) as connection:
+                assert connection.writer.get_extra_info("peername") == ("127.0.0.1", listening_port)
+
+    @pytest.mark.asyncio
+    async def test_async_connection_races_cached_ips(self, listening_port):
+        address = Address("example.org", listening_port)
+        address._cached_ips = [ipaddress.ip_address("::1"), ipaddress.ip_address("127.0.0.1")]
+        address._cached_ip = ipaddress.ip_address("127.0.0.1")
+
+        with patch("mcstatus.protocol.connection._async_connect_fastest", wraps=_async_connect_fastest) as connect_fastest:
+            async with TCPAsyncSocketConnection(address, happy_eyeballs_delay=10) as connection:
+                assert connection.writer.get_extra_info("peername") == ("127.0.0.1", listening_port)
+        connect_fastest.assert_called_once()
+        assert connect_fastest.call_args.args[0] == [("::1", listening_port), ("127.0.0.1", listening_port)]
+
+    def test_resolving_shares_the_connect_timeout(self, listening_port):
+        def slow_resolve_ips(host: str, lifetime: float | None = None) -> tuple[list[str], float | None]:
+            time.sleep(0.3)
+            return ["127.0.0.1"], None
+
+        start = time.perf_counter()
+        with patch("mcstatus.protocol.connection._resolve_ips", slow_resolve_ips), pytest.raises(TimeoutError):
+            TCPSocketConnection(Address("example.org", listening_port), timeout=0.2)
+        assert time.perf_counter() - start < 1
+
+    @pytest.mark.asyncio
+    async def test_async_hanging_dns_is_cut_short(self, listening_port):
+        async def hanging_resolve_ips(host: str, lifetime: float | None = None) -> tuple[list[str], float | None]:
+            await asyncio.sleep(10)
+            return ["::1", "127.0.0.1"], None
+
+        start = time.perf_counter()
+        with patch("mcstatus.protocol.connection._async_resolve_ips", hanging_resolve_ips):
+            async with TCPAsyncSocketConnection(Address("localhost", listening_port), timeout=0.5) as connection:
+                assert connection.writer.get_extra_info("peername")[1] == listening_port
+        assert time.perf_counter() - start < 1
+
+    def test_slow_dns_falls_back_to_system_resolver(self, listening_port):
+        lifetimes = []
+
+        def timing_out_resolve_ips(host: str, lifetime: float | None = None) -> tuple[list[str], float | None]:
+            lifetimes.append(lifetime)
+            raise dns.exception.Timeout
+
+        with patch("mcstatus.protocol.connection._resolve_ips", timing_out_resolve_ips):
+            with TCPSocketConnection(Address("localhost", listening_port), timeout=2) as connection:
+                assert connection.socket.getpeername()[1] == listening_port
+        assert lifetimes == [1]
+
+    @pytest.mark.asyncio
+    async def test_async_slow_dns_falls_back_to_system_resolver(self, listening_port):
+        lifetimes = []
+
+        async def timing_out_resolve_ips(host: str, lifetime: float | None = None) -> tuple[list[str], float | None]:
+            lifetimes.append(lifetime)
+            raise dns.exception.Timeout
+
+        with patch("mcstatus.protocol.connection._async_resolve_ips", timing_out_resolve_ips):
+            async with TCPAsyncSocketConnection(Address("localhost", listening_port), timeout=2) as connection:
+                assert connection.writer.get_extra_info("peername")[1] == listening_port
+        assert lifetimes == [1]
@@ -0,0 +1,172 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from mcstatus.bulk import RetryBudget, status_many
+from mcstatus.utils import retry
+
+
+class FakeStatus:
+    """Fake for the request functions, tracking how many requests run at once."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.started: list[str] = []
+        self.cancelled = 0
+
+    async def __call__(self, address, timeout):
+        self.started.append(address)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+
+        if address.startswith("offline"):
+            raise ConnectionRefusedError(address)
+        return f"status of {address}"
+
+
+@pytest.mark.asyncio
+async def test_yields_all_results():
+    fake = FakeStatus()
+    addresses = [f"server{i}.example.com" for i in range(20)]
+
+    with patch("mcstatus.bulk._java_status", fake):
+        results = dict([result async for result in status_many(addresses, concurrency=5)])
+
+    assert results == {address: f"status of {address}" for address in addresses}
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    fake = FakeStatus()
+
+    with patch("mcstatus.bulk._java_status", fake):
+        _ = [result async for result in status_many((f"server{i}" for i in range(50)), concurrency=7)]
+
+    assert fake.max_running == 7
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_yielded():
+    fake = FakeStatus()
+
+    with patch("mcstatus.bulk._java_status", fake):
+        results = dict([result async for result in status_many(["online", "offline"], concurrency=2)])
+
+    assert results["online"] == "status of online"
+    assert isinstance(results["offline"], ConnectionRefusedError)
+
+
+@pytest.mark.asyncio
+async def test_budget():
+    fake = FakeStatus(delay=5)
+
+    with patch("mcstatus.bulk._java_status", fake):
+        results = [result async for result in status_many(["slow"], budget=0.05)]
+
+    assert isinstance(results[0][1], asyncio.TimeoutError)
+    assert fake.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_budget():
+    @retry(tries=3)
+    async def flaky_status(address, timeout):
+        if address == "refused":
+            raise ConnectionRefusedError(address)
+        raise TimeoutError(address)
+
+    retry_budget = RetryBudget(retries=3)
+    with patch("mcstatus.bulk._java_status", flaky_status):
+        results = {
+            result[0]: result async for result in status_many(["refused", "timeout1", "timeout2"], retry_budget=retry_budget)
+        }
+
+    assert isinstance(results["refused"][1], ConnectionRefusedError)
+    assert results["refused"].attempts == 1
+    assert results["timeout1"].attempts + results["timeout2"].attempts == 2 + 3
+    assert retry_budget.retries == 0
+
+
+@pytest.mark.asyncio
+async def test_bedrock():
+    fake = FakeStatus()
+
+    with patch("mcstatus.bulk._bedrock_status", fake), patch("mcstatus.bulk._java_status") as java_status:
+        results = [result async for result in status_many(["bedrock.example.com"], bedrock=True)]
+
+    assert results == [("bedrock.example.com", "status of bedrock.example.com")]
+    java_status.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_iterable_addresses():
+    fake = FakeStatus()
+
+    async def addresses():
+        for i in range(3):
+            await asyncio.sleep(0)
+            yield f"server{i}"
+
+    with patch("mcstatus.bulk._java_status", fake):
+        results = [address async for address, _ in status_many(addresses(), concurrency=2)]
+
+    assert sorted(results) == ["server0", "server1", "server2"]
+
+
+@pytest.mark.asyncio
+async def test_backpressure():
+    fake = FakeStatus(delay=0)
+
+    with patch("mcstatus.bulk._java_status", fake):
+        results = status_many((f"server{i}" for i in range(1000)), concurrency=4)
+        await results.__anext__()
+        await asyncio.sleep(0.05)
+
+        # The results queue, the workers and the addresses queue are all full, nothing more gets started
+        assert len(fake.started) < 20
+        await results.aclose()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_stopping_cancels_requests():
+    fake = FakeStatus(delay=10)
+
+    async def consume():
+        async for _ in status_many([f"server{i}" for i in range(10)], concurrency=3):
+            pass
+
+    task = asyncio.ensure_future(consume())
+    with patch("mcstatus.bulk._java_status", fake):
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert fake.cancelled == 3
+    assert fake.running == 0
+
+
+@pytest.mark.asyncio
+async def test_failing_addresses_iterable():
+    def addresses():
+        yield "server"
+        raise RuntimeError("can't read any more addresses")
+
+    with patch("mcstatus.bulk._java_status", FakeStatus()):
+        with pytest.raises(RuntimeError):
+            _ = [result async for result in status_many(addresses())]
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        status_many([], concurrency=0)
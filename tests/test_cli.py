@@ -89,10 +89,12 @@ def patch_stdout_stderr():
 
 @pytest.fixture
 def mock_network_requests():
+    java_status = JavaStatusResponse.build(JAVA_RAW_RESPONSE)
     with \
         patch("mcstatus.server.JavaServer.lookup", return_value=JavaServer("example.com", port=25565)), \
         patch("mcstatus.server.JavaServer.ping", return_value=0), \
-        patch("mcstatus.server.JavaServer.status", return_value=JavaStatusResponse.build(JAVA_RAW_RESPONSE)), \
+        patch("mcstatus.server.JavaServer._status_and_try_ping", return_value=(java_status, 0)), \
+        patch("mcstatus.server.JavaServer.status", return_value=java_status), \
         patch("mcstatus.server.JavaServer.query", return_value=QueryResponse.build(*QUERY_RAW_RESPONSE)), \
         patch("mcstatus.server.BedrockServer.lookup", return_value=BedrockServer("example.com", port=25565)), \
         patch("mcstatus.server.BedrockServer.status", return_value=(
@@ -283,7 +285,8 @@ def test_ping_bedrock(mock_network_requests):
 
 
 def test_ping_server_doesnt_support(mock_network_requests):
-    with patch_stdout_stderr() as (out, err), patch("mcstatus.server.JavaServer.ping", side_effect=TimeoutError("timeout")):
+    ping = (JavaStatusResponse.build(JAVA_RAW_RESPONSE), TimeoutError("timeout"))
+    with patch_stdout_stderr() as (out, err), patch("mcstatus.server.JavaServer._status_and_try_ping", return_value=ping):
         assert main_under_test(["example.com", "ping"]) == 0
 
     assert float(out.getvalue()) == 0
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import dns.message
+import dns.name
+import dns.resolver
+import dns.rrset
+import pytest
+from dns.rdatatype import RdataType
+
+import mcstatus.dns
+from mcstatus.dns import (
+    DNSCache,
+    SRVTarget,
+    async_resolve_srv_record,
+    order_srv_targets,
+    resolve_aaaa_records,
+    resolve_a_record,
+    resolve_srv_record,
+    resolve_srv_records,
+)
+
+
+def make_answer(ttl: float = 60, target: str = "different.example.org.", port: int = 12345) -> MagicMock:
+    record = Mock()
+    record.target = target
+    record.port = port
+    answer = MagicMock()
+    answer.__getitem__.return_value = record
+    answer.__iter__.side_effect = lambda: iter([record])
+    answer.__len__.return_value = 1
+    answer.expiration = time.time() + ttl
+    return answer
+
+
+def make_nxdomain(name: str, soa_ttl: int = 3600, soa_minimum: int = 30) -> dns.resolver.NXDOMAIN:
+    response = dns.message.make_response(dns.message.make_query(name, RdataType.SRV))
+    response.authority.append(
+        dns.rrset.from_text("example.org.", soa_ttl, "IN", "SOA", f"ns. admin. 1 7200 3600 1209600 {soa_minimum}")
+    )
+    qname = dns.name.from_text(name)
+    return dns.resolver.NXDOMAIN(qnames=[qname], responses={qname: response})
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    mcstatus.dns.cache.clear()
+    yield
+    mcstatus.dns.cache.clear()
+
+
+class TestDNSCache:
+    def test_answer_is_cached(self):
+        with patch("dns.resolver.resolve") as resolve:
+            resolve.return_value = make_answer()
+
+            assert resolve_srv_record("_minecraft._tcp.example.org") == ("different.example.org", 12345)
+            assert resolve_srv_record("_minecraft._tcp.example.org") == ("different.example.org", 12345)
+
+        resolve.assert_called_once()
+        assert (mcstatus.dns.cache.hits, mcstatus.dns.cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_cache_is_shared_with_async(self):
+        with patch("dns.resolver.resolve") as resolve, patch("dns.asyncresolver.resolve") as async_resolve:
+            resolve.return_value = make_answer()
+
+            resolve_srv_record("_minecraft._tcp.example.org")
+            assert await async_resolve_srv_record("_minecraft._tcp.example.org") == ("different.example.org", 12345)
+
+        async_resolve.assert_not_called()
+
+    def test_expired_answer_is_not_used(self):
+        with patch("dns.resolver.resolve") as resolve:
+            resolve.return_value = make_answer(ttl=-1)
+
+            resolve_srv_record("_minecraft._tcp.example.org")
+            resolve_srv_record("_minecraft._tcp.example.org")
+
+        assert resolve.call_count == 2
+        assert mcstatus.dns.cache.hits == 0
+
+    def test_record_types_are_cached_separately(self):
+        with patch("dns.resolver.resolve") as resolve:
+            resolve.return_value = make_answer()
+            resolve_srv_record("example.org")
+            resolve.return_value[0].__str__ = Mock(return_value="1.2.3.4")
+            assert resolve_a_record("example.org") == "1.2.3.4"
+
+        assert resolve.call_count == 2
+
+    def test_negative_answer_is_cached(self):
+        exc = make_nxdomain("_minecraft._tcp.example.org.")
+        with patch("dns.resolver.resolve") as resolve:
+            resolve.side_effect = exc
+
+            for _ in range(2):
+                with pytest.raises(dns.resolver.NXDOMAIN):
+                    resolve_srv_record("_minecraft._tcp.example.org")
+
+        resolve.assert_called_once()
+        assert mcstatus.dns.cache.hits == 1
+
+    def test_negative_ttl_from_soa(self):
+        cache = DNSCache()
+        cache.put_negative("example.org", RdataType.SRV, make_nxdomain("example.org.", soa_ttl=3600, soa_minimum=30))
+
+        expiration, _ = cache._entries["example.org", RdataType.SRV]
+        assert expiration == pytest.approx(time.time() + 30, abs=1)
+
+    def test_negative_ttl_is_limited(self):
+        cache = DNSCache(max_negative_ttl=5)
+        cache.put_negative("example.org", RdataType.SRV, make_nxdomain("example.org.", soa_minimum=3600))
+
+        expiration, _ = cache._entries["example.org", RdataType.SRV]
+        assert expiration == pytest.approx(time.time() + 5, abs=1)
+
+    @pytest.mark.parametrize("exception", [dns.resolver.NXDOMAIN(), dns.resolver.NoAnswer()])
+    def test_negative_answer_without_soa_is_not_cached(self, exception):
+        cache = DNSCache()
+        cache.put_negative("example.org", RdataType.SRV, exception)
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = DNSCache(max_size=2)
+        cache.put("a", RdataType.A, make_answer())
+        cache.put("b", RdataType.A, make_answer())
+        cache.get("a", RdataType.A)
+        cache.put("c", RdataType.A, make_answer())
+
+        assert cache.get("a", RdataType.A) is not None
+        assert cache.get("b", RdataType.A) is None
+        assert cache.get("c", RdataType.A) is not None
+
+    def test_zero_size_disables_cache(self):
+        cache = DNSCache(max_size=0)
+        cache.put("a", RdataType.A, make_answer())
+
+        assert cache.get("a", RdataType.A) is None
+        assert cache.misses == 1
+
+
+class TestSRVTargetOrdering:
+    def test_lower_priority_comes_first(self):
+        targets = [SRVTarget("c", 1, 20, 0), SRVTarget("a", 1, 0, 0), SRVTarget("b", 1, 10, 0)]
+
+        assert [target.host for target in order_srv_targets(targets)] == ["a", "b", "c"]
+
+    def test_weight_decides_pick(self):
+        targets = [SRVTarget("light", 1, 0, 10), SRVTarget("heavy", 1, 0, 90)]
+
+        with patch("random.uniform", return_value=50):
+            assert [target.host for target in order_srv_targets(targets)] == ["heavy", "light"]
+        with patch("random.uniform", return_value=5):
+            assert [target.host for target in order_srv_targets(targets)] == ["light", "heavy"]
+
+    def test_all_records_are_resolved(self):
+        answer = MagicMock()
+        records = []
+        for target, priority in (("b.example.org.", 10), ("a.example.org.", 0)):
+            record = Mock(target=target, port=25565, priority=priority, weight=0)
+            records.append(record)
+        answer.__iter__.side_effect = lambda: iter(records)
+        answer.expiration = time.time() + 60
+
+        with patch("dns.resolver.resolve", return_value=answer):
+            assert resolve_srv_records("_minecraft._tcp.example.org") == [
+                SRVTarget("a.example.org", 25565, 0, 0),
+                SRVTarget("b.example.org", 25565, 10, 0),
+            ]
+
+    def test_single_record_is_the_first_one(self):
+        answer = MagicMock()
+        records = [
+            Mock(target=target, port=25565, priority=priority, weight=0) for target, priority in (("b.", 10), ("a.", 0))
+        ]
+        answer.__getitem__.side_effect = records.__getitem__
+        answer.expiration = time.time() + 60
+
+        with patch("dns.resolver.resolve", return_value=answer), patch("random.uniform") as uniform:
+            assert resolve_srv_record("_minecraft._tcp.example.org") == ("b", 25565)
+
+        uniform.assert_not_called()
+
+
+def test_aaaa_records_are_resolved():
+    answer = MagicMock()
+    records = [Mock(__str__=Mock(return_value="2001:db8::1")), Mock(__str__=Mock(return_value="2001:db8::2"))]
+    answer.__iter__.side_effect = lambda: iter(records)
+    answer.expiration = time.time() + 60
+
+    with patch("dns.resolver.resolve", return_value=answer) as resolve:
+        assert resolve_aaaa_records("example.org") == ["2001:db8::1", "2001:db8::2"]
+
+    assert resolve.call_args.args[:2] == ("example.org", RdataType.AAAA)
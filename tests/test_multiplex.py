@@ -0,0 +1,194 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from mcstatus.address import Address
+from mcstatus.multiplex import BedrockScanner, QueryEngine
+
+FULL_STAT_PAYLOAD = bytes.fromhex(
+    "0000000000000000000000686f73746e616d650041204d696e656372616674205365727665720067616d6574797"
+    "06500534d500067616d655f6964004d494e4543524146540076657273696f6e00312e3800706c7567696e7300006d61700077"
+    "6f726c64006e756d706c61796572730033006d6178706c617965727300323000686f7374706f727400323535363500686f737"
+    "46970003139322e3136382e35362e31000001706c617965725f000044696e6e6572626f6e6500446a696e6e69626f6e650053"
+    "746576650000"
+)
+
+
+class FakeQueryResponder(asyncio.DatagramProtocol):
+    """Stand-in for a server answering to the query protocol."""
+
+    transport: asyncio.DatagramTransport
+
+    def __init__(self, drop_first: int = 0):
+        self.drop_first = drop_first
+        self.received = 0
+
+    def connection_made(self, transport):  # pyright: ignore[reportIncompatibleMethodOverride]
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.received += 1
+        if self.received <= self.drop_first:
+            return
+
+        packet_type, session_id = data[2:3], data[3:7]
+        if packet_type == b"\x09":
+            self.transport.sendto(packet_type + session_id + b"9513307\x00", addr)
+        else:
+            self.transport.sendto(packet_type + session_id + FULL_STAT_PAYLOAD, addr)
+
+
+class FakeBedrockResponder(FakeQueryResponder):
+    """Stand-in for a Bedrock server answering to unconnected pings."""
+
+    def datagram_received(self, data, addr):
+        self.received += 1
+        if self.received <= self.drop_first:
+            return
+
+        timestamp, server_guid, magic = data[1:9], bytes(8), data[9:25]
+        self.transport.sendto(b"\x1c" + timestamp + server_guid + magic + len(MOTD).to_bytes(2, "big") + MOTD, addr)
+
+
+MOTD = b"MCPE;Dedicated Server;390;1.14.60;3;10;13253860892328930865;Bedrock level;Survival;1;19132;19133;"
+
+
+@pytest_asyncio.fixture()
+async def create_responder():
+    transports = []
+
+    async def create(responder=FakeQueryResponder, **kwargs):
+        transport, protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: responder(**kwargs),
+            local_addr=("127.0.0.1", 0),
+        )
+        transports.append(transport)
+        return Address("127.0.0.1", transport.get_extra_info("sockname")[1]), protocol
+
+    yield create
+
+    for transport in transports:
+        transport.close()
+
+
+class TestQueryEngine:
+    @pytest.mark.asyncio
+    async def test_query(self, create_responder):
+        address, _ = await create_responder()
+
+        async with QueryEngine(timeout=1) as engine:
+            response = await engine.query(address)
+
+        assert response.raw["hostname"] == "A Minecraft Server"
+        assert response.players.list == ["Dinnerbone", "Djinnibone", "Steve"]
+
+    @pytest.mark.asyncio
+    async def test_query_many_shares_socket(self, create_responder):
+        addresses = [(await create_responder())[0] for _ in range(10)]
+
+        async with QueryEngine(timeout=1) as engine:
+            results = [result async for result in engine.query_many(addresses)]
+            assert len(engine._transports) == 1
+
+        assert sorted(address for address, _ in results) == sorted(addresses)
+        for _, response in results:
+            assert not isinstance(response, Exception)
+            assert response.players.online == 3
+
+    @pytest.mark.asyncio
+    async def test_query_retransmits(self, create_responder):
+        address, responder = await create_responder(drop_first=1)
+
+        async with QueryEngine(timeout=0.1, retransmits=1) as engine:
+            response = await engine.query(address)
+
+        assert response.players.online == 3
+        assert responder.received == 3
+
+    @pytest.mark.asyncio
+    async def test_query_timeout(self, create_responder):
+        address, responder = await create_responder(drop_first=10)
+
+        async with QueryEngine(timeout=0.05, retransmits=2) as engine:
+            with pytest.raises(asyncio.TimeoutError):
+                await engine.query(address)
+
+        assert responder.received == 3
+
+    @pytest.mark.asyncio
+    async def test_query_many_reports_exceptions(self, create_responder):
+        good, _ = await create_responder()
+        bad, _ = await create_responder(drop_first=10)
+
+        async with QueryEngine(timeout=0.05, retransmits=0) as engine:
+            results = dict([result async for result in engine.query_many([good, bad])])
+
+        assert results[good].players.online == 3  # type: ignore[union-attr]
+        assert isinstance(results[bad], asyncio.TimeoutError)
+
+
+class TestBedrockScanner:
+    @pytest.mark.asyncio
+    async def test_status(self, create_responder):
+        address, _ = await create_responder(FakeBedrockResponder)
+
+        async with BedrockScanner(timeout=1) as scanner:
+            response = await scanner.status(address)
+
+        assert response.version.name == "1.14.60"
+        assert response.players.online == 3
+        assert response.map_name == "Bedrock level"
+        assert response.latency >= 0
+
+    @pytest.mark.asyncio
+    async def test_status_many_shares_socket(self, create_responder):
+        addresses = [(await create_responder(FakeBedrockResponder))[0] for _ in range(10)]
+
+        async with BedrockScanner(timeout=1) as scanner:
+            results = [result async for result in scanner.status_many(addresses)]
+            assert len(scanner._transports) == 1
+
+        assert sorted(address for address, _ in results) == sorted(addresses)
+        for _, response in results:
+            assert not isinstance(response, Exception)
+            assert response.players.max == 10
+
+    @pytest.mark.asyncio
+    async def test_status_retransmits(self, create_responder):
+        address, responder = await create_responder(FakeBedrockResponder, drop_first=1)
+
+        async with BedrockScanner(timeout=0.1, retransmits=1) as scanner:
+            response = await scanner.status(address)
+
+        assert response.players.online == 3
+        assert responder.received == 2
+
+    @pytest.mark.asyncio
+    async def test_status_timeout(self, create_responder):
+        address, responder = await create_responder(FakeBedrockResponder, drop_first=10)
+
+        async with BedrockScanner(timeout=0.05, retransmits=1) as scanner:
+            with pytest.raises(asyncio.TimeoutError):
+                await scanner.status(address)
+
+        assert responder.received == 2
+        assert scanner._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_status_many_takes_addresses_lazily(self, create_responder):
+        address, _ = await create_responder(FakeBedrockResponder)
+        taken = 0
+
+        def addresses():
+            nonlocal taken
+            for _ in range(100):
+                taken += 1
+                yield address
+
+        async with BedrockScanner(timeout=1, max_in_flight=2) as scanner:
+            results = scanner.status_many(addresses())
+            await results.__anext__()
+            # The workers, the queued addresses and the queued results, but not the whole sweep
+            assert taken < 10
+            await results.aclose()
@@ -1,3 +1,4 @@
+import json
 import sys
 import time
 from unittest import mock
@@ -5,8 +6,10 @@ from unittest import mock
 import pytest
 
 from mcstatus.address import Address
-from mcstatus.pinger import ServerPinger
+from mcstatus.motd import Motd, MotdLimitError
+from mcstatus.pinger import ServerPinger, _default_json_decoder, _encode_handshake, _stdlib_json_decoder
 from mcstatus.protocol.connection import Connection
+from mcstatus.responses import JavaStatusResponse
 
 
 class TestServerPinger:
@@ -22,6 +25,31 @@ class TestServerPinger:
 
         assert self.pinger.connection.flush() == bytearray.fromhex("0F002C096C6F63616C686F737463DD01")
 
+    def test_handshake_is_cached(self):
+        _encode_handshake.cache_clear()
+        self.pinger.handshake()
+        self.pinger.handshake()
+
+        assert _encode_handshake.cache_info().hits == 1
+        assert self.pinger.connection.flush() == bytearray.fromhex("0F002C096C6F63616C686F737463DD01" * 2)
+
+    def test_handshake_deferred(self):
+        self.pinger.handshake(defer=True)
+
+        assert self.pinger.connection.flush() == bytearray()
+
+    def test_deferred_handshake_sent_with_request(self):
+        self.pinger.connection = mock.Mock(wraps=self.pinger.connection)
+        self.pinger.connection.receive(bytearray.fromhex("09010000000001C54246"))
+        self.pinger.ping_token = 29704774
+
+        self.pinger.handshake(defer=True)
+        self.pinger.test_ping()
+
+        self.pinger.connection.write.assert_called_once_with(
+            bytearray.fromhex("0F002C096C6F63616C686F737463DD0109010000000001C54246")
+        )
+
     def test_read_status(self):
         self.pinger.connection.receive(
             bytearray.fromhex(
@@ -44,6 +72,36 @@ class TestServerPinger:
         with pytest.raises(IOError):
             self.pinger.read_status()
 
+    @pytest.mark.parametrize("decoder", [_stdlib_json_decoder, _default_json_decoder()])
+    def test_read_status_with_decoder(self, decoder):
+        self.pinger.connection.receive(bytearray.fromhex("1A00187B226465736372697074696F6E223A22C3A4C3B6C3BC227D"))
+
+        with mock.patch("mcstatus.pinger.json_decoder", decoder), mock.patch.object(JavaStatusResponse, "build") as build:
+            self.pinger.read_status()
+
+        assert build.call_args.args[0] == {"description": "äöü"}
+
+    @pytest.mark.parametrize("decoder", [_stdlib_json_decoder, _default_json_decoder()])
+    def test_read_status_invalid_utf8(self, decoder):
+        self.pinger.connection.receive(bytearray.fromhex("0500037B22FF"))
+
+        with mock.patch("mcstatus.pinger.json_decoder", decoder), pytest.raises(IOError):
+            self.pinger.read_status()
+
+    def test_read_status_custom_decoder(self):
+        self.pinger.connection.receive(bytearray.fromhex("0300017B"))
+        decoded = []
+
+        def decoder(data):
+            decoded.append(bytes(data))
+            return {"players": {"max": 20, "online": 0}, "version": {"name": "1.8", "protocol": 47}}
+
+        with mock.patch("mcstatus.pinger.json_decoder", decoder):
+            status = self.pinger.read_status()
+
+        assert decoded == [b"{"]
+        assert status.players.online == 0
+
     def test_read_status_invalid_reply(self):
         self.pinger.connection.receive(
             # no motd, see also #922
@@ -61,6 +119,23 @@ class TestServerPinger:
         with pytest.raises(IOError):
             self.pinger.read_status()
 
+    def test_read_status_too_deep_motd(self):
+        description = {"text": "deepest"}
+        for _ in range(Motd.MAX_DEPTH + 1):
+            description = {"text": "", "extra": [description]}
+        packet = Connection()
+        packet.write_varint(0)
+        packet.write_utf(
+            json.dumps(
+                {"description": description, "players": {"max": 20, "online": 0}, "version": {"name": "1.8", "protocol": 47}}
+            )
+        )
+        self.pinger.connection.write_buffer(packet)
+        self.pinger.connection.receive(self.pinger.connection.flush())
+
+        with pytest.raises(MotdLimitError):
+            self.pinger.read_status()
+
     def test_test_ping(self):
         self.pinger.connection.receive(bytearray.fromhex("09010000000000DD7D1C"))
         self.pinger.ping_token = 14515484
@@ -93,13 +168,13 @@ class TestServerPinger:
         with mock.patch.object(Connection, "read_buffer") as mocked:
             mocked.side_effect = mocked_read_buffer
             mocked.return_value.read_varint.return_value = 0
-            mocked.return_value.read_utf.return_value = """
+            mocked.return_value.read_utf_view.return_value = memoryview(b"""
             {
                 "description": "A Minecraft Server",
                 "players": {"max": 20, "online": 0},
                 "version": {"name": "1.8-pre1", "protocol": 44}
             }
-            """
+            """)
             pinger = ServerPinger(
                 Connection(),  # type: ignore[arg-type]
                 address=Address("localhost", 25565),
@@ -1,6 +1,13 @@
+import contextvars
+import errno
+import socket
+from unittest.mock import patch
+
+import dns.resolver
 import pytest
 
-from mcstatus.utils import retry
+from mcstatus.motd import MotdLimitError
+from mcstatus.utils import RetryBudget, _RetryContext, _retry_context, is_connect_retryable, is_retryable, retry
 from tests.test_async_pinger import async_decorator
 
 
@@ -64,3 +71,127 @@ def test_async_fail():
     # We should get the last exception on failure (not OSError)
     with pytest.raises(RuntimeError):
         async_decorator(func)()
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        ConnectionRefusedError(),
+        OSError(errno.EHOSTUNREACH, "No route to host"),
+        OSError(errno.ENETUNREACH, "Network is unreachable"),
+        socket.gaierror(socket.EAI_NONAME, "Name or service not known"),
+        dns.resolver.NXDOMAIN(),
+        MotdLimitError("MOTD has more than 65536 components"),
+    ],
+)
+def test_fails_fast_on_not_retryable(exception):
+    calls = 0
+
+    @retry(tries=3)
+    def func():
+        nonlocal calls
+        calls += 1
+        raise exception
+
+    with pytest.raises(type(exception)):
+        func()
+    assert calls == 1
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        TimeoutError(),
+        ConnectionResetError(),
+        OSError("Server did not respond"),
+        socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution"),
+    ],
+)
+def test_is_retryable(exception):
+    assert is_retryable(exception)
+
+
+@pytest.mark.parametrize(
+    ("exception", "expected"),
+    [
+        (ConnectionResetError(), True),
+        (ConnectionAbortedError(), True),
+        (socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution"), True),
+        (TimeoutError(), False),
+        (ConnectionRefusedError(), False),
+        (socket.gaierror(socket.EAI_NONAME, "Name or service not known"), False),
+    ],
+)
+def test_is_connect_retryable(exception, expected):
+    assert is_connect_retryable(exception) is expected
+
+
+def test_backoff_by_default():
+    sleeps = []
+
+    @retry(tries=2)
+    def func():
+        raise TimeoutError
+
+    with patch("mcstatus.utils.time.sleep", sleeps.append), patch("mcstatus.utils.random.uniform") as uniform:
+        uniform.side_effect = lambda low, high: high
+        with pytest.raises(TimeoutError):
+            func()
+
+    assert sleeps == [0.1]
+
+
+def test_backoff():
+    sleeps = []
+
+    @retry(tries=4, delay=0.1, max_delay=0.3)
+    def func():
+        raise TimeoutError
+
+    with patch("mcstatus.utils.time.sleep", sleeps.append), patch("mcstatus.utils.random.uniform") as uniform:
+        uniform.side_effect = lambda low, high: high
+        with pytest.raises(TimeoutError):
+            func()
+
+    assert sleeps == [0.1, 0.2, 0.3]
+
+
+def test_retry_budget():
+    budget = RetryBudget(retries=1)
+    calls = 0
+
+    @retry(tries=3)
+    def func():
+        nonlocal calls
+        calls += 1
+        raise TimeoutError
+
+    def run():
+        _retry_context.set(_RetryContext(budget))
+        with pytest.raises(TimeoutError):
+            func()
+
+    contextvars.copy_context().run(run)
+    contextvars.copy_context().run(run)
+
+    # The first call uses up the only retry, the second one can't retry anymore
+    assert calls == 3
+    assert budget.retries == 0
+
+
+def test_retries_are_recorded():
+    context = _RetryContext()
+    x = -1
+
+    @retry(tries=3)
+    def func():
+        nonlocal x
+        x += 1
+        return 5 / x
+
+    def run():
+        _retry_context.set(context)
+        func()
+
+    contextvars.copy_context().run(run)
+    assert context.retries == 1
@@ -1,8 +1,15 @@
 import asyncio
-from unittest.mock import call, patch
+import ipaddress
+import time
+from typing import cast
+from unittest.mock import MagicMock, call, patch
 
+import dns.resolver
 import pytest
 import pytest_asyncio
+from dns.rdatatype import RdataType
+
+import mcstatus.dns
 
 from mcstatus.protocol.connection import Connection
 from mcstatus.address import Address
@@ -85,6 +92,77 @@ class TestAsyncJavaServer:
         latency = await minecraft_server.async_ping(ping_token=29704774, version=47)
         assert latency >= 0
 
+    @pytest.mark.asyncio
+    async def test_async_status_budget(self, unused_tcp_port, create_mock_packet_server):
+        # A slow server, which sends an incomplete response and then nothing more
+        await create_mock_packet_server(
+            port=unused_tcp_port,
+            data_expected_to_receive=bytearray.fromhex("0100"),
+            data_to_respond_with=bytearray.fromhex("7200707B"),
+        )
+        minecraft_server = JavaServer("localhost", port=unused_tcp_port, timeout=5)
+
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await minecraft_server.async_status(budget=0.2)
+        assert time.perf_counter() - start < 1
+
+    @pytest.mark.asyncio
+    async def test_async_status_and_ping_falls_back_to_status_latency(self, unused_tcp_port, create_mock_packet_server):
+        status = bytearray.fromhex(
+            "6D006B7B226465736372697074696F6E223A2241204D696E65637261667420536572766572222C22706C6179657273223A7B2"
+            "26D6178223A32302C226F6E6C696E65223A307D2C2276657273696F6E223A7B226E616D65223A22312E38222C2270726F746F"
+            "636F6C223A34377D7D"
+        )
+        # Only the status is answered, there's never a response to the ping
+        await create_mock_packet_server(port=unused_tcp_port, data_expected_to_receive=b"", data_to_respond_with=status)
+        minecraft_server = JavaServer("localhost", port=unused_tcp_port, timeout=0.5)
+
+        info, latency = await minecraft_server.async_status_and_ping(ping_token=29704774, version=47)
+        assert info.raw["description"] == "A Minecraft Server"
+        assert latency == info.latency
+
+    @pytest.mark.asyncio
+    async def test_async_status_and_ping(self, unused_tcp_port, create_mock_packet_server):
+        status = bytearray.fromhex(
+            "6D006B7B226465736372697074696F6E223A2241204D696E65637261667420536572766572222C22706C6179657273223A7B2"
+            "26D6178223A32302C226F6E6C696E65223A307D2C2276657273696F6E223A7B226E616D65223A22312E38222C2270726F746F"
+            "636F6C223A34377D7D"
+        )
+        await create_mock_packet_server(
+            port=unused_tcp_port,
+            data_expected_to_receive=b"",
+            data_to_respond_with=status + bytearray.fromhex("09010000000001C54246"),
+        )
+        minecraft_server = JavaServer("localhost", port=unused_tcp_port)
+
+        info, latency = await minecraft_server.async_status_and_ping(ping_token=29704774, version=47)
+        assert info.raw["description"] == "A Minecraft Server"
+        assert latency >= 0
+
+    @pytest.mark.asyncio
+    async def test_async_lookup_keeps_resolved_ip(self):
+        address_queries = []
+
+        async def resolve(name, rdtype, **kwargs):
+            if rdtype == RdataType.SRV:
+                raise dns.resolver.NXDOMAIN
+            address_queries.append((name, rdtype))
+            if rdtype == RdataType.AAAA:
+                raise dns.resolver.NoAnswer
+            answer = MagicMock()
+            cast(MagicMock, answer.__str__).return_value = "48.225.1.104"
+            return [answer]
+
+        mcstatus.dns.cache.clear()
+        with patch("dns.asyncresolver.resolve", side_effect=resolve):
+            server = await JavaServer.async_lookup("example.org")
+            assert await server.address.async_resolve_ip() == ipaddress.ip_address("48.225.1.104")
+        mcstatus.dns.cache.clear()
+
+        assert server.address._cached_ip == ipaddress.ip_address("48.225.1.104")
+        assert sorted(address_queries) == [("example.org", RdataType.A), ("example.org", RdataType.AAAA)]
+
     @pytest.mark.asyncio
     async def test_async_lookup_constructor(self):
         s = await JavaServer.async_lookup("example.org:3333")
@@ -136,6 +214,27 @@ class TestJavaServer:
                 self.server.ping()
             assert pinger.call_count == 3
 
+    def test_connect_retry(self):
+        with patch("mcstatus.server.TCPSocketConnection") as connection:
+            connection.side_effect = ConnectionResetError
+            with pytest.raises(ConnectionResetError):
+                self.server.ping()
+            assert connection.call_count == 3
+
+    def test_connect_timeout_is_not_retried(self):
+        with patch("mcstatus.server.TCPSocketConnection") as connection:
+            connection.side_effect = TimeoutError
+            with pytest.raises(TimeoutError):
+                self.server.ping()
+            assert connection.call_count == 1
+
+    def test_refused_connect_is_not_retried(self):
+        with patch("mcstatus.server.TCPSocketConnection") as connection:
+            connection.side_effect = ConnectionRefusedError
+            with pytest.raises(ConnectionRefusedError):
+                self.server.status()
+            assert connection.call_count == 1
+
     def test_status(self):
         self.socket.receive(
             bytearray.fromhex(
@@ -166,6 +265,55 @@ class TestJavaServer:
                 self.server.status()
             assert pinger.call_count == 3
 
+    def test_status_and_ping(self):
+        self.socket.receive(
+            bytearray.fromhex(
+                "6D006B7B226465736372697074696F6E223A2241204D696E65637261667420536572766572222C22706C6179657273223A7B2"
+                "26D6178223A32302C226F6E6C696E65223A307D2C2276657273696F6E223A7B226E616D65223A22312E38222C2270726F746F"
+                "636F6C223A34377D7D"
+            )
+        )
+        self.socket.receive(bytearray.fromhex("09010000000001C54246"))
+
+        with patch("mcstatus.server.TCPSocketConnection") as connection:
+            connection.return_value.__enter__.return_value = self.socket
+            info, latency = self.server.status_and_ping(ping_token=29704774, version=47)
+
+        connection.assert_called_once()
+        # A single handshake, followed by the status request and the ping request
+        assert self.socket.flush() == bytearray.fromhex("0F002F096C6F63616C686F737463DD01010009010000000001C54246")
+        assert self.socket.remaining() == 0, "Data is pending to be read, but should be empty"
+        assert info.raw["description"] == "A Minecraft Server"
+        assert latency >= 0
+
+    def test_status_and_ping_is_not_handshaken_twice(self):
+        # Use a blank mock for the connection, we don't want to actually create any connections
+        with patch("mcstatus.server.TCPSocketConnection"), patch("mcstatus.server.ServerPinger") as pinger:
+            pinger.return_value.read_status.side_effect = TimeoutError
+            with pytest.raises(TimeoutError):
+                self.server.status_and_ping()
+            pinger.return_value.handshake.assert_called_once()
+
+    def test_status_and_ping_falls_back_to_status_latency(self):
+        self.socket.receive(
+            bytearray.fromhex(
+                "6D006B7B226465736372697074696F6E223A2241204D696E65637261667420536572766572222C22706C6179657273223A7B2"
+                "26D6178223A32302C226F6E6C696E65223A307D2C2276657273696F6E223A7B226E616D65223A22312E38222C2270726F746F"
+                "636F6C223A34377D7D"
+            )
+        )
+        # No response to the ping, like the servers closing the connection right after the status
+
+        with patch("mcstatus.server.TCPSocketConnection") as connection:
+            connection.return_value.__enter__.return_value = self.socket
+            info, latency = self.server.status_and_ping(ping_token=29704774, version=47)
+
+        connection.assert_called_once()
+        # Still a single handshake, the status request isn't repeated
+        assert self.socket.flush() == bytearray.fromhex("0F002F096C6F63616C686F737463DD01010009010000000001C54246")
+        assert info.raw["description"] == "A Minecraft Server"
+        assert latency == info.latency
+
     def test_query(self):
         self.socket.receive(bytearray.fromhex("090000000035373033353037373800"))
         self.socket.receive(
@@ -0,0 +1,83 @@
+import json
+import socketserver
+import threading
+
+import pytest
+
+from mcstatus.bulk import ShardedScanner
+from mcstatus.protocol.connection import Connection
+
+STATUS = {
+    "description": "A Minecraft Server",
+    "players": {"max": 20, "online": 5},
+    "version": {"name": "1.8", "protocol": 47},
+}
+
+
+class FakeStatusHandler(socketserver.BaseRequestHandler):
+    """Stand-in for a Java server, answering the status request."""
+
+    def handle(self):
+        received = b""
+        while not received.endswith(b"\x01\x00"):  # status request
+            data = self.request.recv(1024)
+            if not data:
+                return
+            received += data
+
+        packet = Connection()
+        packet.write_varint(0)
+        packet.write_utf(json.dumps(STATUS))
+        response = Connection()
+        response.write_buffer(packet)
+        self.request.sendall(response.flush())
+
+
+@pytest.fixture(scope="module")
+def fake_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeStatusHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_scan(fake_server):
+    addresses = [fake_server] * 20
+
+    with ShardedScanner(addresses, processes=2, concurrency=4, timeout=2) as scanner:
+        results = list(scanner)
+
+    assert len(results) == 20
+    for address, result in results:
+        assert address == fake_server
+        assert not isinstance(result, Exception)
+        assert result.players.online == 5
+
+
+def test_progress(fake_server):
+    addresses = [fake_server] * 5
+
+    with ShardedScanner(addresses, processes=2, timeout=2) as scanner:
+        list(scanner)
+
+    assert [shard.total for shard in scanner.progress] == [3, 2]
+    assert [shard.done for shard in scanner.progress] == [3, 2]
+    assert all(shard.finished for shard in scanner.progress)
+
+
+def test_exceptions_are_yielded(fake_server):
+    with ShardedScanner([fake_server, "127.0.0.1:1"], processes=2, timeout=2) as scanner:
+        results = dict(scanner)
+
+    assert not isinstance(results[fake_server], Exception)
+    assert isinstance(results["127.0.0.1:1"], ConnectionRefusedError)
+
+
+def test_processes_capped_by_addresses(fake_server):
+    scanner = ShardedScanner([fake_server], processes=8)
+
+    assert len(scanner.progress) == 1
+    scanner.close()